@@ -13,14 +13,23 @@ Date:
     July, 2023.
 
 Last Modification:
-    October, 2023.
+    October, 2026.
 """
 
 import numpy as np
 import Scripts.Gammas as Gammas
 import Scripts.Neighbors as Neighbors
+import Scripts.Reorder as Reorder
+import Scripts.Stencil as Stencil
+import Scripts.Decomposition as Decomposition
+import Scripts.Checkpoint as Checkpoint
+import Scripts.Stability as Stability
+import Scripts.Planner as Planner
+import Scripts.Fields as Fields
+import Scripts.Splitting as Splitting
+import Scripts.Options as Options
 
-def Cloud(p, f, v, a, b, t, triangulation = False, tt = [], implicit = False, lam = 0.5):
+def Cloud(p, f, v, a, b, t, triangulation = False, tt = [], implicit = False, lam = 0.5, geometry = None, options = None, **kwargs):
     """
     2D Diffusion Equation implemented on Unstructured Clouds of Points.
     
@@ -28,13 +37,19 @@ def Cloud(p, f, v, a, b, t, triangulation = False, tt = [], implicit = False, la
     
     The problem to solve is:
     
-    \frac{\partial u}{\partial t}= v\nabla^2 u
+    \frac{\partial u}{\partial t}= v\nabla^2 u - a\frac{\partial u}{\partial x} - b\frac{\partial u}{\partial y}
     
     Input:
         p               ndarray         Array with the coordinates of the nodes and the flag for boundary or inner node.
-        f               Function        Function declared with the boundary condition.
+        f               Function        Function declared with the boundary condition, f(x, y, t, v, a, b) (the coefficients are given on the same nodes).
         v               Real            Diffusion coefficient.
+                                            Real:     The same value on all the nodes (Default).
+                                            ndarray:  One value for each node.
+                                            Function: v(x, y, t), varying in space and time.
+        a               Real            Transport velocity on the x direction (as v).
+        b               Real            Transport velocity on the y direction (as v).
         t               Integer         Number of time steps to be considered.
+                                            'auto': The largest stable time step of the scheme is estimated from the spectrum of the operator (Scripts/Stability.py).
         triangulation   Logical         Select whether or not there is a triangulation available.
                                             True: Triangulation available.
                                             False: No triangulation available (Default)
@@ -44,52 +59,239 @@ def Cloud(p, f, v, a, b, t, triangulation = False, tt = [], implicit = False, la
                                             False: Explicit scheme used (Default).
         lam             Real            Lambda parameter for the implicit scheme.
                                             Must be between 0 and 1 (Default: 0.5).
+        geometry        dict            Geometry of the cloud computed beforehand, to be shared by several problems (Default: None).
+                                            'vec': Neighbors of each node, padded array or Neighbors.NeighborGraph (replaces the neighbor search).
+                                            'D':   Derivative stencils from Gammas.Derivatives (optional, replaces the least-squares problems).
+                                        Both are given in the original ordering of the nodes.
+        options         Options         How the problem is computed: engine, precision, node reordering, checkpoints, streaming, probes, etc. (see Scripts/Options.py).
+                                            Default: None, the full m x m propagator in float64 with the solution on all the nodes in RAM.
+        **kwargs                        Fields of Options given by name (for example, engine = 'ellpack'); they take precedence over 'options'.
     
     Output:
-        u_ap        m x 1           Array           Array with the approximation computed by the routine.
-        u_ex        m x 1           Array           Array with the theoretical solution.
+        u_ap        m x t           Array           Array with the approximation computed by the routine (n x t at the probes).
+        u_ex        m x t           Array           Array with the theoretical solution (n x t at the probes).
         vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
     """
 
+    # Options
+    options = Options.Build(options, **kwargs)                                      # How the problem is computed.
+    dtype   = options.dtype                                                         # Precision for the storage.
+    acc     = options.accumulate                                                    # Precision for the accumulation.
+
     # Variable initialization
-    m    = len(p[:, 0])                                                             # The total number of nodes is calculated.
-    nvec = 8                                                                        # Maximum number of neighbors for each node.
+    m       = len(p[:, 0])                                                          # The total number of nodes is calculated.
+    nvec    = 8                                                                     # Maximum number of neighbors for each node.
+    coef    = (v, a, b)                                                             # Coefficients in the original ordering.
+    varying = Fields.Varying(v, a, b)                                               # Coefficients that change in time.
+
+    # Operator splitting.
+    if options.splitting is not None:                                               # Semi-Lagrangian advection and GFD diffusion.
+        if isinstance(t, str):
+            raise ValueError('The splitting scheme needs the number of time steps.')
+        if options.changed() != ['splitting']:                                      # Options of the GFD engines.
+            raise ValueError(f"The splitting scheme does not support: {', '.join(k for k in options.changed() if k != 'splitting')}.")
+        return Splitting.Cloud(p, f, v, a, b, t, triangulation, tt, implicit, lam, geometry, interpolation = options.splitting)
+
+    # Automatic time step.
+    if isinstance(t, str):                                                          # If the number of time steps is not given.
+        if t != 'auto':
+            raise ValueError(f'Unknown number of time steps: {t}')
+        if geometry is None:                                                        # The geometry is computed here and used below.
+            vec      = Neighbors.Triangulation(p, tt, nvec) if triangulation == True else Neighbors.Cloud(p, nvec)
+            geometry = {'vec': vec, 'D': Gammas.Derivatives(p, vec)}
+        t = Stability.Steps(p, geometry['vec'], v, a, b, implicit, lam, D = geometry.get('D'))
+                                                                                    # Largest stable time step.
+
+    # Execution plan.
+    if options.engine == 'auto':                                                    # If the engine is not given.
+        plan    = Planner.Plan(m, t, nvec, implicit = implicit, precision = options.precision, engines = ['ellpack', 'sparse'] if varying else None)
+        options = Options.Build(options, engine = plan['engine'], stream = options.stream or plan['stream'])
+                                                                                    # Engine chosen by the planner, and solutions on disk?
+    options.check(implicit, varying)                                                # Combinations that the engine does not support.
+
     T    = np.linspace(0, 1, t)                                                     # Time discretization.
     dt   = T[1] - T[0]                                                              # dt computation.
-    u_ap = np.zeros([m, t])                                                         # u_ap initialization with zeros.
-    u_ex = np.zeros([m, t])                                                         # u_ex initialization with zeros.
+    p0   = p                                                                        # Nodes in the original ordering.
+    tc   = (1 - lam)*dt if implicit else 0                                          # Time of the coefficients within each step.
+
+    # Checkpoint and restart.
+    saved = None                                                                    # Latest checkpoint of the problem.
+    if options.checkpoint is not None:                                              # If checkpoints are requested.
+        params = dict(v = v, a = a, b = b, t = t, triangulation = triangulation, implicit = implicit, lam = lam,
+                      reorder = options.reorder, engine = options.engine, precision = options.precision, interior = options.interior, refresh = options.refresh)
+        key    = Checkpoint.Key(p, tt, f, **params)                                 # Operator cache key.
+        if options.restart == True:                                                 # If a restart is requested.
+            saved = Checkpoint.Load(options.checkpoint, key)                        # Look for the latest checkpoint.
+
+    D = None                                                                        # Derivative stencils.
+    if saved is None:                                                               # For a new run.
+        # Neighbor search for all the nodes.
+        if geometry is not None:                                                    # If the geometry was computed beforehand.
+            vec = geometry['vec']                                                   # Neighbors from the geometry.
+            D   = geometry.get('D')                                                 # Derivative stencils from the geometry.
+            if D is None and options.engine != 'dense' and isinstance(vec, Neighbors.NeighborGraph):
+                D = Gammas.Derivatives(p, vec)                                      # Stencils with the neighbors of each node.
+            vec = Neighbors.Padded(vec, None if D is None else D.shape[1])          # Padded array, as wide as the stencils.
+        elif triangulation == True:                                                 # If there are triangles available.
+            vec = Neighbors.Triangulation(p, tt, nvec)                              # Neighbor search with the proper routine.
+        else:                                                                       # If there are no triangles available.
+            vec = Neighbors.Cloud(p, nvec)                                          # Neighbor search with the proper routine.
+
+        # Node reordering.
+        perm = None                                                                 # No reordering.
+        if options.reorder is not None:                                             # If a reordering is requested.
+            perm       = Reorder.Permutation(p, vec, mode = options.reorder)        # Find the new ordering of the nodes.
+            p, tt, vec = Reorder.Apply(p, tt, vec, perm)                            # Renumber nodes, triangles and neighbors.
+            if D is not None:
+                D = D[perm]                                                         # Reorder the derivative stencils.
+    else:                                                                           # For a restart.
+        vec, perm = saved['vec'], saved['perm']                                     # Neighbors and ordering from the checkpoint.
+        if perm is not None:
+            p = p[perm]                                                             # Reorder the nodes.
+    if perm is not None:
+        v, a, b = (Fields.Permute(c, perm) for c in coef)                           # Reorder the coefficients given on the nodes.
+
     boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
     inne_n = p[:, 2] == 0                                                           # Save the inner nodes.
-    
-    # Boundary conditions.
-    for k in np.arange(t):                                                          # For each time step.
-        u_ap[boun_n, k] = f(p[boun_n, 0], p[boun_n, 1], T[k], v, a, b)              # The boundary condition is assigned.
-  
-    # Initial condition
-    u_ap[:, 0] = f(p[:, 0], p[:, 1], T[0], v, a, b)                                 # The initial condition is assigned.
-    
-    # Neighbor search for all the nodes.
-    if triangulation == True:                                                       # If there are triangles available.
-        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
-    else:                                                                           # If there are no triangles available.
-        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
 
-    # Computation of Gamma values
-    L = np.vstack([[-a], [-b], [2*v], [0], [2*v]])                                  # The values of the differential operator are assigned.
-    K = dt*Gammas.Cloud(p, vec, L)                                                  # K computation with the required Gammas.
+    if options.probes is None:                                                      # For the solution on all the nodes.
+        u_ap = Planner.History(m, t, dtype, options.stream, None if perm is not None else options.history, 'u_ap')
+                                                                                    # u_ap initialization with zeros.
+
+        # Boundary conditions.
+        for k in np.arange(t):                                                      # For each time step.
+            u_ap[boun_n, k] = f(p[boun_n, 0], p[boun_n, 1], T[k], *Fields.Values(p, T[k], v, a, b, boun_n))
+                                                                                    # The boundary condition is assigned.
+
+        # Initial condition
+        u_ap[:, 0] = f(p[:, 0], p[:, 1], T[0], *Fields.Values(p, T[0], v, a, b))    # The initial condition is assigned.
+    else:                                                                           # For the values at the probes.
+        P    = options.probes.P if perm is None else options.probes.P[:, perm]      # Interpolation weights in the ordering of the nodes.
+        u_ap = Planner.History(options.probes.n, t, dtype, options.stream, options.history, 'u_ap')
+                                                                                    # u_ap initialization with zeros.
+        u_0  = f(p[:, 0], p[:, 1], T[0], *Fields.Values(p, T[0], v, a, b))          # The initial condition is assigned.
+        u_ap[:, 0] = P@u_0
     
+    # Computation of Gamma values
+    L = Fields.Operator(p, T[0] + tc, v, a, b)                                      # The values of the differential operator are assigned.
+    C = None                                                                        # Gammas of the derivatives.
+    if varying:                                                                     # For coefficients that change in time.
+        if D is None:
+            D = Gammas.Derivatives(p, vec)                                          # Derivative stencils.
+        C = Gammas.Components(p, vec, D)                                            # Combined with the coefficients of each time.
+
+    if saved is not None:                                                           # For a restart.
+        op = saved['op']                                                            # Operator from the checkpoint.
+
+    elif options.interior == True:                                                  # For the inner nodes only.
+        op = (dt*Gammas.Weights(p, vec, L, D = D)).astype(dtype)                    # K in ELLPACK layout, split by the engine.
+
+    elif options.engine == 'dense':                                                 # For the full propagator.
+        if D is None and np.size(L) == 5:
+            K = dt*Gammas.Cloud(p, vec, L)                                          # K computation with the required Gammas.
+        else:
+            K = dt*Gammas.Matrix(Gammas.Weights(p, vec, L, D = D), vec)             # K computation from the derivative stencils.
+
+        if implicit == False:                                                       # For the explicit scheme.
+            op = np.identity(m) + K                                                 # Explicit formulation of K.
+        else:                                                                       # For the implicit scheme.
+            op = np.linalg.pinv(np.identity(m) - (1-lam)*K)@(np.identity(m) + lam*K)# Implicit formulation of K.
+        op = op.astype(dtype)                                                       # Storage precision of the propagator.
+
+    elif options.engine == 'ellpack' or options.engine == 'shared':                 # For the fixed-width stencil kernel.
+        op        = dt*Gammas.Weights(p, vec, L, D = D)                             # Gammas in ELLPACK layout.
+        op[:, 0] += 1                                                               # Explicit formulation of K.
+        op        = op.astype(dtype)                                                # Storage precision of the weights.
+
+    elif options.engine == 'sparse':                                                # For the sparse operator.
+        op = (dt*Gammas.Weights(p, vec, L, D = D)).astype(dtype)                    # K in ELLPACK layout, assembled by the engine.
+
+
     # Generalized Finite Differences Method
-    if implicit == False:                                                           # For the explicit scheme.
-        K2 = np.identity(m) + K                                                     # Explicit formulation of K.
-    else:                                                                           # For the implicit scheme.
-        K2 = np.linalg.pinv(np.identity(m) - (1-lam)*K)@(np.identity(m) + lam*K)    # Implicit formulation of K.
-
-    for k in np.arange(1, t):                                                       # For each of the time steps.
-        un = K2@u_ap[:, k-1]                                                        # The new time-level is computed.
-        u_ap[inne_n, k] = un[inne_n]                                                # Save the computed solution.
-        
+    if options.engine == 'shared':                                                  # For the domain decomposition.
+        u_ap = Decomposition.Explicit(op, Gammas.Index(vec), u_ap, boun_n, options.n_jobs, acc)
+                                                                                    # Parallel time steps.
+    else:
+        if options.interior == True:
+            stencil = Stencil.Interior(op, Gammas.Index(vec), boun_n, implicit, lam, dense = options.engine == 'dense')
+                                                                                    # Time-stepping engine.
+        elif options.engine == 'dense':
+            stencil = Stencil.Dense(op)                                             # Time-stepping engine.
+        elif options.engine == 'sparse':
+            stencil = Stencil.Sparse(op, Gammas.Index(vec), implicit, lam)          # Time-stepping engine.
+        elif options.blocking > 1:
+            stencil = Stencil.Blocked(op, Gammas.Index(vec), boun_n, depth = options.blocking, accumulate = acc)
+                                                                                    # Time-stepping engine.
+        else:
+            stencil = Stencil.Ellpack(op, Gammas.Index(vec), accumulate = acc)      # Time-stepping engine.
+
+        k0 = 0                                                                      # Last computed time step.
+        kc = -1                                                                     # Time step of the last checkpoint.
+        if saved is not None and saved['k'] >= 0:                                   # If the checkpoint has time steps.
+            k0 = kc = saved['k']
+            u_ap[:, :k0 + 1] = saved['history']                                     # Restore the computed solution.
+        elif options.checkpoint is not None:                                        # For a new run.
+            Checkpoint.Save_Operator(options.checkpoint, key, vec, perm, op)        # Save the neighbors and the operator.
+
+        W  = None                                                                   # Buffer for the Gammas.
+        u  = u_ap[:, k0].copy() if options.probes is None else u_0.astype(dtype)    # Current time-level.
+        un = np.empty(m, dtype = dtype)                                             # Buffer for the new time-level.
+        ub = np.zeros(m, dtype = dtype)                                             # Buffer for the boundary condition.
+        if options.blocking > 1:                                                    # For the temporal blocking.
+            k = k0                                                                  # Last computed time step.
+            while k < t - 1:                                                        # For each block of time steps.
+                n = min(options.blocking, t - 1 - k)                                # Time steps of the block.
+                if options.checkpoint is not None:
+                    n = min(n, options.interval - k%options.interval)               # Do not skip the checkpoints.
+                stencil.advance(u_ap, k, n)                                         # The new time-levels are computed.
+                k = k + n
+                if options.due(k, t):                                               # If a checkpoint is due.
+                    Checkpoint.Save_State(options.checkpoint, key, u_ap, kc, k, params)
+                                                                                    # Save the checkpoint.
+                    kc = k
+        else:                                                                       # For one time step at a time.
+            for k in np.arange(k0 + 1, t):                                          # For each of the time steps.
+                if varying and k > 1 and ((k - 1)%options.refresh == 0 or k == k0 + 1):
+                                                                                    # If the coefficients must be updated.
+                    W  = Gammas.Combine(C, boun_n, *Fields.Values(p, T[k - 1] + tc, v, a, b), out = W)
+                    W *= dt                                                         # Gammas at the new time.
+                    if options.engine == 'ellpack':
+                        W[:, 0] += 1                                                # Explicit formulation of K.
+                    stencil.update(W.astype(dtype, copy = False))                   # New operator with the same neighbors.
+                if options.probes is None:
+                    ub = u_ap[:, k]                                                 # Boundary condition from the history.
+                else:
+                    ub[boun_n] = f(p[boun_n, 0], p[boun_n, 1], T[k], *Fields.Values(p, T[k], v, a, b, boun_n))
+                                                                                    # The boundary condition is computed.
+                np.copyto(un, ub, where = boun_n)                                   # The boundary condition is assigned.
+                stencil.step(u, un)                                                 # The new time-level is computed.
+                np.copyto(un, ub, where = boun_n)                                   # The boundary condition is assigned (full operators).
+                u_ap[:, k] = un if options.probes is None else P@un                 # Save the computed solution.
+                u, un      = un, u                                                  # Swap the buffers.
+                if options.due(k, t):                                               # If a checkpoint is due.
+                    Checkpoint.Save_State(options.checkpoint, key, u_ap, kc, k, params)
+                                                                                    # Save the checkpoint.
+                    kc = k
+
+    # Original ordering of the nodes.
+    if perm is not None and options.probes is not None:                             # If the nodes were reordered.
+        vec = Reorder.renumber(vec[Reorder.inverse(perm)], perm)                    # Neighbors in the original order.
+    elif perm is not None:                                                          # If the nodes were reordered.
+        out       = Planner.History(m, t, dtype, options.stream, options.history, 'u_ap') if options.stream else None
+        u_ap, vec = Reorder.Restore(u_ap, vec, perm, out)                           # Computed solution and neighbors in the original order.
+
     # Theoretical Solution
-    for k in np.arange(t):                                                          # For all the time steps.
-        u_ex[:, k] = f(p[:, 0], p[:, 1], T[k], v, a, b)                             # The theoretical solution is computed.
+    if options.probes is None:                                                      # On all the nodes.
+        u_ex = Planner.History(m, t, np.float64, options.stream, options.history, 'u_ex')
+                                                                                    # u_ex initialization with zeros.
+        for k in np.arange(t):                                                      # For all the time steps.
+            u_ex[:, k] = f(p0[:, 0], p0[:, 1], T[k], *Fields.Values(p0, T[k], *coef))
+                                                                                    # The theoretical solution is computed.
+    else:                                                                           # At the probes.
+        u_ex = Planner.History(options.probes.n, t, np.float64, options.stream, options.history, 'u_ex')
+                                                                                    # u_ex initialization with zeros.
+        for k in np.arange(t):                                                      # For all the time steps.
+            u_ex[:, k] = f(options.probes.points[:, 0], options.probes.points[:, 1], T[k], *(options.probes.values(c, T[k]) for c in coef))
+                                                                                    # The theoretical solution is computed.
 
     return u_ap, u_ex, vec
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Library importation
+from Scripts.Examples import Examples
+from Scripts.Precision import Report
+
+# Compare the single and mixed precision modes against float64 for all the examples.
+for exam, problem in Examples.items():                                                      # For each of the examples.
+    f, v, a, b, t = problem['f'], problem['v'], problem['a'], problem['b'], problem['t']    # Problem parameters.
+
+    # Run simulation with clouds.
+    data = 'Data/Clouds/'
+    print('Precision report for Simply Connected domains.')
+    Report(f, v, a, b, t, data = data, exam = exam, holes = False)
+
+    # Run simulations with clouds with holes.
+    data = 'Data/Holes/'
+    print('Precision report for non-Simply Connected domains.')
+    Report(f, v, a, b, t, data = data, exam = exam, holes = True)
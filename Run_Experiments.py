@@ -0,0 +1,27 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Library importation
+from Scripts.Command import main
+
+# Run the scenarios, regions and schemes given in the command line or in a configuration file.
+#   python Run_Experiments.py Experiments.json
+#   python Run_Experiments.py --scenario "Example 1" --region BAN --data Holes --scheme implicit --no-save
+#   python Run_Experiments.py --help
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Stencil as Stencil
+import Scripts.Fields as Fields
+import Scripts.Errors as Errors
+import Scripts.Splitting as Splitting
+import Scripts.Stability as Stability
+from Scripts.Operator import Operator
+from Scripts.Probes import Taylor
+
+def Indicator(op, u, h):
+    """
+    Indicator
+    Function to compute the refinement indicator of each node from the derivative stencils of the operator.
+    The indicator is h|grad u| + h^2(|u_xx| + |u_xy| + |u_yy|), relative to the largest value of |u|; h is the spacing of the initial cloud, so the indicator does not change when the cloud is refined.
+
+    Input:
+        op              Operator        GFD operator of the cloud, with the derivative stencils (Scripts/Operator.py).
+        u               ndarray         Array with the solution on the nodes.
+        h               Real            Spacing of the initial cloud.
+
+    Output:
+        eta             ndarray         Array with the indicator of each node (zero on the boundary).
+    """
+
+    valid = op.vec != -1
+    du    = np.where(valid, u[np.maximum(op.vec, 0)] - u[:, None], 0)               # Differences with the neighbors.
+    d     = np.einsum('ij,ijk->ik', du, op.D)                                       # u_x, u_y, u_xx/2, u_xy and u_yy/2.
+    grad  = np.hypot(d[:, 0], d[:, 1])
+    curv  = 2*np.abs(d[:, 2]) + np.abs(d[:, 3]) + 2*np.abs(d[:, 4])
+    scale = max(np.max(np.abs(u)), np.finfo(float).tiny)                            # Size of the solution.
+    return (h*grad + h**2*curv)/scale
+
+def Candidates(op, nodes, h, levels):
+    """
+    Candidates
+    Function to find the new nodes around the nodes to refine: the midpoints between each node and its neighbors.
+    The level of a midpoint is given by its spacing (about h/2^level); midpoints over the maximum level, or closer than half their spacing to a node or to another midpoint, are discarded.
+
+    Input:
+        op              Operator        GFD operator of the cloud.
+        nodes           ndarray         Indices of the nodes to refine.
+        h               Real            Spacing of the initial cloud.
+        levels          Integer         Maximum refinement level.
+
+    Output:
+        q               ndarray         Array with the coordinates of the new nodes.
+        lq              ndarray         Array with the refinement level of the new nodes.
+    """
+
+    from scipy.spatial import cKDTree                                               # Imported when needed.
+    nb    = op.vec[nodes]
+    valid = nb != -1
+    i     = np.repeat(nodes, valid.sum(axis = 1))                                   # Node to refine.
+    j     = nb[valid]                                                               # Neighbor.
+    q     = (op.p[i, :2] + op.p[j, :2])/2                                           # Midpoints.
+    r     = np.hypot(*(op.p[i, :2] - op.p[j, :2]).T)/2                              # Spacing of the midpoints.
+    lq    = np.ceil(np.log2(h/r) - 1/4).astype(int)                                 # Level of the midpoints.
+
+    d, _  = cKDTree(op.p[:, :2]).query(q)                                           # Distance to the closest node.
+    keep  = (d > r/2) & (lq <= levels)
+    q, r, lq = q[keep], r[keep], lq[keep]
+    order = np.argsort(r)                                                           # The finest midpoints first.
+    q, r, lq = q[order], r[order], lq[order]
+    take  = np.ones(len(q), dtype = bool)
+    for k, near in enumerate(cKDTree(q).query_ball_point(q, r/2) if len(q) > 0 else []):
+        if take[k]:                                                                 # Discard the midpoints too close to this one.
+            near       = np.asarray(near, dtype = int)
+            take[near[near > k]] = False
+
+    return q[take], lq[take]
+
+def Transfer(u, nodes, w):
+    """
+    Transfer
+    Function to interpolate the solution on a set of points with the GFD weights of Probes.Taylor, bounded by the values of the nodes used (so no new extrema are created).
+    """
+    vals = u[nodes]
+    return np.clip(np.sum(w*vals, axis = 1), vals.min(axis = 1), vals.max(axis = 1))
+
+def Repair(op, level):
+    """
+    Repair
+    Function to remove the inserted nodes that leave a GFD Laplacian stencil whose negative neighbor weights outweigh its central weight.
+    The rows of the bundled clouds are all well inside this bound; the rows that are not, on one-sided or almost singular patches of inserted nodes, give eigenvalues with a positive real part.
+    The inserted nodes of such a stencil (and the node itself, if it was inserted) are removed until no inner row is left like that.
+
+    Input:
+        op              Operator        GFD operator of v*Laplacian on the cloud.
+        level           ndarray         Array with the refinement level of each node (0 for the nodes of the initial cloud).
+
+    Output:
+        keep            ndarray         Array with the flags of the nodes that were kept.
+    """
+
+    keep = np.ones(op.m, dtype = bool)
+    old  = np.arange(op.m)                                                          # Index of the nodes before the removals.
+    while True:
+        neg  = np.sum(np.minimum(op.W[:, 1:], 0), axis = 1)                         # Negative weights of the neighbors.
+        bad  = np.where((op.p[:, 2] == 0) & (op.W[:, 0] - neg >= 0))[0]             # Rows outweighed by their negative weights.
+        drop = np.unique(np.concatenate([bad, op.vec[bad].reshape(-1)]))
+        drop = drop[drop != -1]
+        drop = drop[level[old[drop]] > 0]                                           # Only the inserted nodes can be removed.
+        if len(drop) == 0:
+            return keep
+        new  = op.Remove(drop)
+        keep[old[new == -1]] = False
+        old  = old[new != -1]
+
+def Stable(op, dt, implicit = False, lam = 0.5):
+    """
+    Stable
+    Function to check with the extreme eigenvalues (Stability.Spectrum) that the time steps of size dt with the GFD operator on the inner nodes are stable:
+    no eigenvalue has a non-negative real part, and dt is under the limit of Stability.Time_Step.
+    """
+    eig = Stability.Spectrum(Stability.Operator(op.p, op.vec, op.L, op.D), k = 4)
+    if np.any(eig.real >= 1e-10*np.max(np.abs(eig), initial = 1)):                  # A mode that grows with any time step.
+        return False
+    return dt <= Stability.Time_Step(eig, implicit, lam)
+
+def Cloud(p, f, v, a, b, t, implicit = False, lam = 0.5, interval = 10, levels = 2, refine = 0.05, coarsen = 0.01, nvec = 8):
+    """
+    2D Advection-Diffusion Equation on an adaptive cloud of points.
+
+    Every 'interval' time steps the nodes are flagged with a gradient and curvature indicator computed with the GFD derivative stencils (see Indicator):
+        Refinement:     New nodes are inserted at the midpoints between the flagged nodes and their neighbors, up to 'levels' times.
+        Coarsening:     Inserted nodes with a small indicator are removed; the nodes of the initial cloud are never removed.
+    The neighbors and the Gammas are computed again only for the nodes close to the changes (Scripts/Operator.py), and the solution is interpolated on the new nodes.
+    The time steps are split as in Scripts/Splitting.py: half a step of GFD diffusion (Stencil.Interior), a semi-Lagrangian advection step and half a step of diffusion.
+    The GFD weights of the advection terms are not stable on the irregular patches between refined and coarse nodes; the semi-Lagrangian step is, and its interpolation is bounded by the values of the nodes used.
+    The diffusion weights need care too: with the 'nvec' closest nodes, a coarse node next to a refined patch takes all its neighbors from the patch and its stencil is one-sided.
+    The neighbors are taken in turns from the four quadrants around each node (Operator with 'balanced'), the inserted nodes that still leave a stencil outweighed by its negative weights are removed (see Repair),
+    and after each change the extreme eigenvalues of the operator are checked (see Stable); if the half steps of diffusion are not stable with them, the adaptation is undone.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and the flag for boundary or inner node.
+        f               Function        Function declared with the boundary condition.
+        v               Real            Diffusion coefficient.
+        a               Real            Transport velocity on the x direction.
+        b               Real            Transport velocity on the y direction.
+        t               Integer         Number of time steps to be considered.
+        implicit        Logical         Implicit scheme for the diffusion (Default: False).
+        lam             Real            Lambda parameter for the implicit scheme (Default: 0.5).
+        interval        Integer         Number of time steps between adaptations of the cloud (Default: 10).
+        levels          Integer         Maximum number of refinements of the initial cloud (Default: 2).
+        refine          Real            Indicator over which the nodes are refined (Default: 0.05).
+        coarsen         Real            Indicator under which the inserted nodes are removed (Default: 0.01).
+        nvec            Integer         Maximum number of neighbors for each node (Default: 8).
+
+    Output:
+        p               m x 3           Array           Array with the nodes of the final cloud.
+        u_ap            m x 1           Array           Array with the approximation on the final cloud at the last time step.
+        u_ex            m x 1           Array           Array with the theoretical solution on the final cloud at the last time step.
+        vec             m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        errors          Accumulator     Errors of all the time steps, each one on its own cloud (Errors.Accumulator).
+    """
+
+    # Variable initialization
+    if not Fields.Constant(v, a, b):
+        raise ValueError('The adaptive cloud needs coefficients that are the same on all the nodes and time steps.')
+    T     = np.linspace(0, 1, t)                                                    # Time discretization.
+    dt    = T[1] - T[0]                                                             # dt computation.
+    L     = Fields.Operator(p, 0, v, 0, 0)                                          # The values of v*Laplacian.
+    op    = Operator(p, L, nvec, derivatives = True, balanced = True)               # GFD operator that can be updated.
+    from scipy.spatial import cKDTree                                               # Imported when needed.
+    d, _  = cKDTree(op.p[:, :2]).query(op.p[:, :2], k = 2)
+    h     = np.median(d[:, 1])                                                      # Spacing of the initial cloud.
+    level = np.zeros(op.m, dtype = int)                                             # Refinement level of each node.
+
+    def exact(k):                                                                   # Theoretical solution on the current cloud.
+        return f(op.p[:, 0], op.p[:, 1], T[k], v, a, b)
+
+    u      = exact(0)                                                               # The initial condition is assigned.
+    errors = Errors.Accumulator(op.p, op.vec).add(u, u)
+    engine = None
+    for k in np.arange(1, t):                                                       # For each of the time steps.
+        if (k - 1) % interval == 0:                                                 # Adaptation of the cloud.
+            saved = op.snapshot(), u, level                                         # Cloud before the adaptation.
+            eta  = Indicator(op, u, h)
+            inne = op.p[:, 2] == 0
+            drop = np.where(inne & (level > 0) & (eta < coarsen))[0]                # Inserted nodes to remove.
+            if len(drop) > 0:
+                keep = op.Remove(drop) != -1
+                u, level, eta = u[keep], level[keep], eta[keep]
+            flag = np.where((op.p[:, 2] == 0) & (level < levels) & (eta > refine))[0]
+            q    = np.zeros([0, 2])
+            if len(flag) > 0:                                                       # Nodes to refine.
+                q, lq = Candidates(op, flag, h, levels)
+            if len(q) > 0:
+                uq    = Transfer(u, *Taylor(op.p, q, nvec))                         # Solution on the new nodes.
+                op.Insert(q)
+                u     = np.concatenate([u, uq])
+                level = np.concatenate([level, lq])
+            changed = len(drop) > 0 or len(q) > 0
+            if changed:                                                             # Check the stencils of the new cloud.
+                keep     = Repair(op, level)                                        # Remove the nodes that give one-sided stencils.
+                u, level = u[keep], level[keep]
+                if not Stable(op, dt/2, implicit, lam):                             # Unstable operator: the adaptation is undone.
+                    op.restore(saved[0])
+                    u, level = saved[1:]
+                    changed  = False
+            if engine is None or changed:                                           # The cloud changed.
+                boun        = op.p[:, 2] != 0
+                engine      = Stencil.Interior((dt/2)*op.W, Gammas.Index(op.vec), boun, implicit, lam)
+                departure   = Taylor(op.p, Splitting.Departure(op.p, a, b, T[k - 1], dt), nvec)
+                                                                                    # Interpolation weights of the departure points.
+                errors.area = Errors.Areas(op.p, op.vec)                            # Areas of the new cloud.
+                un          = np.empty(op.m)
+
+        u_ex     = exact(k)
+        un[boun] = u[boun]
+        engine.step(u, un)                                                          # Half a step of diffusion.
+        u        = Transfer(un, *departure)                                         # Advection along the characteristics.
+        u[boun]  = u_ex[boun]                                                       # The boundary condition is assigned.
+        un[boun] = u_ex[boun]
+        engine.step(u, un)                                                          # Half a step of diffusion.
+        u[:]     = un
+        errors.add(u, u_ex)
+
+    return op.p, u, exact(t - 1), op.vec, errors
@@ -0,0 +1,175 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import glob
+import hashlib
+import tempfile
+import numpy as np
+
+def Key(p, tt, f, **params):
+    """
+    Key
+    Function to compute the operator cache key of a problem: a hash of the nodes, the triangles, the boundary function and the parameters.
+    A checkpoint is only used to restart a problem with the same key.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt              ndarray         Array with the correspondence of the n triangles (can be empty).
+        f               Function        Function declared with the boundary condition.
+        params          dict            Parameters of the problem (v, a, b, t, implicit, lam, ...).
+
+    Output:
+        key             string          Hexadecimal key of the problem.
+    """
+
+    h = hashlib.sha1()
+    h.update(np.ascontiguousarray(p, dtype = np.float64).tobytes())                 # Nodes.
+    h.update(np.ascontiguousarray(tt, dtype = np.float64).tobytes())                # Triangles.
+    code = getattr(f, '__code__', None)                                             # Boundary function.
+    if code is not None:
+        h.update(code.co_code)
+        h.update(repr(code.co_consts).encode())
+    for name, value in sorted(params.items()):                                      # Parameters.
+        h.update(name.encode())
+        code = getattr(value, '__code__', None)
+        if code is not None:                                                        # Coefficients given as functions.
+            h.update(code.co_code)
+            h.update(repr(code.co_consts).encode())
+        elif isinstance(value, np.ndarray):                                         # Coefficients given on the nodes.
+            h.update(np.ascontiguousarray(value, dtype = np.float64).tobytes())
+        else:
+            h.update(repr(value).encode())
+
+    return h.hexdigest()
+
+def atomic_save(path, **arrays):
+    """
+    atomic_save
+    Function to save arrays in a .npz file; the file is written in a temporary file and then renamed, so a checkpoint on disk is never half-written.
+    """
+    folder = os.path.dirname(path) or '.'
+    fd, tmp = tempfile.mkstemp(dir = folder, suffix = '.tmp')                       # Temporary file in the same folder.
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(file, **arrays)                                                # Write the arrays.
+            file.flush()
+            os.fsync(file.fileno())                                                 # Make sure the data is on disk.
+        os.replace(tmp, path)                                                       # Atomic rename.
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+def Clear(folder):
+    """
+    Clear
+    Function to remove all the checkpoint files from a folder.
+    """
+    paths = glob.glob(os.path.join(folder, 'history_*.npz'))                        # Pieces of the history.
+    paths = paths + [os.path.join(folder, 'operator.npz'), os.path.join(folder, 'state.npz')]
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def Save_Operator(folder, key, vec, perm, op):
+    """
+    Save_Operator
+    Function to save the neighbors, the node reordering and the operator of a problem, so a restart does not have to compute them again.
+
+    Input:
+        folder          string          Folder for the checkpoint files.
+        key             string          Operator cache key of the problem.
+        vec             ndarray         Array with matching neighbors of each node.
+        perm            ndarray         Node reordering (None if the nodes were not reordered).
+        op              ndarray         Operator used on each time step (propagator or ELLPACK weights).
+
+    Output:
+        None
+    """
+
+    os.makedirs(folder, exist_ok = True)                                            # Ensure the directory exists.
+    Clear(folder)                                                                   # Remove the checkpoints of other runs.
+    perm = np.array([], dtype = int) if perm is None else perm
+    atomic_save(os.path.join(folder, 'operator.npz'), key = key, vec = vec, perm = perm, op = op)
+
+def Save_State(folder, key, u_ap, k0, k, params):
+    """
+    Save_State
+    Function to save a checkpoint at the time step k.
+    The columns of the solution computed since the previous checkpoint (k0 + 1 to k) are appended to the history, then the current step index is updated.
+
+    Input:
+        folder          string          Folder for the checkpoint files.
+        key             string          Operator cache key of the problem.
+        u_ap            ndarray         m x t Array with the computed solution.
+        k0              int             Time step of the previous checkpoint (-1 if there is none).
+        k               int             Current time step.
+        params          dict            Parameters of the problem.
+
+    Output:
+        None
+    """
+
+    atomic_save(os.path.join(folder, 'history_%08d.npz' % (k0 + 1)), u = u_ap[:, k0 + 1:k + 1])
+                                                                                    # New columns of the history.
+    atomic_save(os.path.join(folder, 'state.npz'), key = key, k = k, u = u_ap[:, k], params = repr(sorted(params.items())))
+                                                                                    # Current state and step index.
+
+def Load(folder, key):
+    """
+    Load
+    Function to load the latest checkpoint of a problem.
+
+    Input:
+        folder          string          Folder for the checkpoint files.
+        key             string          Operator cache key of the problem.
+
+    Output:
+        saved           dict            Dictionary with 'vec', 'perm', 'op', 'k' and 'history' (columns 0 to k of the solution).
+                                        None if there is no checkpoint with the same key.
+    """
+
+    op_path    = os.path.join(folder, 'operator.npz')
+    state_path = os.path.join(folder, 'state.npz')
+    if not os.path.exists(op_path):                                                 # There is no checkpoint.
+        return None
+
+    with np.load(op_path) as data:
+        if str(data['key']) != key:                                                 # The checkpoint belongs to another problem.
+            return None
+        saved = {'vec': data['vec'], 'perm': data['perm'] if len(data['perm']) > 0 else None, 'op': data['op'], 'k': -1, 'history': None}
+
+    if os.path.exists(state_path):                                                  # If the time steps have started.
+        with np.load(state_path) as data:
+            if str(data['key']) != key:
+                return saved
+            k = int(data['k'])
+        history = []
+        for path in sorted(glob.glob(os.path.join(folder, 'history_*.npz'))):       # For each piece of the history.
+            start = int(os.path.basename(path)[8:16])
+            if start <= k:
+                with np.load(path) as data:
+                    history.append(data['u'][:, :k + 1 - start])
+        history = np.hstack(history)
+        if history.shape[1] == k + 1:                                               # If the history is complete.
+            saved['k']       = k
+            saved['history'] = history
+
+    return saved
@@ -0,0 +1,111 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import argparse
+
+def Parser():
+    """
+    Parser
+    Command line options of the experiment runner.
+    """
+    parser = argparse.ArgumentParser(description = 'Generalized Finite Differences for the advection-diffusion equation on clouds of points.')
+    parser.add_argument('config', nargs = '?', help = 'JSON configuration file (see Scripts/Experiments.py); the options below override it.')
+    parser.add_argument('-s', '--scenario', action = 'append', help = 'Example from Scripts/Examples.py (can be repeated).')
+    parser.add_argument('-r', '--region', action = 'append', help = 'Region to compute (can be repeated; default: all).')
+    parser.add_argument('-d', '--data', action = 'append', help = 'Data folder as NAME=PATH, or Clouds or Holes (can be repeated).')
+    parser.add_argument('--scheme', action = 'append', choices = ['explicit', 'implicit'], help = 'Time-stepping scheme (can be repeated).')
+    parser.add_argument('--lam', type = float, help = 'Lambda parameter of the implicit scheme.')
+    parser.add_argument('--engine', choices = ['auto', 'dense', 'ellpack', 'sparse'], help = 'Engine for the time steps (auto: chosen by Scripts/Planner.py).')
+    parser.add_argument('--v', type = float, help = 'Diffusion coefficient (for all the scenarios).')
+    parser.add_argument('--a', type = float, help = 'Transport velocity on the x direction (for all the scenarios).')
+    parser.add_argument('--b', type = float, help = 'Transport velocity on the y direction (for all the scenarios).')
+    parser.add_argument('-t', '--steps', type = lambda t: t if t == 'auto' else int(t), help = "Number of time steps ('auto': largest stable time step).")
+    parser.add_argument('--interior', action = 'store_true', default = None, help = 'Advance only the inner nodes, with the boundary data as a source term.')
+    parser.add_argument('--triangulation', action = 'store_true', default = None, help = 'Take the neighbors from the triangulation.')
+    parser.add_argument('--no-save', dest = 'save', action = 'store_false', default = None, help = 'Only compute the errors; no files and no graphs.')
+    parser.add_argument('--results', help = 'Folder of each task, with the fields {scenario}, {data}, {scheme} and {region}.')
+    parser.add_argument('--summary', help = 'File with the errors of all the tasks.')
+    parser.add_argument('-j', '--jobs', type = int, help = 'Number of worker processes (-1 uses all processors).')
+    parser.add_argument('--list', action = 'store_true', help = 'List the available examples and exit.')
+    return parser
+
+def Config(args):
+    """
+    Config
+    Function to build the configuration of the experiment matrix from the command line options.
+
+    Input:
+        args            Namespace       Options from Parser.
+
+    Output:
+        config          dict            Configuration of the experiment matrix.
+    """
+    import Scripts.Experiments as Experiments
+
+    config = Experiments.Load(args.config) if args.config else dict(Experiments.Defaults)
+
+    if args.scenario:                                                               # Scenarios.
+        config['scenarios'] = args.scenario
+    coefficients = {k: getattr(args, k) for k in ('v', 'a', 'b') if getattr(args, k) is not None}
+    if coefficients:                                                                # New coefficients for all the scenarios.
+        scenarios = []
+        for scenario in config['scenarios']:
+            if isinstance(scenario, str):
+                scenario = {'name': scenario, 'example': scenario}
+            scenarios.append({**scenario, **coefficients})
+        config['scenarios'] = scenarios
+
+    if args.data:                                                                   # Data folders.
+        config['data'] = {}
+        for data in args.data:
+            name, _, path = data.partition('=')
+            config['data'][name] = path or os.path.join('Data', name, '')
+
+    if args.scheme:                                                                 # Schemes.
+        config['schemes'] = {scheme: {'implicit': scheme == 'implicit'} for scheme in args.scheme}
+    if args.lam is not None:
+        config['schemes'] = {name: {**scheme, 'lam': args.lam} for name, scheme in config['schemes'].items()}
+
+    options = {'regions': args.region, 'engine': args.engine, 't': args.steps, 'triangulation': args.triangulation, 'interior': args.interior,
+               'save': args.save, 'results': args.results, 'summary': args.summary, 'n_jobs': args.jobs}
+    config.update({k: v for k, v in options.items() if v is not None})
+
+    return config
+
+def main(argv = None):
+    """
+    main
+    Command line entry point.
+    Matplotlib is only imported if the results are saved, always with a non-GUI backend; the parallel backends are imported when they are used.
+    """
+    args = Parser().parse_args(argv)
+    os.environ['MPLBACKEND'] = 'Agg'                                                # No display is needed (also for the workers).
+
+    if args.list:                                                                   # List the examples.
+        from Scripts.Examples import Examples
+        for exam, problem in Examples.items():
+            print(f"{exam}\tv = {problem['v']}\ta = {problem['a']}\tb = {problem['b']}\tt = {problem['t']}")
+        return
+
+    import Scripts.Experiments as Experiments
+    return Experiments.Run(Config(args))
+
+if __name__ == '__main__':
+    main()
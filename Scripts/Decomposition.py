@@ -0,0 +1,147 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import Scripts.Reorder as Reorder
+import Scripts.Stencil as Stencil
+
+def Partition(vec, n_parts):
+    """
+    Partition
+    Function to split the nodes in 'n_parts' groups of neighboring nodes.
+    The nodes are sorted with Reverse Cuthill-McKee on the neighbor graph and then cut in contiguous pieces of the same size, so each piece has a small number of neighbors in the other pieces.
+
+    Input:
+        vec             ndarray         Array with matching neighbors of each node.
+        n_parts         int             Number of partitions.
+
+    Output:
+        part            ndarray         Array with the partition of each node.
+    """
+
+    m    = vec.shape[0]                                                             # The total number of nodes.
+    perm = Reorder.Permutation(None, vec, mode = 'rcm')                             # Bandwidth reducing ordering.
+    part = np.zeros(m, dtype = int)                                                 # part initialization with zeros.
+    for k, rows in enumerate(np.array_split(perm, n_parts)):                        # For each of the pieces.
+        part[rows] = k                                                              # Assign the nodes to the partition.
+
+    return part
+
+def Explicit(W, idx, u_ap, boun_n, n_jobs = -1, accumulate = None):
+    """
+    Explicit
+    Function to compute the explicit GFD time steps with several processes sharing the state.
+
+    The nodes are partitioned with the neighbor graph and each process computes the rows of its own nodes.
+    The state lives in a double buffer in shared memory; before each step every process gathers the values of its halo (neighbors owned by other processes) and the processes synchronize with a barrier after each step.
+    The computations of each row are the same as in Stencil.Ellpack, so the results match the serial 'ellpack' engine bit-for-bit.
+    They are not bit-for-bit equal to the 'dense' engine (the default of AdvectionDiffusion.Cloud), which sums the products of each row in another order.
+
+    Input:
+        W               ndarray         Array with the weights of each node and its neighbors (explicit formulation).
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        u_ap            ndarray         m x t Array with the initial condition and the boundary conditions.
+        boun_n          ndarray         Array with the flags of the boundary nodes.
+        n_jobs          int             Number of processes (-1 uses all processors).
+        accumulate      dtype           Precision for the products and sums, as in Stencil.Ellpack (Default: None).
+
+    Output:
+        u_ap            ndarray         m x t Array with the computed solution.
+    """
+
+    ## Variable initialization.
+    m, t  = u_ap.shape                                                              # The size of the problem.
+    dtype = u_ap.dtype                                                              # Precision of the state.
+    if n_jobs < 1:
+        n_jobs = os.cpu_count()                                                     # Use all the processors.
+    n_jobs = max(1, min(n_jobs, m))
+    part   = Partition(idx, n_jobs)                                                 # Partition of the nodes.
+
+    ## Shared memory.
+    shm_u = shared_memory.SharedMemory(create = True, size = 2*m*dtype.itemsize)    # Double buffer for the state.
+    shm_h = shared_memory.SharedMemory(create = True, size = m*t*dtype.itemsize)    # History of the solution.
+    try:
+        U    = np.ndarray((2, m), dtype = dtype, buffer = shm_u.buf)
+        H    = np.ndarray((m, t), dtype = dtype, buffer = shm_h.buf)
+        H[:] = u_ap                                                                 # Initial and boundary conditions.
+        U[0] = u_ap[:, 0]                                                           # Initial time-level.
+
+        ## Workers.
+        ctx     = mp.get_context('forkserver')                                      # Fresh processes, safe after using threaded kernels.
+        barrier = ctx.Barrier(n_jobs)                                               # Synchronization after each step.
+        procs   = []
+        for k in range(n_jobs):                                                     # For each of the partitions.
+            own   = np.where(part == k)[0]                                          # Nodes owned by the process.
+            need  = np.unique(idx[own])                                             # Owned nodes and halo.
+            halo  = np.setdiff1d(need, own)                                         # Halo nodes.
+            local = np.concatenate([own, halo])                                     # Local numbering: owned nodes first.
+            glob  = np.full(m, -1)
+            glob[local] = np.arange(len(local))                                     # Global to local numbering.
+            args  = (shm_u.name, shm_h.name, m, t, dtype, own, local, W[own], glob[idx[own]], boun_n[own], accumulate, barrier)
+            proc  = ctx.Process(target = worker, args = args)
+            proc.start()
+            procs.append(proc)
+
+        while any(proc.is_alive() for proc in procs):                               # Wait for the workers.
+            for proc in procs:
+                proc.join(0.1)
+            if any(proc.exitcode not in (None, 0) for proc in procs):               # If a worker died.
+                barrier.abort()                                                     # Release the others.
+        if any(proc.exitcode != 0 for proc in procs):
+            raise RuntimeError('A worker process of the domain decomposition failed.')
+
+        u_ap = H.copy()                                                             # Copy the solution out of the shared memory.
+        del U, H
+    finally:
+        shm_u.close()
+        shm_u.unlink()
+        shm_h.close()
+        shm_h.unlink()
+
+    return u_ap
+
+def worker(name_u, name_h, m, t, dtype, own, local, W, idx, boun, accumulate, barrier):
+    """
+    worker
+    Time loop of one of the partitions.
+    """
+    shm_u = shared_memory.SharedMemory(name = name_u)
+    shm_h = shared_memory.SharedMemory(name = name_h)
+    try:
+        U       = np.ndarray((2, m), dtype = dtype, buffer = shm_u.buf)
+        H       = np.ndarray((m, t), dtype = dtype, buffer = shm_h.buf)
+        stencil = Stencil.Ellpack(W, idx, jit = False, accumulate = accumulate)     # Kernel on the local numbering.
+        ul      = np.empty(len(local), dtype = dtype)                               # Owned and halo values.
+        un      = np.empty(len(own), dtype = dtype)                                 # New time-level of the owned nodes.
+        ob      = own[boun]                                                         # Owned boundary nodes.
+
+        for k in np.arange(1, t):                                                   # For each of the time steps.
+            np.take(U[(k - 1)%2], local, out = ul)                                  # Gather the owned and halo values.
+            stencil.step(ul, un)                                                    # The new time-level is computed.
+            un[boun]    = H[ob, k]                                                  # The boundary condition is assigned.
+            U[k%2, own] = un                                                        # Publish the new values.
+            H[own, k]   = un                                                        # Save the computed solution.
+            barrier.wait()                                                          # Wait for all the partitions.
+        del U, H
+    finally:
+        shm_u.close()
+        shm_h.close()
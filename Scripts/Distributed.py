@@ -0,0 +1,418 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import time
+import socket
+import pickle
+import secrets
+import argparse
+import ipaddress
+import threading
+from collections import deque
+from multiprocessing.managers import BaseManager
+
+## Distributed execution of the simulations.
+##  A coordinator serves the tasks (one region of one problem each) on a TCP socket; workers on any host with the repository and the data connect, lease a task,
+##  run Scripts/run.process_region and report the error and the time back.
+##  A leased task must be renewed by its worker; if the worker dies the lease expires and the task is given to another worker, up to 'retries' times.
+##
+##  On the coordinator host:    python -m Scripts.Distributed serve --port 50000 --authkey secret
+##  On each worker host:        python -m Scripts.Distributed work --host COORDINATOR --port 50000 --authkey secret
+##
+##  The data folders and the results folders are relative to the repository, so all the hosts must see the same files (shared filesystem) or collect them afterwards.
+##  The coordinator unpickles what the workers send, so anyone with the key can run code on it: there is no default key, it is given with --authkey or $GFD_AUTHKEY.
+
+def Key(authkey = None):
+    """
+    Key
+    Function to get the key shared by the coordinator and the workers: the given key or, if there is none, $GFD_AUTHKEY.
+
+    Output:
+        authkey         bytes           Key for the connections (None if there is no key).
+    """
+    authkey = os.environ.get('GFD_AUTHKEY') if authkey is None else authkey
+    if not authkey:
+        return None
+    return authkey if isinstance(authkey, bytes) else authkey.encode()
+
+def Loopback(host):
+    """
+    Loopback
+    Function to check if an address only accepts connections from the same host.
+    """
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+class Board:
+    """
+    Board
+
+    Task board of the coordinator, shared with the workers through a manager.
+    Each task is pending, leased to a worker until a deadline, or finished (with a result or an error).
+
+    Input:
+        tasks           list            Tasks to run (picklable dictionaries).
+        lease           Real            Seconds a worker can hold a task without renewing it (Default: 300).
+        retries         int             Number of times a task is given again after a failure or an expired lease (Default: 2).
+    """
+
+    def __init__(self, tasks, lease = 300, retries = 2):
+        self.tasks    = dict(enumerate(tasks))                                      # Tasks by identifier.
+        self.pending  = deque(self.tasks)                                           # Tasks waiting for a worker.
+        self.leases   = {}                                                          # {task: (worker, deadline)}.
+        self.attempts = {i: 0 for i in self.tasks}                                  # Times each task has been given.
+        self.results  = {}                                                          # {task: result}.
+        self.lease    = lease
+        self.retries  = retries
+        self.lock     = threading.Lock()
+
+    def expire(self):
+        """
+        Take the tasks of the expired leases back (the lock must be held).
+        """
+        now = time.time()
+        for i, (worker, deadline) in list(self.leases.items()):
+            if deadline < now:                                                      # The worker is dead or stuck.
+                del self.leases[i]
+                self.retry(i, {'status': 'lost', 'worker': worker})
+
+    def retry(self, i, result):
+        """
+        Give a task again, or finish it with the result of its last attempt (the lock must be held).
+        """
+        if self.attempts[i] <= self.retries:
+            self.pending.append(i)
+        else:
+            self.results[i] = {**result, 'attempts': self.attempts[i]}
+
+    def take(self, worker):
+        """
+        Lease the next task to a worker.
+
+        Output:
+            job         tuple           (identifier, task, lease), or None if there is no pending task now.
+        """
+        with self.lock:
+            self.expire()
+            if not self.pending:
+                return None
+            i = self.pending.popleft()
+            self.attempts[i] += 1
+            self.leases[i] = (worker, time.time() + self.lease)
+            return i, self.tasks[i], self.lease
+
+    def renew(self, worker, i):
+        """
+        Extend the lease of a task; False if the task is no longer leased to the worker.
+        """
+        with self.lock:
+            if self.leases.get(i, (None,))[0] != worker:
+                return False
+            self.leases[i] = (worker, time.time() + self.lease)
+            return True
+
+    def report(self, worker, i, result):
+        """
+        Receive the result of a task ({'status': 'done' or 'failed', ...}); failed tasks are retried.
+        """
+        with self.lock:
+            if self.leases.get(i, (None,))[0] != worker:                            # The lease expired, the task was given again.
+                return False
+            del self.leases[i]
+            if result.get('status') == 'done':
+                self.results[i] = {**result, 'attempts': self.attempts[i]}
+            else:
+                self.retry(i, result)
+            return True
+
+    def finished(self):
+        """
+        True when all the tasks have a result.
+        """
+        with self.lock:
+            self.expire()
+            return len(self.results) == len(self.tasks)
+
+    def status(self):
+        """
+        Number of pending, leased and finished tasks.
+        """
+        with self.lock:
+            return {'pending': len(self.pending), 'leased': len(self.leases), 'finished': len(self.results), 'total': len(self.tasks)}
+
+    def summary(self):
+        """
+        Tasks and results, ordered by identifier.
+        """
+        with self.lock:
+            return [(self.tasks[i], self.results.get(i)) for i in sorted(self.tasks)]
+
+def run_task(task):
+    """
+    run_task
+    Function to run one task: one region of one problem with Scripts/run.process_region.
+    The workers have no display: without saving, only the error and the time are reported and nothing is shown.
+
+    Output:
+        result          dict            Dictionary with the 'status', the mean 'error' and the 'time' in seconds.
+    """
+    import Scripts.run as run
+    run.Implicit      = task['implicit']                                            # Settings of run_simulation.
+    run.Save          = task['save']
+    run.triangulation = False
+
+    start = time.time()
+    error = run.process_region(task['f'], task['v'], task['a'], task['b'], task['t'], task['region'], task['files'], task['data'], task['results'],
+                               task['save'], task.get('reorder'), task.get('engine', 'dense'), task.get('checkpoint'), task.get('resume', False), show = False)
+    return {'status': 'done', 'error': None if error is None else float(error), 'time': time.time() - start}
+
+def Tasks(f, v, a, b, t, implicit, data, results, save = True, reorder = None, engine = 'dense', checkpoint = None, resume = False, exam = None):
+    """
+    Tasks
+    Function to build the tasks of run_simulation: one task for each region of the data folder.
+    The function f is sent to the workers, so it must be picklable (a module function); if it is not and 'exam' is an example of Scripts/Examples.py, the function of the example is used.
+
+    Output:
+        tasks           list            Tasks for the Board.
+    """
+    from Scripts.run import group_files_by_region
+    try:
+        pickle.dumps(f)
+    except Exception:
+        from Scripts.Examples import Examples
+        if exam not in Examples:
+            raise ValueError('The function of the problem cannot be sent to the workers; define it in a module (see Scripts/Examples.py).')
+        f = Examples[exam]['f']                                                     # The same function, from the registry.
+
+    regions = group_files_by_region(os.listdir(data))                               # Regions in the data folder.
+    return [{'f': f, 'v': v, 'a': a, 'b': b, 't': t, 'implicit': implicit, 'region': region, 'files': files, 'data': data, 'results': results,
+             'save': save, 'reorder': reorder, 'engine': engine, 'checkpoint': checkpoint, 'resume': resume, 'exam': exam}
+            for region, files in sorted(regions.items())]
+
+def Sweep(examples = None, data = None, schemes = ('explicit',), save = True, engine = 'dense', resume = False):
+    """
+    Sweep
+    Function to build the tasks of the example matrix: examples x data folders x schemes x regions.
+    The results of each example and folder are saved as in run_simulation, 'Results/<example>/<data>/', with a folder for each scheme if there are several.
+
+    Input:
+        examples        list            Examples of Scripts/Examples.py (Default: None, all of them).
+        data            dict            Data folders, {name: path} (Default: None, Clouds and Holes).
+        schemes         list            Schemes, 'explicit' and/or 'implicit' (Default: explicit).
+        save            Logical         Save the results (Default: True).
+        engine          String          Engine of AdvectionDiffusion.Cloud (Default: 'dense').
+        resume          Logical         Skip the finished regions (Default: False).
+
+    Output:
+        tasks           list            Tasks for the Board.
+    """
+    from Scripts.Examples import Examples
+    examples = list(Examples) if examples is None else examples
+    data     = data or {'Clouds': os.path.join('Data', 'Clouds', ''), 'Holes': os.path.join('Data', 'Holes', '')}
+
+    tasks = []
+    for exam in examples:                                                           # For each of the examples.
+        problem = Examples[exam]
+        for name, path in data.items():                                             # For each of the data folders.
+            for scheme in schemes:                                                  # For each of the schemes.
+                results = os.path.join('Results', exam, name, scheme.capitalize() if len(schemes) > 1 else '', '')
+                tasks  += Tasks(problem['f'], problem['v'], problem['a'], problem['b'], problem['t'], scheme == 'implicit', path, results,
+                                save = save, engine = engine, resume = resume, exam = exam)
+    return tasks
+
+def manager_class(board = None):
+    """
+    manager_class
+    Manager that shares the Board (a new class, so each coordinator registers its own board).
+    """
+    class Manager(BaseManager):
+        pass
+    if board is None:
+        Manager.register('board')                                                   # Client side.
+    else:
+        Manager.register('board', callable = lambda: board)                         # Server side.
+    return Manager
+
+def Serve(tasks, host = '127.0.0.1', port = 50000, authkey = None, lease = 300, retries = 2, poll = 1, linger = None, verbose = True):
+    """
+    Serve
+    Function to run the coordinator: serve the tasks until all of them have a result.
+    Without a key (authkey or $GFD_AUTHKEY) the coordinator only listens on a loopback address, with a random key that is printed and set in $GFD_AUTHKEY for the processes it starts.
+
+    Input:
+        tasks           list            Tasks (from Tasks or Sweep).
+        host            String          Address to listen on ('0.0.0.0' for all the interfaces; Default: localhost).
+        port            int             Port (Default: 50000; 0 chooses a free port).
+        authkey         bytes           Key shared with the workers (Default: None, $GFD_AUTHKEY).
+        lease           Real            Seconds a worker can hold a task without renewing it (Default: 300).
+        retries         int             Number of times a task is given again (Default: 2).
+        poll            Real            Seconds between checks of the board (Default: 1).
+        linger          Real            Seconds to keep serving after the last result, so the workers see that there is no more work (Default: 2*poll).
+        verbose         Logical         Print the progress (Default: True).
+
+    Output:
+        results         list            [(task, result), ...]; result is {'status', 'error', 'time', 'worker', 'attempts'}.
+    """
+    authkey = Key(authkey)
+    if authkey is None:                                                             # No key was given.
+        if not Loopback(host):
+            raise ValueError(f'A key is needed to serve on {host}: use --authkey or set $GFD_AUTHKEY.')
+        authkey = secrets.token_hex(16).encode()                                    # Random key for this coordinator.
+        os.environ['GFD_AUTHKEY'] = authkey.decode()
+        if verbose:
+            print(f'Coordinator key: {authkey.decode()}')
+
+    board   = Board(tasks, lease, retries)
+    manager = manager_class(board)(address = (host, port), authkey = authkey)
+    server  = manager.get_server()
+    thread  = threading.Thread(target = server.serve_forever, daemon = True)       # The workers are served in the background.
+    thread.start()
+    if verbose:
+        print(f'Coordinator on {server.address[0]}:{server.address[1]} with {len(tasks)} tasks.')
+
+    last = None
+    while not board.finished():                                                     # Wait for the results.
+        status = board.status()
+        if verbose and status != last:
+            print(f"\t{status['finished']}/{status['total']} finished, {status['leased']} running, {status['pending']} pending.")
+            last = status
+        time.sleep(poll)
+    time.sleep(2*poll if linger is None else linger)                                # Let the workers see the end.
+    server.stop_event.set()
+    thread.join()                                                                   # The server stops within a second.
+
+    results = board.summary()
+    if verbose:
+        failed = sum(result['status'] != 'done' for _, result in results)
+        print(f'All the tasks finished ({failed} failed).')
+    return results
+
+def Work(host = '127.0.0.1', port = 50000, authkey = None, name = None, wait = 5, verbose = True):
+    """
+    Work
+    Function to run a worker: lease tasks from the coordinator, run them and report the results, until there is no more work.
+    While a task runs, a thread renews its lease.
+
+    Input:
+        host            String          Address of the coordinator.
+        port            int             Port of the coordinator.
+        authkey         bytes           Key shared with the coordinator (Default: None, $GFD_AUTHKEY).
+        name            String          Name of the worker (Default: host name and process id).
+        wait            Real            Seconds to wait when all the tasks are leased to other workers (Default: 5).
+
+    Output:
+        done            int             Number of tasks run by the worker.
+    """
+    authkey = Key(authkey)
+    if authkey is None:
+        raise ValueError('The key of the coordinator is needed: use --authkey or set $GFD_AUTHKEY.')
+    name    = name or f'{socket.gethostname()}:{os.getpid()}'
+    manager = manager_class()(address = (host, port), authkey = authkey)
+    try:
+        manager.connect()
+    except (ConnectionError, OSError):
+        if verbose:
+            print(f'{name}: no coordinator on {host}:{port}.')
+        return 0
+    board = manager.board()
+
+    done = 0
+    while True:
+        try:
+            job = board.take(name)
+            if job is None:                                                         # No pending task now.
+                if board.finished():
+                    break
+                time.sleep(wait)                                                    # Another worker may fail.
+                continue
+        except (EOFError, ConnectionError, OSError):                                # The coordinator finished.
+            break
+
+        i, task, lease = job
+        if verbose:
+            print(f"{name}: task {i}, {task.get('exam')} {task['region']} ({task['data']}).")
+        stop  = threading.Event()
+        renew = threading.Thread(target = renewer, args = (host, port, authkey, name, i, lease, stop), daemon = True)
+        renew.start()                                                               # Keep the lease while the task runs.
+        try:
+            result = run_task(task)
+        except Exception as error:                                                  # The task failed on this worker.
+            result = {'status': 'failed', 'error': repr(error), 'time': None}
+        finally:
+            stop.set()
+            renew.join()
+        try:
+            board.report(name, i, {**result, 'worker': name})
+        except (EOFError, ConnectionError, OSError):
+            break
+        done += 1
+
+    return done
+
+def renewer(host, port, authkey, name, i, lease, stop):
+    """
+    renewer
+    Thread that renews the lease of a task, with its own connection to the coordinator.
+    """
+    manager = manager_class()(address = (host, port), authkey = authkey)
+    manager.connect()
+    board   = manager.board()
+    while not stop.wait(lease/3):
+        if not board.renew(name, i):                                                # The task was given to another worker.
+            return
+
+def main(argv = None):
+    """
+    main
+    Command line entry point: 'serve' the example matrix or 'work' for a coordinator.
+    """
+    parser = argparse.ArgumentParser(description = 'Distributed execution of the examples.')
+    parser.add_argument('mode', choices = ['serve', 'work'])
+    parser.add_argument('--host', default = '127.0.0.1', help = "Address of the coordinator ('0.0.0.0' to serve all the interfaces).")
+    parser.add_argument('--port', type = int, default = 50000)
+    parser.add_argument('--authkey', default = None, help = 'Key shared by the coordinator and the workers (Default: $GFD_AUTHKEY).')
+    parser.add_argument('-s', '--scenario', action = 'append', help = 'Example from Scripts/Examples.py (can be repeated; default: all).')
+    parser.add_argument('-d', '--data', action = 'append', help = 'Data folder as NAME=PATH, or Clouds or Holes (can be repeated).')
+    parser.add_argument('--scheme', action = 'append', choices = ['explicit', 'implicit'], help = 'Time-stepping scheme (can be repeated).')
+    parser.add_argument('--engine', default = 'dense', choices = ['auto', 'dense', 'ellpack', 'sparse'])
+    parser.add_argument('--no-save', dest = 'save', action = 'store_false')
+    parser.add_argument('--resume', action = 'store_true', help = 'Skip the regions with finished results.')
+    parser.add_argument('--lease', type = float, default = 300, help = 'Seconds a worker can hold a task without renewing it.')
+    parser.add_argument('--retries', type = int, default = 2)
+    args    = parser.parse_args(argv)
+    authkey = Key(args.authkey)
+    os.environ['MPLBACKEND'] = 'Agg'                                                # No display is needed.
+
+    if args.mode == 'work':
+        return Work(args.host, args.port, authkey)
+
+    data = None
+    if args.data:
+        data = {}
+        for folder in args.data:
+            name, _, path = folder.partition('=')
+            data[name] = path or os.path.join('Data', name, '')
+    tasks = Sweep(args.scenario, data, args.scheme or ['explicit'], args.save, args.engine, args.resume)
+    return Serve(tasks, args.host, args.port, authkey, args.lease, args.retries)
+
+if __name__ == '__main__':
+    main()
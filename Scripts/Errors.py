@@ -13,11 +13,13 @@ Date:
     July, 2023.
 
 Last Modification:
-    October, 2023.
+    October, 2026.
 """
 
 ## Library importation.
+import os
 import numpy as np
+import Scripts.Neighbors as Neighbors
 
 def PolyArea(x,y):
     """
@@ -35,11 +37,132 @@ def PolyArea(x,y):
     area = 0.5*np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))          # Compute the area of the element.
     return area
 
+def Areas(p, vec):
+    """
+    Areas
+    Function to compute the area associated to each node: the area of the polygon defined by its immediate neighbors (see PolyArea).
+    The areas of all the nodes are computed at once.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node (or a Neighbors.NeighborGraph).
+
+    Output:
+        area        m x 1           Array           Area of each node.
+    """
+
+    if isinstance(vec, Neighbors.NeighborGraph):                                    # Neighbors in CSR form.
+        rows = np.repeat(np.arange(vec.m), vec.counts)                              # Node of each vertex.
+        pos  = np.arange(len(vec.indices))
+        prev = np.where(pos == vec.indptr[rows], vec.indptr[rows + 1] - 1, pos - 1) # Previous vertex of the polygon (np.roll).
+        x, y = p[vec.indices, 0], p[vec.indices, 1]                                 # Coordinates of the vertices.
+        cros = x*y[prev] - y*x[prev]
+        return 0.5*np.abs(np.bincount(rows, weights = cros, minlength = vec.m))     # Shoelace formula.
+    vec  = np.asarray(vec).astype(int)
+    n    = np.sum(vec != -1, axis = 1)                                              # The number of neighbors of each node.
+    j    = np.arange(vec.shape[1])
+    prev = np.where(j == 0, n[:, None] - 1, j - 1)                                  # Previous vertex of the polygon (np.roll).
+    x, y = p[vec, 0], p[vec, 1]                                                     # Coordinates of the vertices.
+    xp   = np.take_along_axis(x, prev, axis = 1)
+    yp   = np.take_along_axis(y, prev, axis = 1)
+    cros = np.where(j < n[:, None], x*yp - y*xp, 0)                                 # Only the vertices of the polygon.
+    area = 0.5*np.abs(np.sum(cros, axis = 1))                                       # Shoelace formula.
+    return area
+
+class Accumulator:
+    """
+    Accumulator
+
+    Error of a problem that depends on time, computed as the solutions are given.
+    The area of each node is computed once; then the computed and theoretical solutions are added one time step or one block of time steps at a time (for example, from files on disk), so only O(m) values are kept in memory.
+    The errors of the time steps added so far, and their aggregates, can be asked at any point.
+
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        area        m x 1           Array           Area of each node (Default: None, computed from p and vec).
+    """
+
+    def __init__(self, p = None, vec = None, area = None):
+        self.area = Areas(p, vec) if area is None else np.asarray(area)             # Area of each node.
+        self.mse  = []                                                              # Weighted mean square error of each time step.
+        self.inf  = []                                                              # Maximum error of each time step.
+        self.norm = []                                                              # Weighted mean square of the theoretical solution.
+
+    def add(self, u_ap, u_ex):
+        """
+        Add a time step (m values) or a block of time steps (m x k values) of the computed and theoretical solutions.
+        """
+        u_ap = np.asarray(u_ap, dtype = np.float64)
+        u_ex = np.asarray(u_ex, dtype = np.float64)
+        if u_ap.ndim == 1:                                                          # A single time step.
+            u_ap, u_ex = u_ap[:, None], u_ex[:, None]
+        d = u_ap - u_ex
+        self.mse.extend(np.mean(np.square(d)*self.area[:, None], axis = 0))         # Mean square error.
+        self.inf.extend(np.max(np.abs(d), axis = 0))                                # Maximum error.
+        self.norm.extend(np.mean(np.square(u_ex)*self.area[:, None], axis = 0))     # Size of the theoretical solution.
+        return self
+
+    def extend(self, u_ap, u_ex, block = 256):
+        """
+        Add all the time steps of m x t arrays (in RAM or memory-mapped), reading 'block' time steps at a time.
+        """
+        for k in np.arange(0, u_ap.shape[1], block):
+            self.add(u_ap[:, k:k + block], u_ex[:, k:k + block])
+        return self
+
+    def steps(self):
+        """
+        Errors of each of the time steps added so far.
+
+        Output:
+            errors      dict            Dictionary with t x 1 Arrays:
+                                            'l2':       Square root of the weighted mean square error (Errors.Cloud).
+                                            'linf':     Maximum absolute error.
+                                            'relative': 'l2' divided by the same norm of the theoretical solution.
+        """
+        mse, norm = np.array(self.mse), np.array(self.norm)
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            relative = np.sqrt(mse/norm)
+        return {'l2': np.sqrt(mse), 'linf': np.array(self.inf), 'relative': relative}
+
+    def summary(self):
+        """
+        Aggregate errors of the time steps added so far.
+
+        Output:
+            errors      dict            Dictionary with:
+                                            'mean':     Mean of the 'l2' error of the time steps (the value saved by the runners).
+                                            'l2':       Square root of the mean square error over space and time.
+                                            'linf':     Maximum absolute error.
+                                            'relative': 'l2' divided by the same norm of the theoretical solution.
+                                            'steps':    Number of time steps added.
+        """
+        if not self.mse:
+            return {'mean': np.nan, 'l2': np.nan, 'linf': np.nan, 'relative': np.nan, 'steps': 0}
+        mse, norm = np.mean(self.mse), np.mean(self.norm)
+        return {'mean': np.mean(np.sqrt(self.mse)), 'l2': np.sqrt(mse), 'linf': np.max(self.inf),
+                'relative': np.sqrt(mse/norm) if norm > 0 else np.inf, 'steps': len(self.mse)}
+
+def Stored(p, vec, folder, block = 256):
+    """
+    Stored
+    Function to compute the errors of a run whose solutions are stored on disk as 'u_ap.npy' and 'u_ex.npy' (see Planner.History).
+    The files are memory-mapped and read by blocks of time steps.
+
+    Output:
+        errors      Accumulator     Errors of all the time steps.
+    """
+    u_ap = np.load(os.path.join(folder, 'u_ap.npy'), mmap_mode = 'r')               # Computed solution.
+    u_ex = np.load(os.path.join(folder, 'u_ex.npy'), mmap_mode = 'r')               # Theoretical solution.
+    return Accumulator(p, vec).extend(u_ap, u_ex, block)
+
 def Cloud(p, vec, u_ap, u_ex):
     """
     Cloud
     Function to compute the error in a triangulation or an unstructured cloud of points for a problem that depends on time.
     The polygon used to calculate the area is the one defined by all the immediate neighbors of the central node.
+    The solutions are read by blocks of time steps (see Accumulator), so they can be memory-mapped arrays.
     
     Input:
         p           m x 2           Array           Array with the coordinates of the nodes.
@@ -51,24 +174,7 @@ def Cloud(p, vec, u_ap, u_ex):
         er          t x 1           Array           Mean square error computed on each time step.
     """
 
-    ## Variable initialization.
-    m, t = p.shape[0], u_ap.shape[1]                                                # The size of the region.
-    er   = np.zeros(t)                                                              # er initialization with zeros.
-    area = np.zeros(m)                                                              # area initialization with zeros.
-
-    ## Area computation for each node.
-    for i in np.arange(m):
-        nvec     = sum(vec[i,:] != -1)                                              # The number of neighbors of the central node.
-        polix    = np.zeros([nvec])                                                 # The x-values of the polygon are stored.
-        poliy    = np.zeros([nvec])                                                 # The y-values of the polygon are stored.
-        nindex   = vec[i, :nvec].astype(int)                                        # Indices of the neighbors.
-        polix[:] = p[nindex, 0]                                                     # The x coordinate of the node is stored.
-        poliy[:] = p[nindex, 1]                                                     # The y coordinate of the node is stored.
-        area[i]  = PolyArea(polix, poliy)                                           # Area computation.
-
     ## Error computation.
-    for k in np.arange(t):                                                          # For each time step.
-        err   = np.square(u_ap[:, k] - u_ex[:, k])*area                             # Mean square error computation.
-        er[k] = np.sqrt(np.mean(err))                                               # The square root is computed.
+    er = Accumulator(p, vec).extend(u_ap, u_ex).steps()['l2']                       # Mean square error of each time step, by blocks.
     
-    return er
\ No newline at end of file
+    return er
@@ -0,0 +1,53 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+
+## Functions for the problems (the same ones used in Example_1.py to Example_7.py).
+def f1(x, y, t, v, a, b):
+    return (1/(4*t + 1))*np.exp(-(x - a*t - 0.5)**2/(v*(4*t + 1)) - (y - b*t-0.5)**2/(v*(4*t + 1)))
+
+def f2(x, y, t, v, a, b):
+    return np.exp(-((x - a*t)**2 + (y - b*t)**2)/(4*v*t + 1))/(4*np.pi*v*t + 1)
+
+def f3(x, y, t, v, a, b):
+    return np.sin(np.pi*(x - a*t))*np.sin(np.pi*(y - b*t))*np.exp(-v*t)
+
+def f4(x, y, t, v, a, b):
+    return np.where((x - a*t > 0.2) & (x - a*t < 0.8) & (y - b*t > 0.2) & (y - b*t < 0.8), 1, 0)
+
+def f5(x, y, t, v, a, b):
+    return np.exp(-((x - a*t)**2 + (y - b*t)**2) / (4*v*t + 1)) * (x**2 + y**2 <= 0.25)
+
+def f6(x, y, t, v, a, b):
+    return np.exp(-100 * ((x - 0.5 - a*t)**2 + (y - 0.5 - b*t)**2)) * np.exp(-v*t)
+
+def f7(x, y, t, v, a, b):
+    return np.heaviside(0.5 - (x - a*t), 1) * np.heaviside(0.5 - (y - b*t), 1)
+
+## Problem parameters for each example.
+Examples = {
+    'Example 1': {'f': f1, 'v': 0.1,   'a': 0.3, 'b': 0.2, 't': 2000},
+    'Example 2': {'f': f2, 'v': 0.01,  'a': 0.1, 'b': 0.1, 't': 2000},
+    'Example 3': {'f': f3, 'v': 0.02,  'a': 0.5, 'b': 0.5, 't': 2000},
+    'Example 4': {'f': f4, 'v': 0.01,  'a': 0.2, 'b': 0.2, 't': 2000},
+    'Example 5': {'f': f5, 'v': 0.05,  'a': 0,   'b': 0,   't': 2000},
+    'Example 6': {'f': f6, 'v': 0.03,  'a': 0.3, 'b': 0.3, 't': 2000},
+    'Example 7': {'f': f7, 'v': 0.001, 'a': 0.4, 'b': 0.4, 't': 2000},
+}
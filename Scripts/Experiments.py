@@ -0,0 +1,330 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import re
+import json
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Errors as Errors
+import Scripts.Stencil as Stencil
+import Scripts.Output as Output
+import Scripts.Mesh as Mesh
+from Scripts.Examples import Examples
+import AdvectionDiffusion
+
+## Default values of the configuration.
+Defaults = {
+    'scenarios':     list(Examples),                                                # Names of the examples (or dictionaries, see Load).
+    'data':          {'Clouds': 'Data/Clouds/', 'Holes': 'Data/Holes/'},            # Folders with the clouds of points.
+    'regions':       None,                                                          # Regions to use (None: all the regions in the folders).
+    'schemes':       {'explicit': {'implicit': False}},                             # Time-stepping schemes.
+    'engine':        'ellpack',                                                     # Engine for the explicit schemes ('auto' uses Scripts/Planner.py).
+    'interior':      False,                                                         # Advance only the inner nodes (boundary lifting).
+    'triangulation': False,                                                         # Neighbors like in a triangulation?
+    't':             None,                                                          # Number of time steps (None: the one of each example).
+    'save':          True,                                                          # Save the results of each task.
+    'n_jobs':        -1,                                                            # Number of worker processes (-1 uses all processors).
+    'results':       None,                                                          # Folder of each task (None: as in run_simulation).
+    'summary':       'Results/Experiments.csv',                                     # File with the errors of all the tasks.
+}
+
+def Load(path):
+    """
+    Load
+    Function to read the configuration of an experiment matrix from a JSON file.
+    Missing keys take the values in Defaults.
+
+    The scenarios are names of the problems in Scripts/Examples.py, or dictionaries with a 'name', the 'example' they are based on and the parameters that change ('v', 'a', 'b' or 't').
+    The schemes are a dictionary {name: {'implicit': bool, 'lam': float, 'engine': str}}; implicit schemes use the 'dense' engine and lam = 0.1 unless they say otherwise.
+    The folder of each task is given by 'results' with the fields {scenario}, {data}, {scheme} and {region}.
+
+    Input:
+        path            string          Path of the JSON file.
+
+    Output:
+        config          dict            Configuration of the experiment matrix.
+    """
+
+    with open(path) as file:
+        config = json.load(file)                                                    # Read the configuration.
+    unknown = set(config) - set(Defaults)
+    if unknown:
+        raise ValueError(f'Unknown configuration keys: {sorted(unknown)}')
+
+    return {**Defaults, **config}
+
+def Tasks(config):
+    """
+    Tasks
+    Function to build the task graph of an experiment matrix.
+    There is one geometry task for each region and one solve task for each scenario, region and scheme; every solve task depends on the geometry task of its region.
+
+    Input:
+        config          dict            Configuration of the experiment matrix.
+
+    Output:
+        regions         dict            Geometry tasks: {(data, region): (data path, files of the region)}.
+        tasks           dict            Solve tasks of each region: {(data, region): [task, ...]}.
+    """
+
+    ## Scenarios.
+    scenarios = []
+    for scenario in config['scenarios']:                                            # For each of the scenarios.
+        if isinstance(scenario, str):                                               # An example from the registry.
+            scenario = {'name': scenario, 'example': scenario}
+        if scenario.get('example') not in Examples:
+            raise ValueError(f"Unknown example: {scenario.get('example')}")
+        problem = {**Examples[scenario['example']], **{k: scenario[k] for k in ('v', 'a', 'b', 't') if k in scenario}}
+        if config['t'] is not None:                                                 # The same number of time steps for all.
+            problem['t'] = config['t']
+        scenarios.append((scenario.get('name', scenario['example']), problem))
+
+    ## Schemes.
+    schemes = []
+    for name, scheme in config['schemes'].items():                                  # For each of the schemes.
+        implicit = scheme.get('implicit', False)
+        engine   = scheme.get('engine', 'dense' if implicit else config['engine'])
+        schemes.append((name, implicit, scheme.get('lam', 0.1), engine))
+
+    results = config['results']                                                     # Folder of each task.
+    if results is None:
+        results = os.path.join('Results', '{scenario}', '{data}', '{scheme}' if len(schemes) > 1 else '', '{region}')
+
+    ## Regions.
+    pattern = re.compile(r'^(.*?)(_p\.csv|_tt\.csv)$')
+    regions = {}
+    tasks   = {}
+    for data, data_path in config['data'].items():                                  # For each of the folders.
+        for file in sorted(os.listdir(data_path)):                                  # For each of the files.
+            match = pattern.match(file)
+            if not match:
+                continue
+            region, suffix = match.groups()
+            if config['regions'] is not None and region not in config['regions']:
+                continue
+            regions.setdefault((data, region), (data_path, {}))[1][suffix] = file   # Add the file to the region.
+
+    for key, (data_path, files) in regions.items():                                 # For each of the regions.
+        data, region = key
+        tasks[key] = []
+        for scenario, problem in scenarios:                                         # For each of the scenarios.
+            for scheme, implicit, lam, engine in schemes:                           # For each of the schemes.
+                folder = os.path.normpath(results.format(scenario = scenario, data = data, scheme = scheme, region = region))
+                tasks[key].append({'scenario': scenario, 'data': data, 'region': region, 'scheme': scheme, 'folder': folder,
+                                   'implicit': implicit, 'lam': lam, 'engine': engine, 'triangulation': config['triangulation'],
+                                   'interior': config['interior'], 'save': config['save'], **problem})
+
+    folders = [task['folder'] for key in tasks for task in tasks[key]]
+    if len(set(folders)) != len(folders):                                           # Two tasks would write in the same folder.
+        raise ValueError("The 'results' folders of the tasks are not unique.")
+
+    return regions, tasks
+
+def Geometry(data_path, files, triangulation = False, nvec = 8):
+    """
+    Geometry
+    Function to load a region and compute the parts of the problem that depend only on the nodes: the neighbors and the derivative stencils.
+
+    Input:
+        data_path       string          Folder with the cloud of points.
+        files           dict            Files of the region ('_p.csv' and optionally '_tt.csv', see Mesh.Load).
+        triangulation   Logical         Select whether or not the neighbors are taken from the triangulation.
+        nvec            int             Maximum number of neighbors (Default: 8).
+
+    Output:
+        geometry        dict            Dictionary with 'p', 'tt', 'vec' and 'D'.
+    """
+
+    p, tt = Mesh.Load(data_path, files)                                             # Load the points and the triangles.
+
+    if triangulation == True:                                                       # If the neighbors come from the triangles.
+        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
+    else:
+        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
+    D = Gammas.Derivatives(p, vec)                                                  # Derivative stencils.
+
+    return {'p': p, 'tt': tt, 'vec': vec, 'D': D}
+
+def Solve(task, geometry):
+    """
+    Solve
+    Function to compute one scenario with one scheme on a region, using the geometry of the region.
+
+    Input:
+        task            dict            Task from Tasks.
+        geometry        dict            Geometry of the region from Geometry.
+
+    Output:
+        er              float           Mean of the error.
+    """
+
+    p, tt = geometry['p'], geometry['tt']
+    u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, task['f'], task['v'], task['a'], task['b'], task['t'], triangulation = task['triangulation'], tt = tt,
+                                               implicit = task['implicit'], lam = task['lam'], engine = task['engine'], interior = task['interior'], geometry = geometry)
+                                                                                    # Compute the numerical solution.
+    er = Errors.Cloud(p, vec, u_ap, u_ex)                                           # Compute the error.
+
+    if task['save']:                                                                # If we are going to save.
+        Output.Solutions(u_ap, u_ex, task['folder'])                                # Save the computed and theoretical solutions.
+        Output.Render(p, tt, u_ap, task['folder'])                                  # Save the resulting graphs and video.
+        Output.Error(er, task['folder'])                                            # Save the error.
+
+    return np.mean(er)
+
+def Share(geometry):
+    """
+    Share
+    Function to copy the arrays of the geometry of a region to shared memory, so all the worker processes read the same copy.
+
+    Input:
+        geometry        dict            Geometry of the region from Geometry.
+
+    Output:
+        blocks          list            Shared memory blocks (closed and unlinked by the caller when the tasks are done).
+        shared          dict            Name, shape and type of the block of each array, to be given to Attach.
+    """
+
+    blocks, shared = [], {}
+    for key, value in geometry.items():                                             # For each of the arrays.
+        value = np.ascontiguousarray(value)
+        shm   = shared_memory.SharedMemory(create = True, size = max(value.nbytes, 1))
+        np.ndarray(value.shape, dtype = value.dtype, buffer = shm.buf)[...] = value # Copy the array.
+        blocks.append(shm)
+        shared[key] = (shm.name, value.shape, value.dtype.str)
+    return blocks, shared
+
+## Geometry attached by this worker process: (names of the blocks, blocks, geometry).
+Attached = [None, [], None]
+
+def Attach(shared):
+    """
+    Attach
+    Function to get the geometry of a region from the shared memory blocks of Share.
+    The blocks are attached once per worker and kept while the tasks are of the same region; the arrays are read-only views.
+    """
+
+    names = tuple(name for name, _, _ in shared.values())
+    if Attached[0] != names:                                                        # A new region.
+        for shm in Attached[1]:                                                     # Release the previous one.
+            shm.close()
+        Attached[:] = [None, [], None]
+        geometry = {}
+        for key, (name, shape, dtype) in shared.items():
+            shm = shared_memory.SharedMemory(name = name)
+            Attached[1].append(shm)
+            geometry[key] = np.ndarray(shape, dtype = dtype, buffer = shm.buf)
+            geometry[key].flags.writeable = False
+        Attached[0], Attached[2] = names, geometry
+    return Attached[2]
+
+def Solve_Shared(task, shared):
+    """
+    Solve_Shared
+    Function to compute one task in a worker process with the geometry in shared memory (see Share and Solve).
+    """
+    return Solve(task, Attach(shared))
+
+def worker_init(threads):
+    """
+    worker_init
+    Share the processors among the workers of the pool.
+    """
+    if Stencil.load_kernels() is not None:                                          # If Numba is available.
+        Stencil.numba.set_num_threads(threads)
+
+def Run(config, n_jobs = None):
+    """
+    Run
+    Function to run an experiment matrix.
+
+    The geometry of each region is computed once and given to all the scenarios and schemes that use the region.
+    Geometry and solve tasks are dispatched to a pool of worker processes; the solve tasks of a region are submitted as soon as its geometry is ready.
+    The geometry is copied to shared memory (see Share), so the tasks only carry the names of the blocks and each worker maps the region once.
+
+    Input:
+        config          dict or string  Configuration of the experiment matrix, or the path of its JSON file.
+        n_jobs          int             Number of worker processes (Default: None, the one in the configuration).
+                                            1: Run all the tasks in this process.
+
+    Output:
+        summary         list            List with one row for each task: [scenario, data, region, scheme, mean error].
+    """
+
+    if isinstance(config, str):
+        config = Load(config)
+    else:
+        config = {**Defaults, **config}
+    regions, tasks = Tasks(config)
+
+    n_jobs = config['n_jobs'] if n_jobs is None else n_jobs
+    if n_jobs < 1:
+        n_jobs = os.cpu_count()                                                     # Use all the processors.
+    summary = []
+
+    def done(task, er):
+        print(f"{task['scenario']}\t{task['data']}\t{task['region']}\t{task['scheme']}\tError: {er}")
+        summary.append([task['scenario'], task['data'], task['region'], task['scheme'], er])
+
+    if n_jobs == 1:                                                                 # Serial execution.
+        for key, (data_path, files) in regions.items():                             # For each of the regions.
+            geometry = Geometry(data_path, files, config['triangulation'])          # Geometry of the region.
+            for task in tasks[key]:                                                 # For each of the tasks of the region.
+                done(task, Solve(task, geometry))
+    else:                                                                           # Worker pool.
+        threads = max(1, (os.cpu_count() or 1)//n_jobs)
+        ctx     = mp.get_context('forkserver')                                      # Fresh processes, safe after using threaded kernels.
+        with ProcessPoolExecutor(n_jobs, mp_context = ctx, initializer = worker_init, initargs = (threads,)) as pool:
+            pending = {pool.submit(Geometry, data_path, files, config['triangulation']): key for key, (data_path, files) in regions.items()}
+            solves  = {}
+            blocks  = {}                                                            # Shared memory and number of tasks left of each region.
+            try:
+                for future in as_completed(pending):                                # When the geometry of a region is ready.
+                    key            = pending[future]
+                    shm, shared    = Share(future.result())                         # Geometry in shared memory.
+                    blocks[key]    = [shm, len(tasks[key])]
+                    for task in tasks[key]:                                         # Submit the tasks of the region.
+                        solves[pool.submit(Solve_Shared, task, shared)] = (key, task)
+                for future in as_completed(solves):                                 # Collect the results.
+                    key, task = solves[future]
+                    done(task, future.result())
+                    blocks[key][1] -= 1
+                    if blocks[key][1] == 0:                                         # The region is not needed anymore.
+                        for shm in blocks.pop(key)[0]:
+                            shm.close()
+                            shm.unlink()
+            finally:
+                for shm, _ in blocks.values():                                      # Blocks of unfinished regions.
+                    for block in shm:
+                        block.close()
+                        block.unlink()
+
+    summary.sort(key = lambda row: row[:4])
+    if config['save'] and config['summary']:                                        # If we are going to save.
+        os.makedirs(os.path.dirname(config['summary']) or '.', exist_ok = True)     # Ensure the directory exists.
+        with open(config['summary'], 'w') as file:                                  # Create the file.
+            file.write('Scenario,Data,Region,Scheme,Error\n')
+            for row in summary:
+                file.write('%s,%s,%s,%s,%.8e\n' % tuple(row))                       # Save the errors.
+
+    return summary
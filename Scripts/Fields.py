@@ -0,0 +1,99 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+
+## The coefficients of the problem (v, a and b) can be given as:
+##  Real:       The same value on all the nodes and time steps.
+##  ndarray:    One value for each node (m values, in the same order than p).
+##  Function:   c(x, y, t), evaluated on the nodes at each time.
+
+def Varying(*coefficients):
+    """
+    Varying
+    Function to check whether any of the coefficients changes in time.
+    """
+    return any(callable(c) for c in coefficients)
+
+def Constant(*coefficients):
+    """
+    Constant
+    Function to check whether all the coefficients are the same on all the nodes and time steps.
+    """
+    return not any(callable(c) or np.ndim(c) > 0 for c in coefficients)
+
+def Evaluate(c, p, t, rows = None):
+    """
+    Evaluate
+    Function to evaluate a coefficient on the nodes.
+
+    Input:
+        c               Function        Coefficient (a Real, an Array with one value per node or a Function c(x, y, t)).
+        p               ndarray         Array with the coordinates of the nodes.
+        t               Real            Time.
+        rows            ndarray         Nodes to evaluate (Default: None, all the nodes).
+
+    Output:
+        c               ndarray         Value of the coefficient (a Real if it is the same on all the nodes).
+    """
+
+    if callable(c):                                                                 # Field given as a function.
+        x, y = (p[:, 0], p[:, 1]) if rows is None else (p[rows, 0], p[rows, 1])
+        return np.broadcast_to(np.asarray(c(x, y, t), dtype = float), x.shape)
+    if np.ndim(c) > 0:                                                              # One value for each node.
+        c = np.asarray(c, dtype = float)
+        return c if rows is None else c[rows]
+    return c
+
+def Permute(c, perm):
+    """
+    Permute
+    Function to reorder a coefficient given on the nodes.
+    """
+    if perm is None or callable(c) or np.ndim(c) == 0:
+        return c
+    return np.asarray(c)[perm]
+
+def Values(p, t, v, a, b, rows = None):
+    """
+    Values
+    Function to evaluate the coefficients v, a and b on the nodes at time t (see Evaluate).
+    """
+    return tuple(Evaluate(c, p, t, rows) for c in (v, a, b))
+
+def Operator(p, t, v, a, b):
+    """
+    Operator
+    Function to build the values of the differential operator, L = [-a, -b, 2v, 0, 2v], at time t.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes.
+        t               Real            Time.
+        v               Function        Diffusion coefficient.
+        a               Function        Transport velocity on the x direction.
+        b               Function        Transport velocity on the y direction.
+
+    Output:
+        L               ndarray         5 x 1 Array with the values of the operator, or m x 5 if the coefficients vary on the nodes.
+    """
+
+    v, a, b = Values(p, t, v, a, b)
+    if Constant(v, a, b):                                                           # The same operator for all the nodes.
+        return np.vstack([[-a], [-b], [2*v], [0], [2*v]])
+    return np.stack(np.broadcast_arrays(-a, -b, 2*v, 0*v, 2*v), axis = 1)           # One operator for each node.
@@ -13,22 +13,23 @@ Date:
     July, 2023.
 
 Last Modification:
-    October, 2023.
+    October, 2026.
 """
 
 import numpy as np
-from joblib import Parallel, delayed
+import Scripts.Neighbors as Neighbors
 
-def compute_gamma_for_node(i, p, vec, L):
+def compute_gamma_for_node(i, p, vec, L, count = None):
     """
     Compute the gamma values for a single node and update the corresponding row in K matrix.
+    The number of neighbors of the node can be given in count.
     """
     nvec = len(vec[0, :])                                                           # The maximum number of neighbors.
     m = len(p[:, 0])                                                                # The number of nodes in x.
     K_row = np.zeros(m)                                                             # K initialization with zeros.
 
     if p[i, 2] == 0:                                                                # If the node is an inner node.
-        nvec = sum(vec[i, :] != -1)                                                 # The total number of neighbors of the node.
+        nvec = sum(vec[i, :] != -1) if count is None else count                     # The total number of neighbors of the node.
         dx = np.zeros([nvec])                                                       # dx initialization with zeros.
         dy = np.zeros([nvec])                                                       # dy initialization with zeros.
         for j in np.arange(nvec):                                                   # For each of the neighbor nodes.
@@ -58,7 +59,7 @@ def Cloud(p, vec, L, n_jobs=-1):
     
     Input:
         p           Array           Array with the coordinates of the nodes and a flag for the boundary.
-        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
         L           Array           Array with the values of the differential operator.
         n_jobs      int             Number of jobs to run in parallel (-1 uses all processors).
     
@@ -66,12 +67,211 @@ def Cloud(p, vec, L, n_jobs=-1):
         K           Array           K Matrix with the computed Gammas.
     """
 
-    m = len(p[:, 0])                                                                # The total number of nodes.
+    m      = len(p[:, 0])                                                           # The total number of nodes.
+    if isinstance(vec, Neighbors.NeighborGraph):                                    # The number of neighbors of each node.
+        counts = vec.counts
+    else:
+        counts = np.sum(vec != -1, axis = 1)
+    vec    = Neighbors.Padded(vec)                                                  # Padded array of neighbors for each row.
     
     # Parallel computation of each row of K using Joblib
-    K_rows = Parallel(n_jobs=n_jobs)(delayed(compute_gamma_for_node)(i, p, vec, L) for i in range(m))
+    from joblib import Parallel, delayed                                            # Parallel backend, imported when needed.
+    K_rows = Parallel(n_jobs=n_jobs)(delayed(compute_gamma_for_node)(i, p, vec, L, counts[i]) for i in range(m))
     
     # Combine the rows to form the full matrix K
     K = np.vstack(K_rows)
     
-    return K
\ No newline at end of file
+    return K
+
+def Derivatives(p, vec, rows = None):
+    """
+    2D Clouds of Points Derivative Stencils.
+
+    This function computes, for each inner node, the pseudoinverse of the matrix M of its local least-squares problem.
+    These stencils depend only on the geometry of the cloud: the Gammas for any operator L are given by the stencils times L, so they can be computed once and shared by problems with different coefficients.
+    Empty neighbor slots (-1) and boundary nodes produce zero stencils.
+    With a Neighbors.NeighborGraph the neighbors are read from indptr and indices, and the nodes with the same number of neighbors are solved together, each one with exactly its neighbors.
+
+    Input:
+        p           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
+        rows        Array           Indices of the nodes to be computed (Default: None, all the nodes).
+
+    Output:
+        D           Array           len(rows) x nvec x 5 Array with the derivative stencils of each node.
+    """
+
+    if rows is None:                                                                # If no rows are given.
+        rows = np.arange(len(p[:, 0]))                                              # All the nodes are computed.
+    rows   = np.asarray(rows, dtype = int)
+    inne_n = p[rows, 2] == 0                                                        # Inner nodes.
+    if isinstance(vec, Neighbors.NeighborGraph):                                    # Neighbors in CSR form.
+        return Derivatives_Graph(p, vec, rows, inne_n)
+    nvec   = vec.shape[1]                                                           # The maximum number of neighbors.
+    D      = np.zeros([len(rows), nvec, 5])                                         # D initialization with zeros.
+
+    ri    = rows[inne_n]                                                            # Indices of the inner nodes.
+    valid = vec[ri] != -1                                                           # Slots with a neighbor.
+    idx   = np.where(valid, vec[ri], ri[:, None])                                   # Neighbors of the inner nodes.
+    dx    = np.where(valid, p[idx, 0] - p[ri, 0:1], 0)                              # dx is computed.
+    dy    = np.where(valid, p[idx, 1] - p[ri, 1:2], 0)                              # dy is computed.
+    M     = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis = 1)                       # M matrices are assembled.
+    D[inne_n] = np.linalg.pinv(M)                                                   # The pseudoinverse of the matrices M.
+
+    return D
+
+def Derivatives_Graph(p, graph, rows, inne_n):
+    """
+    Derivatives_Graph
+    Function to compute the derivative stencils of Derivatives from a Neighbors.NeighborGraph.
+    The nodes are grouped by their number of neighbors, so each least-squares problem has exactly the neighbors of its node; the stencils are stored in the order of the graph.
+    """
+
+    counts = graph.counts
+    D      = np.zeros([len(rows), int(np.max(counts, initial = 0)), 5])             # D initialization with zeros.
+    ri     = np.where(inne_n)[0]                                                    # Positions of the inner nodes.
+    for c in np.unique(counts[rows[ri]]):                                           # For each number of neighbors.
+        k   = ri[counts[rows[ri]] == c]
+        i   = rows[k]
+        idx = graph.indices[graph.indptr[i][:, None] + np.arange(c)]                # Neighbors of the nodes.
+        dx  = p[idx, 0] - p[i, 0:1]                                                 # dx is computed.
+        dy  = p[idx, 1] - p[i, 1:2]                                                 # dy is computed.
+        M   = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis = 1)                     # M matrices are assembled.
+        D[k, :c] = np.linalg.pinv(M)                                                # The pseudoinverse of matrices M.
+
+    return D
+
+def Weights(p, vec, L, rows = None, D = None):
+    """
+    2D Clouds of Points Gammas Computation in a fixed-width (ELLPACK) layout.
+
+    This function computes the same Gamma values than Cloud, but instead of assembling the full K matrix it stores, for each node, the weight of the central node followed by the weights of its 'nvec' neighbors.
+    All the local least-squares problems are solved at once; empty neighbor slots (-1) produce zero weights.
+
+    Input:
+        p           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
+        L           Array           Array with the values of the differential operator (5 values, or m x 5 for one operator per node).
+        rows        Array           Indices of the nodes to be computed (Default: None, all the nodes).
+        D           Array           Derivative stencils of the nodes, from Derivatives (Default: None, computed here).
+
+    Output:
+        W           Array           len(rows) x (nvec + 1) Array with the Gammas of each node and its neighbors.
+    """
+
+    if rows is None:                                                                # If no rows are given.
+        rows = np.arange(len(p[:, 0]))                                              # All the nodes are computed.
+    rows = np.asarray(rows, dtype = int)
+    if D is None:
+        D = Derivatives(p, vec, rows)                                               # Derivative stencils.
+
+    W      = np.zeros([len(rows), D.shape[1] + 1])                                  # W initialization with zeros.
+    boun_n = p[rows, 2] != 0                                                        # Boundary nodes.
+    if np.size(L) == 5:                                                             # The same operator for all the nodes.
+        YY = D@np.reshape(L, 5)                                                     # M*L computation for all the nodes.
+    else:                                                                           # One operator for each node.
+        YY = np.einsum('ijk,ik->ij', D, np.reshape(L, (-1, 5))[rows])               # M*L computation for all the nodes.
+    W[:, 0]      = -np.sum(YY, axis = 1)                                            # The corresponding Gamma for the central node.
+    W[:, 1:]     = YY                                                               # The corresponding Gamma for the neighbor nodes.
+    W[boun_n, 0] = 1                                                                # Central node weight is equal to 1 on the boundary.
+
+    return W
+
+def Components(p, vec, D = None):
+    """
+    Components
+    Function to compute the Gammas of the first derivatives and of the Laplacian in the Weights layout.
+    The Gammas of the advection-diffusion operator with coefficients v, a and b on each node are 2*v*Glap - a*Gx - b*Gy, so they can be assembled again for new coefficients without solving the least-squares problems (see Combine).
+    Boundary rows are zero.
+
+    Input:
+        p           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
+        D           Array           Derivative stencils of the nodes, from Derivatives (Default: None, computed here).
+
+    Output:
+        C           Array           3 x m x (nvec + 1) Array with the Gammas of u_x, u_y and (u_xx + u_yy)/2.
+    """
+
+    if D is None:
+        D = Derivatives(p, vec)                                                     # Derivative stencils.
+    C           = np.zeros([3, D.shape[0], D.shape[1] + 1])                         # C initialization with zeros.
+    C[0, :, 1:] = D[:, :, 0]                                                        # u_x.
+    C[1, :, 1:] = D[:, :, 1]                                                        # u_y.
+    C[2, :, 1:] = D[:, :, 2] + D[:, :, 4]                                           # (u_xx + u_yy)/2.
+    C[:, :, 0]  = -np.sum(C[:, :, 1:], axis = 2)                                    # The corresponding Gamma for the central node.
+
+    return C
+
+def Combine(C, boun, v, a, b, out = None):
+    """
+    Combine
+    Function to assemble the Gammas of the advection-diffusion operator from the Components, with coefficients given on each node.
+    It only needs a few multiplications and additions for each stored value.
+
+    Input:
+        C           Array           Array with the Gammas of the derivatives, from Components.
+        boun        Array           Array with the flags of the boundary nodes.
+        v           Real or Array   Diffusion coefficient (one value, or one value per node).
+        a           Real or Array   Transport velocity on the x direction (one value, or one value per node).
+        b           Real or Array   Transport velocity on the y direction (one value, or one value per node).
+        out         Array           Array for the result (Default: None, a new array).
+
+    Output:
+        W           Array           Array with the Gammas of each node and its neighbors (Weights layout).
+    """
+
+    v, a, b = (np.reshape(c, (-1, 1)) if np.ndim(c) > 0 else c for c in (v, a, b))  # One value per row.
+    W = np.multiply(C[2], 2*v, out = out)                                           # Diffusion.
+    W -= a*C[0]                                                                     # Advection on the x direction.
+    W -= b*C[1]                                                                     # Advection on the y direction.
+    W[boun]    = 0
+    W[boun, 0] = 1                                                                  # Central node weight is equal to 1 on the boundary.
+
+    return W
+
+def Matrix(W, vec):
+    """
+    Matrix
+    Function to assemble the full m x m K matrix from the Gammas in the Weights layout.
+
+    Input:
+        W           Array           Array with the Gammas of each node and its neighbors.
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
+
+    Output:
+        K           Array           K Matrix with the computed Gammas.
+    """
+
+    m   = W.shape[0]                                                                # The total number of nodes.
+    K   = np.zeros([m, m])                                                          # K initialization with zeros.
+    idx = Index(vec)                                                                # Columns of the Gammas.
+    np.add.at(K, (np.repeat(np.arange(m), idx.shape[1]), idx.reshape(-1)), W.reshape(-1))
+                                                                                    # Place the Gammas in K.
+    return K
+
+def Index(vec):
+    """
+    Index
+    Function to get the column indices that match the Weights layout: the node itself followed by its neighbors.
+    Empty neighbor slots point to the node itself so that they can be gathered safely (their weight is zero).
+
+    Input:
+        vec         Array           Array with the correspondence of the 'nvec' neighbors of each node (or a Neighbors.NeighborGraph).
+
+    Output:
+        idx         Array           m x (nvec + 1) Array with the indices of each node and its neighbors.
+    """
+
+    if isinstance(vec, Neighbors.NeighborGraph):                                    # Neighbors in CSR form.
+        counts = vec.counts
+        rows   = np.repeat(np.arange(vec.m), counts)                                # Node of each neighbor.
+        rank   = np.arange(len(vec.indices)) - vec.indptr[rows]                     # Position of each neighbor in its row.
+        idx    = np.repeat(np.arange(vec.m)[:, None], np.max(counts, initial = 0) + 1, axis = 1)
+        idx[rows, rank + 1] = vec.indices                                           # Central node and its neighbors.
+        return idx
+    m    = vec.shape[0]                                                             # The total number of nodes.
+    node = np.arange(m)[:, None]                                                    # Index of each node.
+    idx  = np.hstack([node, np.where(vec != -1, vec, node)])                        # Central node and its neighbors.
+
+    return idx
\ No newline at end of file
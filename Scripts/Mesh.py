@@ -0,0 +1,162 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import hashlib
+import numpy as np
+
+def Boundary(x):
+    """
+    Boundary
+    Function to put the nodes of a closed boundary in order, since they are not stored in order in the data files.
+    The order is the shortest closed path through the nodes: a nearest-neighbor path improved with 2-opt exchanges (two edges of the path are replaced by two shorter ones).
+
+    Input:
+        x               ndarray         Array with the coordinates of the boundary nodes.
+
+    Output:
+        order           ndarray         Order of the nodes along the boundary.
+    """
+
+    n     = len(x)
+    D     = np.hypot(*(x[:, None, :] - x[None, :, :]).transpose(2, 0, 1))           # Distances between the nodes.
+    order = [0]
+    left  = np.ones(n, dtype = bool)
+    left[0] = False
+    for _ in np.arange(n - 1):                                                      # Nearest-neighbor path.
+        d = np.where(left, D[order[-1]], np.inf)
+        order.append(np.argmin(d))
+        left[order[-1]] = False
+    order = np.array(order)
+
+    improved = True
+    while improved:                                                                 # 2-opt exchanges.
+        improved = False
+        for i in np.arange(n - 2):
+            a, b = order[i], order[i + 1]
+            c, d = order[i + 2:], np.append(order[i + 3:], order[0])
+            if i == 0:                                                              # The edges must not share a node.
+                c, d = c[:-1], d[:-1]
+            gain = D[a, b] + D[c, d] - D[a, c] - D[b, d]
+            if len(gain) > 0 and np.max(gain) > 1e-12:
+                k = np.argmax(gain) + i + 2
+                order[i + 1:k + 1] = order[i + 1:k + 1][::-1]                       # Reverse the path between the edges.
+                improved = True
+    return order
+
+def Inside(poly, q):
+    """
+    Inside
+    Function to check if some points are inside of a polygon (even-odd rule).
+
+    Input:
+        poly            ndarray         Array with the vertices of the polygon, in order.
+        q               ndarray         Array with the coordinates of the points.
+
+    Output:
+        inside          ndarray         True for the points inside of the polygon.
+    """
+
+    x, y   = poly[:, 0], poly[:, 1]
+    x2, y2 = np.roll(x, -1), np.roll(y, -1)
+    qx, qy = q[:, 0][:, None], q[:, 1][:, None]
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        cross = ((y > qy) != (y2 > qy)) & (qx < x + (qy - y)*(x2 - x)/(y2 - y))     # Edges crossed by a ray to the right.
+    return np.sum(cross, axis = 1)%2 == 1
+
+def Triangulate(p):
+    """
+    Triangulate
+    Function to build a triangulation of a cloud of points from the Delaunay triangulation of the nodes.
+    The Delaunay triangulation covers the convex hull, so the region is carved with the boundary flags:
+        Outside:    The outer boundary nodes are put in order (see Boundary) and the triangles with the centroid outside of this polygon are removed.
+                    The triangles of three collinear boundary nodes have no area and are removed too.
+        Holes:      The nodes of the holes (flag 2) are grouped by hole, each hole is put in order and the triangles with the centroid inside it are removed.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and the flag for boundary (1: outer, 2: holes) or inner node (0).
+
+    Output:
+        tt              ndarray         Array with the correspondence of the triangles (0-based).
+    """
+
+    from scipy.spatial import Delaunay, cKDTree                                     # Imported when needed.
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    tt   = Delaunay(p[:, :2]).simplices                                             # Triangulation of the convex hull.
+    x    = p[tt, :2]
+    c    = np.mean(x, axis = 1)                                                     # Centroids of the triangles.
+    u, v = x[:, 1] - x[:, 0], x[:, 2] - x[:, 0]
+    area = np.abs(u[:, 0]*v[:, 1] - u[:, 1]*v[:, 0])/2                              # Area of the triangles.
+    keep = area > 1e-9*np.mean(area)
+
+    outer = np.where(p[:, 2] == 1)[0]                                               # Outer boundary nodes.
+    if len(outer) > 2:
+        keep &= Inside(p[outer[Boundary(p[outer, :2])], :2], c)                     # Triangles inside of the region.
+
+    holes = np.where(p[:, 2] == 2)[0]                                               # Nodes of the holes.
+    if len(holes) > 2:
+        tree  = cKDTree(p[holes, :2])
+        d, _  = tree.query(p[holes, :2], 2)
+        pairs = tree.query_pairs(2*np.max(d[:, 1]), output_type = 'ndarray')        # Nodes of the same hole.
+        graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape = (len(holes), len(holes)))
+        n, label = connected_components(graph, directed = False)
+        for k in np.arange(n):                                                      # For each hole.
+            hole = holes[label == k]
+            if len(hole) > 2:
+                keep &= ~Inside(p[hole[Boundary(p[hole, :2])], :2], c)              # Triangles outside of the hole.
+
+    return tt[keep]
+
+def Load(data_path, files, cache = os.path.join('Results', 'Triangles')):
+    """
+    Load
+    Function to load the nodes and the triangles of a region.
+    If the region has no '_tt.csv' file, the triangles are built with Triangulate and saved in the 'cache' folder, named after the region and the nodes,
+    so the data folders are not modified and the saved triangles are only used for the same cloud.
+
+    Input:
+        data_path       string          Folder with the cloud of points.
+        files           dict            Files of the region ('_p.csv' and optionally '_tt.csv').
+        cache           string          Folder for the built triangles (Default: 'Results/Triangles'; None: the triangles are not saved).
+
+    Output:
+        p               ndarray         Array with the coordinates of the nodes and the flag for boundary or inner node.
+        tt              ndarray         Array with the correspondence of the triangles.
+    """
+
+    p_file_path = os.path.join(data_path, files['_p.csv'])
+    p = np.genfromtxt(p_file_path, delimiter = ',', skip_header = 0)                # Load the coordinates of the points.
+    if '_tt.csv' in files:                                                          # If there are triangles.
+        tt = np.genfromtxt(os.path.join(data_path, files['_tt.csv']), delimiter = ',', skip_header = 0)
+        return p, tt                                                                # Load the triangles correspondence.
+
+    if cache is None:
+        return p, Triangulate(p)
+    key = hashlib.sha1(np.ascontiguousarray(p).tobytes()).hexdigest()[:12]          # The same nodes give the same triangles.
+    tt_file_path = os.path.join(cache, files['_p.csv'][:-len('_p.csv')] + '_' + key + '.npy')
+    if os.path.exists(tt_file_path):                                                # Saved triangles.
+        return p, np.load(tt_file_path)
+    tt = Triangulate(p)                                                             # Build the triangles.
+    try:
+        os.makedirs(cache, exist_ok = True)
+        np.save(tt_file_path, tt)                                                   # Save them for the next runs.
+    except OSError:                                                                 # Read-only folder.
+        pass
+    return p, tt
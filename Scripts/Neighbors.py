@@ -13,13 +13,11 @@ Date:
     July, 2023.
 
 Last Modification:
-    October, 2023.
+    October, 2026.
 """
 
 ## Library importation.
 import numpy as np
-from scipy.spatial import KDTree
-from joblib import Parallel, delayed
 
 def Cloud(p, nvec):
     """
@@ -142,6 +140,7 @@ def find_neighbors(p, dist, nvec, mode = 2, n_jobs = -1):
     Output:
         vec                 ndarray         Array with matching neighbors of each node.
     """
+    from joblib import Parallel, delayed                                            # Parallel backend, imported when needed.
     m = len(p[:, 0])                                                                # The size if the triangulation is obtained.
     vec = np.zeros([m, nvec], dtype=int) - 1                                        # The array for the neighbors is initialized.
 
@@ -160,12 +159,55 @@ def find_neighbors(p, dist, nvec, mode = 2, n_jobs = -1):
     
     elif mode == 3:
         # KDTree.
+        from scipy.spatial import KDTree                                            # Imported when needed.
         tree = KDTree(p[:, :2])                                                     # Create a KDTree using the first two columns of p (x and y coordinates).
         vec_rows = Parallel(n_jobs=n_jobs)(delayed(find_neighbors_kdtree)(i, p, tree, dist, nvec) for i in range(m))
         vec = np.array(vec_rows)
 
     return vec
 
+def select_neighbors(p, rows, pos, cand, dist, nvec, balanced = False):
+    """
+    select_neighbors
+    Function to choose the neighbors of several nodes from lists of candidates, all at once.
+    The neighbors of each node are the 'nvec' closest candidates within the given distance; ties are broken by the index of the node, so the result does not depend on the order of the candidates.
+    With 'balanced' the candidates are taken in turns from the four quadrants around the node (the closest one of each quadrant, then the second closest, ...), so a node next to a denser patch of the cloud does not take all its neighbors from that side.
+
+    Input:
+        p                   ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        rows                ndarray         Indices of the central nodes.
+        pos                 ndarray         Position in rows of the central node of each candidate.
+        cand                ndarray         Index of each candidate.
+        dist                float           Radius distance to look for neighbors.
+        nvec                int             Maximum number of neighbors.
+        balanced            Logical         Take the neighbors in turns from the four quadrants (Default: False).
+
+    Output:
+        vec                 ndarray         len(rows) x nvec Array with matching neighbors of each node.
+    """
+    rows  = np.asarray(rows, dtype = int)
+    dx    = p[cand, 0] - p[rows[pos], 0]
+    dy    = p[cand, 1] - p[rows[pos], 1]
+    d     = np.sqrt(dx**2 + dy**2)                                                  # Distance from each candidate to its central node.
+    keep  = (d < dist) & (cand != rows[pos])                                        # Candidates within the radius, without the central node.
+    pos, cand, d = pos[keep], cand[keep], d[keep]
+    turn  = np.zeros(len(pos), dtype = int)                                         # Turn of each candidate (all the same: by distance).
+    if balanced:
+        quad  = (dx[keep] >= 0) + 2*(dy[keep] >= 0)                                 # Quadrant of each candidate.
+        order = np.lexsort((cand, d, quad, pos))                                    # Sort by central node, quadrant, distance and index.
+        key   = (pos*4 + quad)[order]
+        turn[order] = np.arange(len(pos)) - np.searchsorted(key, key)               # Rank of each candidate in its quadrant.
+        keep  = turn < nvec                                                         # The others can not be chosen.
+        pos, cand, d, turn = pos[keep], cand[keep], d[keep], turn[keep]
+    order = np.lexsort((cand, d, turn, pos))                                        # Sort by central node, turn, distance and index.
+    pos, cand    = pos[order], cand[order]
+    first = np.searchsorted(pos, np.arange(len(rows)))                              # First candidate of each central node.
+    rank  = np.arange(len(pos)) - first[pos]                                        # Rank of each candidate.
+    keep  = rank < nvec                                                             # The closest 'nvec' candidates.
+    vec   = np.zeros([len(rows), nvec], dtype = int) - 1                            # The array for the neighbors is initialized.
+    vec[pos[keep], rank[keep]] = cand[keep]                                         # Store the neighbors.
+    return vec
+
 def find_neighbors_for_node(i, tt, nvec):
     """
     Helper function to find neighbors for a single node in the triangulation.
@@ -199,9 +241,134 @@ def Triangulation(p, tt, nvec, n_jobs=-1):
     vec = np.zeros([m, nvec], dtype=int) - 1                                        # The array for the neighbors is initialized.
 
     # Parallel computation of neighbors for each node using Joblib
+    from joblib import Parallel, delayed                                            # Parallel backend, imported when needed.
     vec_rows = Parallel(n_jobs=n_jobs)(delayed(find_neighbors_for_node)(i, tt, nvec) for i in range(m))
 
     # Combine the rows to form the full matrix vec
     vec = np.array(vec_rows)
 
-    return vec
\ No newline at end of file
+    return vec
+
+class NeighborGraph:
+    """
+    NeighborGraph
+
+    Compact neighbor graph of a cloud of points in CSR form: the neighbors of node i are indices[indptr[i]:indptr[i + 1]], closest first.
+    Each node has its own number of neighbors, so there are no empty slots; indptr and indices are stored as int32 (4 bytes per neighbor against 8 bytes per slot of the padded array).
+    The distances to the neighbors can be stored too.
+    Gammas.Derivatives, Weights, Components and Index, and Errors.Areas, read the graph directly: each least-squares problem uses exactly the neighbors of its node.
+    The time-stepping engines keep the fixed-width layout of Gammas.Weights (as wide as the node with most neighbors); padded gives the m x nvec array ('vec') of the other routines, and from_padded builds the graph from it.
+
+    Input:
+        indptr          ndarray         Array with the position of the first neighbor of each node (m + 1 values).
+        indices         ndarray         Array with the neighbors of all the nodes.
+        distances       ndarray         Array with the distance to each neighbor (Default: None, not stored).
+    """
+
+    def __init__(self, indptr, indices, distances = None):
+        self.indptr    = np.asarray(indptr, dtype = np.int32)
+        self.indices   = np.asarray(indices, dtype = np.int32)
+        self.distances = None if distances is None else np.asarray(distances, dtype = np.float64)
+
+    @property
+    def m(self):
+        return len(self.indptr) - 1                                                 # Number of nodes.
+
+    @property
+    def counts(self):
+        return np.diff(self.indptr)                                                 # Number of neighbors of each node.
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + (0 if self.distances is None else self.distances.nbytes)
+
+    def neighbors(self, i):
+        """
+        Neighbors of node i.
+        """
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def padded(self, nvec = None):
+        """
+        Padded m x nvec array of neighbors, with -1 in the empty slots (Default: nvec is the largest number of neighbors).
+        Nodes with more than nvec neighbors keep the first nvec.
+        """
+        counts = self.counts
+        nvec   = int(np.max(counts, initial = 0)) if nvec is None else nvec
+        rank   = np.arange(len(self.indices)) - np.repeat(self.indptr[:-1], counts) # Position of each neighbor in its row.
+        keep   = rank < nvec
+        vec    = np.zeros([self.m, nvec], dtype = int) - 1                          # The array for the neighbors is initialized.
+        vec[np.repeat(np.arange(self.m), counts)[keep], rank[keep]] = self.indices[keep]
+        return vec
+
+    @classmethod
+    def from_padded(cls, vec, p = None):
+        """
+        Graph from the padded m x nvec array of neighbors; with the coordinates p the distances are stored.
+        """
+        vec     = np.asarray(vec)
+        valid   = vec != -1
+        indptr  = np.concatenate([[0], np.cumsum(np.sum(valid, axis = 1))])
+        indices = vec[valid]                                                        # By rows, the empty slots are dropped.
+        distances = None
+        if p is not None:
+            rows      = np.nonzero(valid)[0]
+            distances = np.sqrt((p[indices, 0] - p[rows, 0])**2 + (p[indices, 1] - p[rows, 1])**2)
+        return cls(indptr, indices, distances)
+
+    @classmethod
+    def from_triangles(cls, p, tt):
+        """
+        Graph of the triangulation: the neighbors of each node are all the nodes that share a triangle with it, with no maximum.
+        """
+        tt    = np.asarray(tt).astype(int)
+        rows  = np.concatenate([tt[:, 0], tt[:, 1], tt[:, 2], tt[:, 1], tt[:, 2], tt[:, 0]])
+        cols  = np.concatenate([tt[:, 1], tt[:, 2], tt[:, 0], tt[:, 0], tt[:, 1], tt[:, 2]])
+        m     = p.shape[0]
+        edges = np.unique(rows*m + cols)                                            # Each edge once, by rows.
+        rows, cols = edges//m, edges%m
+        d     = np.sqrt((p[cols, 0] - p[rows, 0])**2 + (p[cols, 1] - p[rows, 1])**2)
+        order = np.lexsort((cols, d, rows))                                         # Closest first.
+        rows, cols, d = rows[order], cols[order], d[order]
+        indptr = np.searchsorted(rows, np.arange(m + 1))
+        return cls(indptr, cols, d)
+
+def Graph(p, nvec = 8, dist = None, distances = True):
+    """
+    Graph
+    Function to find the neighbor nodes in a cloud of points as a NeighborGraph.
+    The neighbors of each node are the closest ones within the distance, as in Cloud, but the number of neighbors can be different for each node.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        nvec            int             Maximum number of neighbors, or an Array with the maximum for each node (Default: 8).
+        dist            float           Radius distance to look for neighbors (Default: None, as in Cloud).
+        distances       Logical         Store the distances to the neighbors (Default: True).
+
+    Output:
+        graph           NeighborGraph   Neighbors of each node.
+    """
+
+    from scipy.spatial import KDTree                                                # Imported when needed.
+    m    = len(p[:, 0])                                                             # The total number of nodes.
+    tree = KDTree(p[:, :2])
+    if dist is None:                                                                # The same distance than find_distances, without the m x m array.
+        dist = (3/2)*np.max(KDTree(p).query(p, k = 2)[0][:, 1])
+    nvec = np.broadcast_to(np.asarray(nvec, dtype = int), m)                        # Maximum number of neighbors of each node.
+
+    d, idx = tree.query(p[:, :2], k = int(np.max(nvec)) + 1, distance_upper_bound = dist)
+    valid  = (d < dist) & (idx != np.arange(m)[:, None])                            # Within the radius, without the central node.
+    rank   = np.cumsum(valid, axis = 1) - 1
+    valid &= rank < nvec[:, None]                                                   # The closest neighbors of each node.
+    indptr = np.concatenate([[0], np.cumsum(np.sum(valid, axis = 1))])
+
+    return NeighborGraph(indptr, idx[valid], d[valid] if distances else None)
+
+def Padded(vec, nvec = None):
+    """
+    Padded
+    Function to get the padded m x nvec array of neighbors from a NeighborGraph (an array is returned as it is).
+    """
+    if isinstance(vec, NeighborGraph):
+        return vec.padded(nvec)
+    return vec
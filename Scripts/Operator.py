@@ -0,0 +1,294 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+
+class Operator:
+    """
+    Operator
+
+    GFD operator of a cloud of points that can be updated incrementally when nodes are added, moved or removed.
+
+    The neighbors are the 'nvec' closest nodes within a fixed radius 'dist', so a change in the cloud only affects the nodes within 'dist' of the old and new positions of the changed nodes.
+    Those nodes are found with the KDTree and only their neighbor lists and Gamma rows are computed again.
+    Nodes added or moved since the KDTree was built are kept in a short list that is searched directly; the KDTree is rebuilt when the list grows over a fraction of the nodes.
+    Once assembled, the sparse operator K is patched too: the rows of the new nodes are appended, the rows and columns of the removed ones are dropped, and only the changed rows are written again.
+    A snapshot keeps the state of the cloud so the next edits can be undone (restore) without a copy of the whole operator.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        L               ndarray         Array with the values of the differential operator.
+        nvec            int             Maximum number of neighbors (Default: 8).
+        dist            float           Radius to look for neighbors (Default: None, the same radius than Neighbors.Cloud).
+        rebuild         float           Fraction of changed nodes that triggers a rebuild of the KDTree (Default: 0.05).
+        derivatives     Logical         Keep the derivative stencils of the nodes, updated with the Gammas (Default: False).
+        balanced        Logical         Take the neighbors in turns from the four quadrants around each node (see Neighbors.select_neighbors, Default: False).
+
+    Attributes:
+        p               ndarray         Coordinates of the nodes and flag for the boundary.
+        vec             ndarray         m x nvec Array with matching neighbors of each node.
+        W               ndarray         m x (nvec + 1) Array with the Gammas of each node and its neighbors (Gammas.Weights layout).
+        K               csr_matrix      Sparse GFD operator, with nvec + 1 stored entries per row.
+        D               ndarray         m x nvec x 5 Array with the derivative stencils of each node (Gammas.Derivatives), or None.
+    """
+
+    def __init__(self, p, L, nvec = 8, dist = None, rebuild = 0.05, derivatives = False, balanced = False):
+        self.p        = np.array(p, dtype = float)                                  # Coordinates of the nodes.
+        self.L        = np.reshape(np.asarray(L, dtype = float), 5)                 # Differential operator.
+        self.nvec     = nvec                                                        # Maximum number of neighbors.
+        self.rebuild  = rebuild
+        self.balanced = balanced                                                    # Neighbors from the four quadrants.
+        self.build_tree()
+
+        if dist is None:                                                            # Delta computation, as in Neighbors.find_distances.
+            from scipy.spatial import KDTree                                        # Imported when needed.
+            d, _ = KDTree(self.p).query(self.p, k = 2)                              # Distance to the closest node.
+            dist = (3/2)*np.max(d[:, 1])
+        self.dist = dist
+
+        rows     = np.arange(self.m)                                                # All the nodes.
+        self.vec = self.neighbors(rows)                                             # Neighbor search.
+        self.D   = Gammas.Derivatives(self.p, self.vec) if derivatives else None    # Derivative stencils.
+        self.W   = Gammas.Weights(self.p, self.vec, self.L, D = self.D)             # Gammas computation.
+        self._K  = None                                                             # Sparse operator (assembled when needed).
+        self._lu = {}                                                               # Factorizations of the implicit scheme.
+        self._snapshot = None                                                       # State kept to undo the edits.
+
+    @property
+    def m(self):
+        return self.p.shape[0]
+
+    def build_tree(self):
+        """
+        Build the KDTree with the current nodes.
+        """
+        from scipy.spatial import KDTree                                            # Imported when needed.
+        self.tree     = KDTree(self.p[:, :2])
+        self.tree_map = np.arange(self.m)                                           # Node of each point of the KDTree (-1 if outdated).
+        self.tree_pos = np.arange(self.m)                                           # Point of the KDTree of each node (-1 if not in the KDTree).
+        self.extra    = np.array([], dtype = int)                                   # Nodes added or moved since the KDTree was built.
+
+    def candidates(self, xy, r):
+        """
+        Find all the nodes within a distance r of the points xy.
+        Returns the position of the point and the index of the node for each pair found.
+        """
+        if len(xy) == 0:
+            return np.array([], dtype = int), np.array([], dtype = int)
+        lists = self.tree.query_ball_point(xy, r)                                   # Search in the KDTree.
+        pos   = np.repeat(np.arange(len(xy)), [len(l) for l in lists])
+        cand  = self.tree_map[np.concatenate([np.asarray(l, dtype = int) for l in lists])]
+        keep  = cand != -1                                                          # Discard the outdated points.
+        pos, cand = pos[keep], cand[keep]
+        if len(self.extra) > 0:                                                     # Search in the nodes that are not in the KDTree.
+            d     = np.hypot(xy[:, None, 0] - self.p[self.extra, 0], xy[:, None, 1] - self.p[self.extra, 1])
+            ip, j = np.nonzero(d <= r)
+            pos   = np.concatenate([pos, ip])
+            cand  = np.concatenate([cand, self.extra[j]])
+        return pos, cand
+
+    def neighbors(self, rows):
+        """
+        Neighbor search for the given nodes.
+        """
+        pos, cand = self.candidates(self.p[rows, :2], self.dist)
+        return Neighbors.select_neighbors(self.p, rows, pos, cand, self.dist, self.nvec, self.balanced)
+
+    def affected(self, xy):
+        """
+        Nodes whose neighbors can change when a node is added, moved or removed at the points xy.
+        """
+        _, cand = self.candidates(np.reshape(xy, (-1, 2)), self.dist)
+        return np.unique(cand)
+
+    def snapshot(self):
+        """
+        Keep the current state of the cloud, to undo the next edits with restore.
+        Only references to the arrays are kept: while there is a snapshot, the edits copy the arrays they would change in place.
+        """
+        self._snapshot = {name: getattr(self, name) for name in ('p', 'vec', 'W', 'D', '_K', 'tree', 'tree_map', 'tree_pos', 'extra')}
+        return self._snapshot
+
+    def restore(self, snapshot):
+        """
+        Undo the edits made since the snapshot.
+        """
+        self.__dict__.update(snapshot)
+        self._lu       = {}
+        self._snapshot = None
+
+    def writable(self, *names):
+        """
+        Copy the arrays about to be changed in place if the snapshot keeps them.
+        """
+        if self._snapshot is not None:
+            for name in names:
+                array = getattr(self, name)
+                if array is not None and array is self._snapshot[name]:
+                    setattr(self, name, array.copy())
+
+    def update(self, rows):
+        """
+        Compute again the neighbors and the Gammas of the given nodes.
+        """
+        rows = np.unique(rows)
+        self.writable('vec', 'W', 'D', '_K')
+        if len(rows) > 0:
+            self.vec[rows] = self.neighbors(rows)                                   # Neighbor search.
+            D = None
+            if self.D is not None:
+                D = self.D[rows] = Gammas.Derivatives(self.p, self.vec, rows)       # Derivative stencils.
+            self.W[rows]   = Gammas.Weights(self.p, self.vec, self.L, rows = rows, D = D)
+                                                                                    # Gammas computation.
+        if self._K is not None and self._K.shape[0] == self.m:                      # Patch the sparse operator in place.
+            n   = self.nvec + 1
+            pos = (rows[:, None]*n + np.arange(n)).reshape(-1)                      # Stored entries of the rows.
+            self._K.indices[pos] = np.hstack([rows[:, None], np.where(self.vec[rows] != -1, self.vec[rows], rows[:, None])]).reshape(-1)
+            self._K.data[pos]    = self.W[rows].reshape(-1)
+            self._K.has_sorted_indices   = False                                    # The columns of the rows changed.
+            self._K.has_canonical_format = False
+        else:
+            self._K = None
+        self._lu = {}                                                               # Any factorization is no longer valid.
+        if len(self.extra) > self.rebuild*self.m:                                   # Too many nodes outside of the KDTree.
+            self.build_tree()
+
+    def Insert(self, q):
+        """
+        Add new nodes to the cloud.
+
+        Input:
+            q           ndarray         Array with the coordinates of the new nodes (and optionally their boundary flags; default 0).
+
+        Output:
+            new         ndarray         Indices of the new nodes.
+        """
+        q = np.atleast_2d(np.asarray(q, dtype = float))
+        if q.shape[1] == 2:
+            q = np.hstack([q, np.zeros([len(q), 1])])                               # New nodes are inner nodes.
+        new  = np.arange(self.m, self.m + len(q))                                   # Indices of the new nodes.
+        rows = self.affected(q[:, :2])                                              # Nodes close to the new ones.
+
+        self.p        = np.vstack([self.p, q])
+        self.vec      = np.vstack([self.vec, np.zeros([len(q), self.nvec], dtype = int) - 1])
+        self.W        = np.vstack([self.W, np.zeros([len(q), self.nvec + 1])])
+        if self.D is not None:
+            self.D    = np.vstack([self.D, np.zeros([len(q), self.nvec, 5])])
+        self.tree_pos = np.concatenate([self.tree_pos, np.zeros(len(q), dtype = int) - 1])
+        self.extra    = np.concatenate([self.extra, new])
+        if self._K is not None:                                                     # Empty rows for the new nodes, filled by update.
+            n       = self.nvec + 1
+            self._K = self.assemble(np.concatenate([self._K.data, np.zeros(len(q)*n)]), np.concatenate([self._K.indices, np.repeat(new, n)]))
+        self.update(np.concatenate([rows, new]))
+        return new
+
+    def Move(self, idx, xy):
+        """
+        Move nodes of the cloud to new positions.
+
+        Input:
+            idx         ndarray         Indices of the nodes to move.
+            xy          ndarray         New coordinates of the nodes.
+
+        Output:
+            None
+        """
+        idx  = np.atleast_1d(np.asarray(idx, dtype = int))
+        xy   = np.reshape(np.asarray(xy, dtype = float), (-1, 2))
+        rows = self.affected(self.p[idx, :2])                                       # Nodes close to the old positions.
+
+        self.writable('p', 'tree_map')
+        self.p[idx, :2] = xy                                                        # Move the nodes.
+        inside = self.tree_pos[idx] != -1
+        self.tree_map[self.tree_pos[idx[inside]]] = -1                              # Their points in the KDTree are outdated.
+        self.tree_pos[idx] = -1
+        self.extra = np.union1d(self.extra, idx)
+        self.update(np.concatenate([rows, self.affected(xy), idx]))                 # Nodes close to the new positions.
+
+    def Remove(self, idx):
+        """
+        Remove nodes from the cloud. The remaining nodes keep their relative order.
+
+        Input:
+            idx         ndarray         Indices of the nodes to remove.
+
+        Output:
+            new         ndarray         New index of each old node (-1 for the removed nodes).
+        """
+        idx  = np.unique(np.atleast_1d(np.asarray(idx, dtype = int)))
+        rows = np.setdiff1d(self.affected(self.p[idx, :2]), idx)                    # Nodes close to the removed ones.
+
+        keep      = np.ones(self.m, dtype = bool)
+        keep[idx] = False
+        new       = np.zeros(self.m, dtype = int) - 1
+        new[keep] = np.arange(keep.sum())                                           # New numbering.
+
+        self.p   = self.p[keep]
+        self.vec = self.vec[keep]
+        self.vec = np.where(self.vec != -1, new[np.maximum(self.vec, 0)], -1)       # Renumber the neighbors.
+        self.W   = self.W[keep]
+        if self.D is not None:
+            self.D = self.D[keep]
+        self.writable('tree_map')
+        inside   = self.tree_map != -1
+        self.tree_map[inside] = new[self.tree_map[inside]]                          # Renumber the points of the KDTree.
+        self.tree_pos = self.tree_pos[keep]
+        self.extra    = new[self.extra]
+        self.extra    = self.extra[self.extra != -1]
+        if self._K is not None:                                                     # Drop the rows and columns of the removed nodes.
+            n       = self.nvec + 1
+            cols    = new[self._K.indices.reshape(-1, n)[keep]]
+            own     = np.repeat(np.arange(self.m)[:, None], n, axis = 1)
+            data    = np.where(cols != -1, self._K.data.reshape(-1, n)[keep], 0)    # The rows with removed neighbors are updated below.
+            self._K = self.assemble(data.reshape(-1), np.where(cols != -1, cols, own).reshape(-1))
+        self.update(new[rows])
+        return new
+
+    @property
+    def K(self):
+        """
+        Sparse GFD operator in CSR format with nvec + 1 stored entries per row (empty neighbor slots are explicit zeros).
+        """
+        if self._K is None:
+            self._K = self.assemble(self.W.reshape(-1).copy(), Gammas.Index(self.vec).reshape(-1))
+        return self._K
+
+    def assemble(self, data, indices):
+        """
+        CSR matrix of the cloud with nvec + 1 stored entries per row, from its data and column indices.
+        """
+        from scipy.sparse import csr_matrix                                         # Imported when needed.
+        n = self.nvec + 1
+        K = csr_matrix((data, indices, np.arange(0, self.m*n + 1, n)), shape = (self.m, self.m))
+        K.has_sorted_indices = K.has_canonical_format = False
+        return K
+
+    def Factorize(self, dt, lam = 0.5):
+        """
+        Sparse LU factorization of (I - (1 - lam)*dt*K) for the implicit scheme.
+        The factorization is kept until the cloud changes.
+        """
+        if (dt, lam) not in self._lu:
+            from scipy.sparse import identity                                       # Imported when needed.
+            A = identity(self.m, format = 'csc') - (1 - lam)*dt*self.K.tocsc()
+            from scipy.sparse.linalg import splu                                    # Imported when needed.
+            self._lu[(dt, lam)] = splu(A)
+        return self._lu[(dt, lam)]
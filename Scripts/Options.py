@@ -0,0 +1,162 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import dataclasses
+import numpy as np
+
+@dataclasses.dataclass
+class Options:
+    """
+    Options
+
+    Options of AdvectionDiffusion.Cloud that choose how the problem is computed; the problem itself (p, f, v, a, b, t, tt, implicit, lam) is given to Cloud.
+    The value of each option is checked when the Options are built; the combinations that an engine does not support are checked in one place (check), once the engine is known.
+
+    Input:
+        reorder         String          Node reordering used to improve memory locality during the computations.
+                                            None: The nodes are used in the given order (Default).
+                                            'rcm': Reverse Cuthill-McKee on the neighbor graph.
+                                            'hilbert': Hilbert space-filling curve on the coordinates.
+                                            'morton': Morton space-filling curve on the coordinates.
+                                        All the outputs are returned in the original order of the nodes.
+        engine          String          Select how the time steps are computed.
+                                            'dense': Full m x m propagator (Default).
+                                            'ellpack': Fixed-width stencil kernel built directly from vec (explicit scheme only).
+                                            'shared': 'ellpack' kernel split among several processes with shared memory (explicit scheme only, same results as 'ellpack' bit-for-bit, not as 'dense').
+                                            'sparse': Sparse operator, with a sparse LU factorization for the implicit scheme.
+                                            'auto': The fastest engine that fits in memory, chosen by Scripts/Planner.py (it can also choose 'stream').
+        n_jobs          Integer         Number of processes for the 'shared' engine (-1 uses all processors).
+        precision       String          Precision for the storage of the computed solution and the operator weights.
+                                            'double': float64 storage and computations (Default).
+                                            'single': float32 storage and computations.
+                                            'mixed': float32 storage with float64 accumulation ('ellpack' and 'shared' engines).
+                                        The Gammas are always computed in float64.
+        checkpoint      String          Folder to save periodic checkpoints of the time integration (Default: None, no checkpoints).
+        interval        Integer         Number of time steps between checkpoints (Default: 100).
+        restart         Logical         Resume from the latest checkpoint in 'checkpoint' if it belongs to the same problem.
+                                            The neighbors and the Gammas are taken from the checkpoint (Default: False).
+        stream          Logical         Write the solutions to files on disk during the time steps instead of keeping them in RAM (Default: False).
+        history         String          Folder for the files of the solutions, 'u_ap.npy' and 'u_ex.npy' (Default: None, temporary files).
+        interior        Logical         Advance only the inner nodes, with the boundary data as a source term (Default: False).
+                                            The implicit system only includes the inner nodes and uses the boundary values of both time-levels; the full operators keep
+                                            the boundary values of the old time-level during the implicit solve, so the implicit results differ (the explicit ones do not).
+                                            'dense' uses dense blocks; the other engines use sparse blocks and a sparse LU ('shared' is not supported).
+        refresh         Integer         Number of time steps between updates of the operator when a coefficient is a Function (Default: 1).
+                                            The Gammas of the derivatives are computed once and combined with the new coefficients, without solving the least-squares problems again.
+                                            The 'dense' and 'shared' engines only support coefficients that do not change in time.
+        probes          Probes          Monitoring points, from Scripts/Probes.py (Default: None, the solution on all the nodes is kept).
+                                            Only the values at the n points are kept during the time steps; u_ap and u_ex are n x t.
+                                            Not available with checkpoints or the 'shared' engine.
+        blocking        Integer         Number of time steps computed by tiles of nodes that fit in cache, for the 'ellpack' engine (Default: 1, no temporal blocking).
+                                            The tiles are contiguous pieces of the ordering of the nodes, so it should be used with 'reorder'.
+                                            The results are the same; not available with probes, interior steps or coefficients that change in time.
+        splitting       String          Operator splitting with semi-Lagrangian advection, from Scripts/Splitting.py (Default: None, no splitting).
+                                            'gfd':    The departure points are interpolated with GFD weights from the nearest nodes.
+                                            'linear': The departure points are interpolated with barycentric weights in the triangles of tt.
+                                        The advection is not limited by the CFL condition, so it is meant for advection-dominated problems with few, large time steps.
+                                        Each step adds an interpolation error, so with many small steps the plain GFD scheme is more accurate.
+                                        Only triangulation, tt, implicit, lam and geometry are used; the other options must keep their defaults.
+    """
+
+    reorder:    str    = None
+    engine:     str    = 'dense'
+    n_jobs:     int    = -1
+    precision:  str    = 'double'
+    checkpoint: str    = None
+    interval:   int    = 100
+    restart:    bool   = False
+    stream:     bool   = False
+    history:    str    = None
+    interior:   bool   = False
+    refresh:    int    = 1
+    probes:     object = None
+    blocking:   int    = 1
+    splitting:  str    = None
+
+    def __post_init__(self):
+        values = {'reorder':   (None, 'rcm', 'hilbert', 'morton'),
+                  'engine':    ('dense', 'ellpack', 'shared', 'sparse', 'auto'),
+                  'precision': ('double', 'single', 'mixed'),
+                  'splitting': (None, 'gfd', 'linear')}
+        for name, allowed in values.items():                                        # Options with a list of values.
+            if getattr(self, name) not in allowed:
+                raise ValueError(f'Unknown {name}: {getattr(self, name)}')
+        for name in ('interval', 'refresh', 'blocking'):                            # Numbers of time steps.
+            if getattr(self, name) < 1:
+                raise ValueError(f'The {name} must be at least one time step.')
+
+    @property
+    def dtype(self):
+        return np.float64 if self.precision == 'double' else np.float32             # Precision for the storage.
+
+    @property
+    def accumulate(self):
+        return np.float64 if self.precision == 'mixed' else None                    # Precision for the accumulation.
+
+    def due(self, k, t):
+        """
+        Whether a checkpoint is saved after time step k of t.
+        """
+        return self.checkpoint is not None and (k%self.interval == 0 or k == t - 1)
+
+    def changed(self):
+        """
+        Names of the options that do not keep their default values.
+        """
+        return [field.name for field in dataclasses.fields(self) if getattr(self, field.name) != field.default]
+
+    def check(self, implicit = False, varying = False):
+        """
+        Check that the engine supports the other options, the scheme and the coefficients ('auto' must be resolved first).
+
+        Input:
+            implicit    Logical         Implicit scheme.
+            varying     Logical         Coefficients that change in time (see Scripts/Fields.py).
+        """
+        engine      = self.engine
+        unsupported = [                                                             # Combinations that are not supported, with their messages.
+            (engine in ('ellpack', 'shared') and implicit and not self.interior,
+             f"The '{engine}' engine only supports the explicit scheme."),
+            (engine in ('dense', 'sparse') and self.precision == 'mixed',
+             f"The '{engine}' engine does not support mixed precision."),
+            (self.interior and (engine == 'shared' or self.precision == 'mixed'),
+             "Advancing only the inner nodes is not available with the 'shared' engine or mixed precision."),
+            (engine == 'shared' and self.stream,
+             "The 'shared' engine does not support streaming the solutions."),
+            (engine == 'shared' and self.checkpoint is not None,
+             "The 'shared' engine does not support checkpoints."),
+            (engine in ('dense', 'shared') and varying,
+             f"The '{engine}' engine does not support coefficients that change in time."),
+            (self.probes is not None and (engine == 'shared' or self.checkpoint is not None),
+             "The probes are not available with checkpoints or the 'shared' engine."),
+            (self.blocking > 1 and (engine != 'ellpack' or self.interior or varying or self.probes is not None),
+             "Temporal blocking is only available for the 'ellpack' engine, without probes, interior steps or coefficients that change in time."),
+        ]
+        for condition, message in unsupported:                                      # The first unsupported combination.
+            if condition:
+                raise ValueError(message)
+
+def Build(options = None, **kwargs):
+    """
+    Build
+    Function to get the Options of a problem from an Options object, keyword arguments with the names of its fields, or both (the keyword arguments take precedence).
+    """
+    if options is None:
+        return Options(**kwargs)
+    return dataclasses.replace(options, **kwargs)
@@ -0,0 +1,147 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import queue
+import threading
+import numpy as np
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import Scripts.Checkpoint as Checkpoint
+
+def Solutions(u_ap, u_ex, folder):
+    """
+    Solutions
+    Function to save the computed and theoretical solutions of a region as CSV files.
+    """
+    os.makedirs(folder, exist_ok = True)                                            # Ensure the directory exists.
+    np.savetxt(os.path.join(folder, 'Computed Solution.csv'), u_ap, delimiter = ',', fmt = '%.8f')
+                                                                                    # Save the computed solution.
+    np.savetxt(os.path.join(folder, 'Theoretical Solution.csv'), u_ex, delimiter = ',', fmt = '%.8f')
+                                                                                    # Save the theoretical solution.
+
+def Render(p, tt, u_ap, folder):
+    """
+    Render
+    Function to save the graphs and the video of the computed solution of a region.
+    """
+    import Scripts.Graph as Graph                                                   # Graphs are only needed to render.
+    os.makedirs(folder, exist_ok = True)                                            # Ensure the directory exists.
+    Graph.Cloud_Transient_Steps_1(p, tt, u_ap, nom = os.path.join(folder, 'Solution'))
+                                                                                    # Save the resulting graphs.
+    Graph.Cloud_Transient_1(p, tt, u_ap, save = True, nom = os.path.join(folder, 'Solution.mp4'))
+                                                                                    # Save the resulting video.
+
+def Error(er, folder):
+    """
+    Error
+    Function to save the mean error of a region. It must be the last file written, it marks the region as finished.
+    """
+    with open(os.path.join(folder, 'Error.txt'), 'w') as file:                      # Create the file.
+        file.write(str(np.mean(er)))                                                # Save the error.
+
+def renderer_init():
+    """
+    renderer_init
+    The renderer processes draw without a display.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+class Pipeline:
+    """
+    Pipeline
+
+    Asynchronous output stage for the results of the regions.
+    The solver hands the results of each region to a bounded queue and continues with the next region.
+    Writer threads take the results from the queue and save the solutions; the graphs and the video are drawn by renderer processes.
+    When the artifacts of a region are complete its error is saved (marking the region as finished) and its checkpoints are removed.
+    If the queue is full, put waits for the writers, so at most 'maxsize' regions are waiting in memory.
+
+    Input:
+        maxsize         int             Maximum number of regions waiting in the queue (Default: 2).
+        writers         int             Number of writer threads (Default: 2).
+        renderers       int             Number of renderer processes (Default: 1).
+    """
+
+    def __init__(self, maxsize = 2, writers = 2, renderers = 1):
+        self.queue   = queue.Queue(maxsize)                                         # Bounded queue of results.
+        self.errors  = []                                                           # Exceptions in the writers.
+        self.pool    = ProcessPoolExecutor(renderers, mp_context = mp.get_context('forkserver'), initializer = renderer_init)
+                                                                                    # Renderer processes.
+        self.threads = [threading.Thread(target = self.writer, daemon = True) for _ in range(writers)]
+        for thread in self.threads:
+            thread.start()
+
+    def put(self, p, tt, u_ap, u_ex, er, folder, checkpoint = None):
+        """
+        Hand the results of a region to the writers.
+
+        Input:
+            p           ndarray         Array with the coordinates of the nodes.
+            tt          ndarray         Array with the correspondence of the n triangles.
+            u_ap        ndarray         Array with the computed solution.
+            u_ex        ndarray         Array with the theoretical solution.
+            er          ndarray         Array with the error on each time step.
+            folder      string          Folder for the results of the region.
+            checkpoint  string          Folder with the checkpoints of the region, removed at the end (Default: None).
+        """
+        if self.errors:                                                             # Stop at the first failure.
+            raise self.errors[0]
+        self.queue.put((p, tt, u_ap, u_ex, er, folder, checkpoint))
+
+    def writer(self):
+        """
+        Writer thread: save the solutions, wait for the graphs and then save the error.
+        """
+        while True:
+            job = self.queue.get()
+            if job is None:                                                         # No more regions.
+                self.queue.task_done()
+                return
+            p, tt, u_ap, u_ex, er, folder, checkpoint = job
+            try:
+                render = self.pool.submit(Render, p, tt, u_ap, folder)              # Draw in the background.
+                Solutions(u_ap, u_ex, folder)                                       # Save the solutions meanwhile.
+                render.result()                                                     # Wait for the graphs and the video.
+                Error(er, folder)                                                   # The region is finished.
+                if checkpoint is not None:
+                    Checkpoint.Clear(checkpoint)                                    # Remove the checkpoints.
+            except Exception as error:
+                self.errors.append(error)
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        """
+        Wait until all the results are saved and stop the writers and the renderers.
+        """
+        for _ in self.threads:
+            self.queue.put(None)                                                    # Stop signal for each writer.
+        for thread in self.threads:
+            thread.join()
+        self.pool.shutdown()
+        if self.errors:
+            raise self.errors[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
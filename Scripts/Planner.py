@@ -0,0 +1,167 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import sys
+import tempfile
+import numpy as np
+
+## Approximate speed of the computer, used to estimate the time of each strategy (measured on the clouds of Data/Clouds with one thread).
+Rates = {
+    'dense':   6e9,                                                                 # Floating point operations per second with BLAS.
+    'sparse':  2.5e9,                                                               # Floating point operations per second with gathers.
+    'calls':   2.5e5,                                                               # Calls per second to a sparse kernel (fixed cost of each product or solve).
+    'gammas':  2e4,                                                                 # Nodes per second for the dense assembly of K, one least-squares problem at a time (Gammas.Cloud).
+    'weights': 2e5,                                                                 # Nodes per second for the batched Gammas of the sparse engines (Gammas.Weights).
+    'numba':   0.3,                                                                 # Seconds to import Numba and load the compiled kernels, once per process.
+    'disk':    2e8,                                                                 # Bytes per second written to disk.
+}
+
+def Available():
+    """
+    Available
+    Function to get the available RAM in bytes (None if it cannot be found).
+    """
+    try:                                                                            # psutil is optional.
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    try:                                                                            # POSIX systems.
+        return os.sysconf('SC_AVPHYS_PAGES')*os.sysconf('SC_PAGE_SIZE')
+    except (ValueError, AttributeError, OSError):
+        return None
+
+def Estimate(m, t, nvec = 8, implicit = False, itemsize = 8):
+    """
+    Estimate
+    Function to estimate the memory and the time of each execution strategy.
+
+    Input:
+        m               int             Number of nodes.
+        t               int             Number of time steps.
+        nvec            int             Maximum number of neighbors.
+        implicit        Logical         Implicit scheme.
+        itemsize        int             Bytes of each stored value (8: float64, 4: float32).
+
+    Output:
+        estimates       dict            {(engine, stream): (memory in bytes, time in seconds)} for the strategies that can run the scheme.
+                                            'dense':   Full m x m propagator.
+                                            'ellpack': Sparse explicit steps (fixed-width stencils).
+                                            'sparse':  Sparse steps, with a sparse LU factorization for the implicit scheme.
+                                        With stream = True the solutions are written to disk during the time steps instead of kept in RAM.
+    """
+
+    n       = nvec + 1                                                              # Stored values per row.
+    history = 2*m*t*itemsize                                                        # Computed and theoretical solutions.
+    fill    = 16*n                                                                  # Estimated nonzeros per row of the LU factors.
+    jit     = 0 if 'numba' in sys.modules else Rates['numba']                       # The kernels are loaded once.
+
+    base = {}                                                                       # (memory, time) without the solutions.
+    if implicit:
+        base['dense']  = (6*m*m*8, m/Rates['gammas'] + 3*m**3/Rates['dense'] + 2*m*m*t/Rates['dense'])
+        base['sparse'] = (m*fill*12 + 4*m*n*12, m/Rates['weights'] + m*fill**2/Rates['sparse'] + (2*(n + fill)*m/Rates['sparse'] + 3/Rates['calls'])*t)
+    else:
+        base['dense']   = (3*m*m*8, m/Rates['gammas'] + 2*m*m*t/Rates['dense'])
+        base['ellpack'] = (2*m*n*(itemsize + 8), m/Rates['weights'] + jit + (2*m*n/Rates['sparse'] + 1/Rates['calls'])*t)
+        base['sparse']  = (4*m*n*12, m/Rates['weights'] + (2*m*n/Rates['sparse'] + 1/Rates['calls'])*t)
+
+    estimates = {}
+    for engine, (memory, time) in base.items():
+        estimates[(engine, False)] = (memory + history, time)                       # Solutions in RAM.
+        stream = 4*m*8                                                              # Only a few time-levels in RAM.
+        estimates[(engine, True)]  = (memory + stream, time + history/Rates['disk'])# Solutions written to disk.
+
+    return estimates
+
+def Plan(m, t, nvec = 8, implicit = False, precision = 'double', memory = None, fraction = 0.8, verbose = True, engines = None):
+    """
+    Plan
+    Function to choose the execution strategy of a problem: the fastest one whose memory fits in the available RAM.
+    A strategy can always be forced by giving the engine (and 'stream') to AdvectionDiffusion.Cloud.
+
+    Input:
+        m               int             Number of nodes.
+        t               int             Number of time steps.
+        nvec            int             Maximum number of neighbors.
+        implicit        Logical         Implicit scheme.
+        precision       String          Precision of the solution ('double', 'single' or 'mixed').
+        memory          int             Available memory in bytes (Default: None, the available RAM).
+        fraction        Real            Fraction of the available memory that can be used (Default: 0.8).
+        verbose         Logical         Print the decision (Default: True).
+        engines         list            Engines that can be used (Default: None, all of them).
+
+    Output:
+        plan            dict            Dictionary with the 'engine', whether to 'stream' the solutions to disk and the estimated 'memory' and 'time'.
+    """
+
+    itemsize  = 8 if precision == 'double' else 4
+    estimates = Estimate(m, t, nvec, implicit, itemsize)
+    if precision == 'mixed':                                                        # Only the fixed-width kernel accumulates in float64.
+        estimates = {k: e for k, e in estimates.items() if k[0] == 'ellpack'}
+        if not estimates:
+            raise ValueError('Mixed precision is only available for the explicit scheme.')
+    if engines is not None:                                                         # Only some engines can run the problem.
+        estimates = {k: e for k, e in estimates.items() if k[0] in engines}
+        if not estimates:
+            raise ValueError(f'No engine can run the problem, the available ones are: {list(engines)}.')
+
+    if memory is None:
+        memory = Available()
+    limit = np.inf if memory is None else fraction*memory                           # Usable memory.
+
+    fits = [k for k, e in estimates.items() if e[0] <= limit]
+    if fits:                                                                        # The fastest strategy that fits.
+        choice = min(fits, key = lambda k: (estimates[k][1], k[1]))
+        reason = 'fastest that fits in memory'
+    else:                                                                           # The one with less memory.
+        choice = min(estimates, key = lambda k: estimates[k][0])
+        reason = 'WARNING: no strategy fits in memory, using the smallest one'
+
+    plan = {'engine': choice[0], 'stream': choice[1], 'memory': estimates[choice][0], 'time': estimates[choice][1]}
+    if verbose:
+        available = 'unknown' if memory is None else f'{memory/2**30:.2f} GiB'
+        print(f"\tPlan: {plan['engine']}{' + streaming' if plan['stream'] else ''} ({reason}); m = {m}, t = {t}, "
+              f"memory = {plan['memory']/2**30:.2f} GiB of {available}, time = {plan['time']:.2f} s")
+
+    return plan
+
+def History(m, t, dtype, stream = False, folder = None, name = 'u'):
+    """
+    History
+    Function to allocate an m x t array for a solution, in RAM or in a file on disk.
+
+    Input:
+        m               int             Number of nodes.
+        t               int             Number of time steps.
+        dtype           dtype           Precision of the values.
+        stream          Logical         Keep the array in a file on disk instead of RAM.
+        folder          string          Folder for the file as '<name>.npy' (Default: None, an anonymous temporary file).
+        name            string          Name of the file.
+
+    Output:
+        u               ndarray         Array with zeros (a memory map if stream is True, stored by columns so each time step is contiguous).
+    """
+
+    if not stream:
+        return np.zeros([m, t], dtype = dtype)
+    if folder is None:                                                              # Removed when the array is released.
+        return np.memmap(tempfile.TemporaryFile(), dtype = dtype, mode = 'w+', shape = (m, t), order = 'F')
+    os.makedirs(folder, exist_ok = True)                                            # Ensure the directory exists.
+    return np.lib.format.open_memmap(os.path.join(folder, name + '.npy'), mode = 'w+', dtype = dtype, shape = (m, t), fortran_order = True)
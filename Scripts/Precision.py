@@ -0,0 +1,73 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import re
+import numpy as np
+import Scripts.Errors as Errors
+import AdvectionDiffusion
+
+def Report(f, v, a, b, t, data, exam = 'test', holes = False, engine = 'ellpack', save = True):
+    """
+    Report
+    Function to measure the accuracy impact of the single and mixed precision modes against the float64 results on all the regions in a folder.
+
+    Input:
+        f               Function        Function declared with the boundary condition.
+        v               Real            Diffusion coefficient.
+        a               Real            Transport velocity on the x direction.
+        b               Real            Transport velocity on the y direction.
+        t               Integer         Number of time steps to be considered.
+        data            String          Folder with the clouds of points.
+        exam            String          Name of the example.
+        holes           Logical         Select whether the clouds have holes or not.
+        engine          String          Engine used for the computations (Default: 'ellpack').
+        save            Logical         Save the report as 'Precision.csv' in the results folder.
+
+    Output:
+        report          list            List with one row for each region and precision:
+                                            [region, precision, mean error, max |u - u_double|, relative change of the mean error].
+    """
+
+    ## Variable initialization.
+    pattern = re.compile(r'^(.*?)_p\.csv$')                                         # Look for the files with the nodes.
+    regions = sorted(match.group(1) for match in map(pattern.match, os.listdir(data)) if match)
+    report  = []                                                                    # Rows of the report.
+
+    for region in regions:                                                          # For each of the regions.
+        p = np.genfromtxt(os.path.join(data, region + '_p.csv'), delimiter = ',')   # Load the coordinates of the points.
+        for precision in ['double', 'single', 'mixed']:                             # For each of the precisions.
+            u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, f, v, a, b, t, engine = engine, precision = precision)
+                                                                                    # Compute the numerical solution.
+            er = np.mean(Errors.Cloud(p, vec, u_ap, u_ex))                          # Mean of the error.
+            if precision == 'double':                                               # Reference results.
+                u_64, er_64 = u_ap, er
+            diff = np.max(np.abs(u_ap.astype(np.float64) - u_64))                   # Deviation from the float64 solution.
+            report.append([region, precision, er, diff, abs(er - er_64)/er_64])
+            print(f'{exam}\t{region}\t{precision}\tError: {er:.6e}\tmax|u - u_64|: {diff:.3e}\tRelative change: {report[-1][4]:.3e}')
+
+    if save:                                                                        # If we are going to save.
+        folder = os.path.join('Results', exam, 'Holes' if holes else 'Clouds')
+        os.makedirs(folder, exist_ok = True)                                        # Ensure the directory exists.
+        with open(os.path.join(folder, 'Precision.csv'), 'w') as file:              # Create the file.
+            file.write('Region,Precision,Error,Max Deviation,Relative Change\n')
+            for row in report:
+                file.write('%s,%s,%.8e,%.8e,%.8e\n' % tuple(row))                   # Save the report.
+
+    return report
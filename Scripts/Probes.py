@@ -0,0 +1,172 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+
+def Barycentric(p, tt, points, k = 8):
+    """
+    Barycentric
+    Function to find the triangle that contains each point and its barycentric coordinates.
+    The candidate triangles are the 'k' triangles with the nearest centroids.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes.
+        tt              ndarray         Array with the correspondence of the n triangles.
+        points          ndarray         Array with the coordinates of the points.
+        k               int             Number of candidate triangles for each point (Default: 8).
+
+    Output:
+        nodes           ndarray         Array with the nodes of the triangle of each point (-1 if no triangle contains it).
+        w               ndarray         Array with the barycentric coordinates of each point.
+    """
+
+    from scipy.spatial import cKDTree                                               # Imported when needed.
+    tt    = np.asarray(tt).astype(int)
+    k     = min(k, len(tt))
+    cent  = p[tt, :2].mean(axis = 1)                                                # Centroids of the triangles.
+    _, nt = cKDTree(cent).query(points, k = k)                                      # Candidate triangles.
+    nt    = nt.reshape(len(points), k)
+
+    nodes = -np.ones([len(points), 3], dtype = int)
+    w     = np.zeros([len(points), 3])
+    for j in np.arange(k):                                                          # For each candidate, nearest first.
+        tri  = tt[nt[:, j]]
+        a, b, c = p[tri[:, 0], :2], p[tri[:, 1], :2], p[tri[:, 2], :2]
+        det  = (b[:, 0] - a[:, 0])*(c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0])*(b[:, 1] - a[:, 1])
+        det  = np.where(det == 0, np.nan, det)                                      # Degenerate triangles are not used.
+        l1   = ((points[:, 0] - a[:, 0])*(c[:, 1] - a[:, 1]) - (c[:, 0] - a[:, 0])*(points[:, 1] - a[:, 1]))/det
+        l2   = ((b[:, 0] - a[:, 0])*(points[:, 1] - a[:, 1]) - (points[:, 0] - a[:, 0])*(b[:, 1] - a[:, 1]))/det
+        l0   = 1 - l1 - l2
+        lw   = np.stack([l0, l1, l2], axis = 1)
+        new  = (nodes[:, 0] == -1) & np.all(lw >= -1e-12, axis = 1)                 # Points inside the triangle.
+        nodes[new], w[new] = tri[new], lw[new]
+
+    return nodes, w
+
+def Taylor(p, points, nvec = 8):
+    """
+    Taylor
+    Function to compute the GFD interpolation weights of each point from its 'nvec' + 1 nearest nodes.
+    The weights are the first row of the pseudoinverse of the second order Taylor matrix, so quadratic functions are interpolated exactly.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes.
+        points          ndarray         Array with the coordinates of the points.
+        nvec            int             Number of neighbors (Default: 8).
+
+    Output:
+        nodes           ndarray         Array with the nodes used for each point.
+        w               ndarray         Array with the weights of the nodes.
+    """
+
+    from scipy.spatial import cKDTree                                               # Imported when needed.
+    _, nodes = cKDTree(p[:, :2]).query(points, k = nvec + 1)                        # Nearest nodes.
+    dx = p[nodes, 0] - points[:, [0]]
+    dy = p[nodes, 1] - points[:, [1]]
+    M  = np.stack([np.ones_like(dx), dx, dy, dx**2/2, dx*dy, dy**2/2], axis = 1)    # 6 x (nvec + 1) Taylor matrices.
+    w  = np.linalg.pinv(np.transpose(M, (0, 2, 1)))[:, 0, :]                        # Weights of the value of the function.
+
+    return nodes, w
+
+class Probes:
+    """
+    Probes
+
+    Monitoring points of a problem.
+    The interpolation weights of the points are computed once and stored as an n x m sparse matrix, so the values at the points are a sparse product with the values on the nodes.
+    The points inside a triangle of 'tt' use barycentric weights; the other points (or all of them without triangles) use GFD weights from the nearest nodes.
+    Given to AdvectionDiffusion.Cloud, only the values at the points are kept during the time steps (n x t instead of m x t).
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes.
+        points          ndarray         Array with the coordinates of the n points.
+        tt              ndarray         Array with the correspondence of the triangles (Default: None, GFD weights for all the points).
+        nvec            int             Number of neighbors for the GFD weights (Default: 8).
+    """
+
+    def __init__(self, p, points, tt = None, nvec = 8):
+        self.points = np.atleast_2d(np.asarray(points, dtype = float))[:, :2]       # Coordinates of the points.
+        self.m      = p.shape[0]                                                    # Number of nodes.
+        self.n      = self.points.shape[0]                                          # Number of points.
+
+        nodes, w = Taylor(p, self.points, nvec)                                     # GFD weights.
+        nodes    = [nodes[i] for i in np.arange(self.n)]
+        w        = [w[i] for i in np.arange(self.n)]
+        if tt is not None and len(tt) > 0:                                          # If there are triangles.
+            tri, bar = Barycentric(p, tt, self.points)
+            for i in np.where(tri[:, 0] != -1)[0]:                                  # Points inside a triangle.
+                nodes[i], w[i] = tri[i], bar[i]
+
+        indptr = np.cumsum([0] + [len(n) for n in nodes])
+        from scipy.sparse import csr_matrix                                         # Imported when needed.
+        self.P = csr_matrix((np.concatenate(w), np.concatenate(nodes), indptr), shape = (self.n, self.m))
+        self.P.sum_duplicates()                                                     # Interpolation matrix.
+
+    def __call__(self, u):
+        """
+        Values at the points of the values on the nodes (m, or m x k for several time steps).
+        """
+        return self.P@u
+
+    def values(self, c, t):
+        """
+        Value of a coefficient (see Scripts/Fields.py) at the points at time t.
+        """
+        if callable(c):
+            return np.broadcast_to(np.asarray(c(self.points[:, 0], self.points[:, 1], t), dtype = float), self.n)
+        if np.ndim(c) > 0:                                                          # Given on the nodes.
+            return self.P@np.asarray(c, dtype = float)
+        return c
+
+    def query(self, u, t):
+        """
+        Values at the points at times t from the solution of all the time steps, m x t (in RAM, or memory-mapped with Load).
+        The time steps are assumed on [0, 1]; between two time steps the values are interpolated linearly.
+        Only the rows of the nodes used by the points and the columns of the neighboring time steps are read.
+
+        Input:
+            u           ndarray         Array with the solution on the nodes.
+            t           Real            Time, or an Array with nt times.
+
+        Output:
+            v           ndarray         n x nt Array with the values at the points (n values for a single time).
+        """
+        scalar = np.ndim(t) == 0
+        t      = np.clip(np.atleast_1d(np.asarray(t, dtype = float)), 0, 1)
+        steps  = u.shape[1] - 1
+        s      = t*steps                                                            # Position in the time steps.
+        k0     = np.minimum(np.floor(s).astype(int), steps - 1)
+        theta  = s - k0                                                             # Weight of the next time step.
+
+        rows   = np.unique(self.P.indices)                                          # Nodes used by the points.
+        cols   = np.unique(np.concatenate([k0, k0 + 1]))                            # Time steps used.
+        block  = np.asarray(u[np.ix_(rows, cols)], dtype = np.float64)              # Only the needed values are read.
+        vals   = self.P[:, rows]@block                                              # Values at the points.
+        pos    = np.searchsorted(cols, k0)
+        v      = (1 - theta)*vals[:, pos] + theta*vals[:, pos + 1]
+
+        return v[:, 0] if scalar else v
+
+def Load(folder, name = 'u_ap'):
+    """
+    Load
+    Function to open a solution stored as '<name>.npy' (see Planner.History) without reading it.
+    """
+    return np.load(os.path.join(folder, name + '.npy'), mmap_mode = 'r')
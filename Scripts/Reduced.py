@@ -0,0 +1,209 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Errors as Errors
+
+## Reduced-order (POD) model of the advection-diffusion equation on a cloud of points.
+## The inner values are approximated as u_I = Phi c, with the r columns of Phi from the snapshots of full solves.
+## The boundary values are given data and enter the reduced steps as a source term, as in Stencil.Interior.
+
+class SVD:
+    """
+    SVD
+
+    Incremental (streaming) thin SVD of a snapshot matrix that is given by blocks of columns, without keeping the snapshots.
+    For each new block X the basis is updated from the small matrix [[diag(s), U^T X], [0, R]], with QR(X - U U^T X) = Q R.
+
+    Input:
+        rank            int             Maximum number of modes (Default: None, no limit).
+        tol             float           Relative singular value under which the modes are discarded (Default: 1e-10).
+    """
+
+    def __init__(self, rank = None, tol = 1e-10):
+        self.rank = rank
+        self.tol  = tol
+        self.U    = None                                                            # Left singular vectors.
+        self.s    = np.zeros(0)                                                     # Singular values.
+        self.n    = 0                                                               # Number of snapshots added.
+
+    def add(self, X):
+        """
+        Add a block of snapshots (n values, or n x k values).
+        """
+        X = np.asarray(X, dtype = np.float64)
+        if X.ndim == 1:                                                             # A single snapshot.
+            X = X[:, None]
+        self.n += X.shape[1]
+        if self.U is None:                                                          # First block.
+            U, s, _ = np.linalg.svd(X, full_matrices = False)
+        else:
+            P       = self.U.T@X                                                    # Part in the current basis.
+            Y       = X - self.U@P
+            P2      = self.U.T@Y                                                    # Second pass, to keep the basis orthogonal.
+            P      += P2
+            Q, R    = np.linalg.qr(Y - self.U@P2)                                   # New directions.
+            r, k    = len(self.s), X.shape[1]
+            S       = np.zeros([r + k, r + k])
+            S[:r, :r], S[:r, r:], S[r:, r:] = np.diag(self.s), P, R
+            Uk, s, _ = np.linalg.svd(S)
+            U       = np.hstack([self.U, Q])@Uk
+        keep = s > self.tol*max(s[0], np.finfo(float).tiny)                         # Modes over the tolerance.
+        if self.rank is not None:
+            keep[self.rank:] = False
+        self.U, self.s = U[:, keep], s[keep]
+        return self
+
+    def extend(self, u, rows = None, block = 256):
+        """
+        Add the time steps of an m x t solution (in RAM or memory-mapped, see Planner.History), reading 'block' time steps at a time.
+        Only the given rows (Default: None, all of them) are used.
+        """
+        for k in np.arange(0, u.shape[1], block):
+            X = np.asarray(u[:, k:k + block])
+            self.add(X if rows is None else X[rows])
+        return self
+
+    def energy(self):
+        """
+        Fraction of the energy of the snapshots captured by each number of modes.
+        """
+        e = np.cumsum(self.s**2)
+        return e/e[-1]
+
+class Model:
+    """
+    Model
+
+    Reduced-order model of the advection-diffusion equation with a POD basis of the inner nodes.
+    The Gammas of u_x, u_y and the Laplacian (Gammas.Components) are projected on the basis once, so the reduced system for any coefficients v, a and b, time step and scheme is assembled from small dense matrices:
+        Explicit:   c^{n+1} = (I + K_r)c^n + K_rB u_B^n
+        Implicit:   (I - (1 - lam)K_r)c^{n+1} = (I + lam K_r)c^n + lam K_rB u_B^n + (1 - lam)K_rB u_B^{n+1}
+    with K_r = dt Phi^T K_II Phi and K_rB = dt Phi^T K_IB, and each step costs a few r x r products.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and the flag for boundary or inner node.
+        vec             ndarray         Array with the correspondence of the 'nvec' neighbors of each node.
+        basis           ndarray         Array with the r modes on the inner nodes (for example, SVD.U).
+        D               ndarray         Derivative stencils, from Gammas.Derivatives (Default: None, computed here).
+    """
+
+    def __init__(self, p, vec, basis, D = None):
+        from scipy.sparse import csr_matrix                                         # Imported when needed.
+        self.p    = p
+        self.vec  = vec                                                             # Padded array or Neighbors.NeighborGraph.
+        self.Phi  = np.asarray(basis, dtype = np.float64)                           # POD basis.
+        self.I    = np.where(p[:, 2] == 0)[0]                                       # Inner nodes.
+        self.B    = np.where(p[:, 2] != 0)[0]                                       # Boundary nodes.
+        self.area = None                                                            # Areas of the nodes (for the errors).
+
+        C    = Gammas.Components(p, vec, D)                                         # Gammas of u_x, u_y and (u_xx + u_yy)/2.
+        m, n = C.shape[1:]
+        idx  = Gammas.Index(vec).reshape(-1)
+        self.KI, self.KB = [], []
+        for c in C:                                                                 # Projection of each component.
+            K = csr_matrix((c.reshape(-1), idx, np.arange(0, m*n + 1, n)), shape = (m, m))
+            K = K[self.I]
+            self.KI.append(self.Phi.T@(K[:, self.I]@self.Phi))                      # r x r.
+            self.KB.append((K[:, self.B].T@self.Phi).T)                             # r x mB.
+
+    @property
+    def r(self):
+        return self.Phi.shape[1]
+
+    def system(self, v, a, b, dt, implicit = False, lam = 0.5):
+        """
+        Reduced system for the given coefficients and scheme: c^{n+1} = G c^n + H0 u_B^n + H1 u_B^{n+1}.
+        """
+        K  = dt*(2*v*self.KI[2] - a*self.KI[0] - b*self.KI[1])                      # Reduced operator.
+        KB = dt*(2*v*self.KB[2] - a*self.KB[0] - b*self.KB[1])                      # Reduced boundary source.
+        Id = np.identity(self.r)
+        if implicit == False:                                                       # For the explicit scheme.
+            return Id + K, KB, np.zeros_like(KB)
+        A = Id - (1 - lam)*K                                                        # Reduced implicit system.
+        return np.linalg.solve(A, Id + lam*K), np.linalg.solve(A, lam*KB), np.linalg.solve(A, (1 - lam)*KB)
+
+    def project(self, u):
+        """
+        Coordinates in the basis of the inner values of a solution (m, or m x k values).
+        """
+        return self.Phi.T@np.asarray(u, dtype = np.float64)[self.I]
+
+    def reconstruct(self, c, u_B):
+        """
+        Solution on all the nodes from the reduced coordinates (r, or r x k values) and the boundary values.
+        """
+        c = np.asarray(c)
+        u = np.zeros((len(self.p[:, 0]),) + c.shape[1:])
+        u[self.I] = self.Phi@c
+        u[self.B] = u_B
+        return u
+
+    def Run(self, f, v, a, b, t, implicit = False, lam = 0.5):
+        """
+        Solve the reduced model.
+
+        Input:
+            f           Function        Function declared with the boundary condition (and the initial condition).
+            v           Real            Diffusion coefficient.
+            a           Real            Transport velocity on the x direction.
+            b           Real            Transport velocity on the y direction.
+            t           Integer         Number of time steps to be considered.
+            implicit    Logical         Implicit scheme (Default: False).
+            lam         Real            Lambda parameter for the implicit scheme (Default: 0.5).
+
+        Output:
+            c           r x t           Array           Array with the reduced coordinates.
+            u_B         mB x t          Array           Array with the boundary values.
+        """
+
+        T   = np.linspace(0, 1, t)                                                  # Time discretization.
+        dt  = T[1] - T[0]                                                           # dt computation.
+        p   = self.p
+        u_B = np.stack([f(p[self.B, 0], p[self.B, 1], T[k], v, a, b) for k in np.arange(t)], axis = 1)
+                                                                                    # Boundary values of all the time steps.
+        G, H0, H1 = self.system(v, a, b, dt, implicit, lam)
+        F = H0@u_B[:, :-1] + H1@u_B[:, 1:]                                          # Boundary source of all the time steps.
+
+        c       = np.zeros([self.r, t])
+        c[:, 0] = self.project(f(p[:, 0], p[:, 1], T[0], v, a, b))                  # The initial condition is projected.
+        for k in np.arange(1, t):                                                   # For each of the time steps.
+            c[:, k] = G@c[:, k - 1] + F[:, k - 1]
+
+        return c, u_B
+
+    def Errors(self, c, u_B, u_full, block = 256):
+        """
+        Errors of the reduced model against the solution of the full solver (m x t, in RAM or memory-mapped).
+
+        Output:
+            errors      dict            Dictionary with:
+                                            'reduced':      Errors of the reduced solution (Errors.Accumulator summary, relative to the full solution).
+                                            'projection':   Errors of the best approximation in the basis, Phi Phi^T u_I (same summary).
+        """
+        if self.area is None:
+            self.area = Errors.Areas(self.p, self.vec)                              # Areas of the nodes.
+        reduced    = Errors.Accumulator(area = self.area)
+        projection = Errors.Accumulator(area = self.area)
+        for k in np.arange(0, u_full.shape[1], block):                              # By blocks of time steps.
+            u = np.asarray(u_full[:, k:k + block], dtype = np.float64)
+            reduced.add(self.reconstruct(c[:, k:k + block], u_B[:, k:k + block]), u)
+            projection.add(self.reconstruct(self.project(u), u[self.B]), u)
+        return {'reduced': reduced.summary(), 'projection': projection.summary()}
@@ -0,0 +1,194 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+
+def Permutation(p, vec, mode = 'rcm'):
+    """
+    Permutation
+    Function to find a node ordering that improves the memory locality of the neighbors of each node.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        vec             ndarray         Array with matching neighbors of each node.
+        mode            string          Choose the ordering to be used:
+                                            'rcm': Reverse Cuthill-McKee on the neighbor graph (default).
+                                            'hilbert': Hilbert space-filling curve on the coordinates.
+                                            'morton': Morton (Z-order) space-filling curve on the coordinates.
+
+    Output:
+        perm            ndarray         Array with the new ordering; the new node i is the old node perm[i].
+    """
+
+    if mode == 'rcm':
+        ## Reverse Cuthill-McKee.
+        from scipy.sparse.csgraph import reverse_cuthill_mckee                      # Imported when needed.
+        G    = graph(vec)                                                           # Neighbor graph.
+        perm = reverse_cuthill_mckee(G + G.T, symmetric_mode = True)                # Bandwidth reducing ordering.
+
+    elif mode == 'hilbert':
+        ## Hilbert curve.
+        ix, iy = grid_coordinates(p)                                                # Integer coordinates of the nodes.
+        perm   = np.argsort(hilbert_index(ix, iy), kind = 'stable')                 # Sort the nodes along the curve.
+
+    elif mode == 'morton':
+        ## Morton curve.
+        ix, iy = grid_coordinates(p)                                                # Integer coordinates of the nodes.
+        perm   = np.argsort(morton_index(ix, iy), kind = 'stable')                  # Sort the nodes along the curve.
+
+    else:
+        raise ValueError(f'Unknown reordering mode: {mode}')
+
+    return np.asarray(perm, dtype = int)
+
+def graph(vec):
+    """
+    graph
+    Function to assemble the (directed) neighbor graph as a sparse adjacency matrix.
+
+    Input:
+        vec             ndarray         Array with matching neighbors of each node.
+
+    Output:
+        G               csr_matrix      Adjacency matrix of the neighbor graph.
+    """
+
+    from scipy.sparse import csr_matrix                                             # Imported when needed.
+    m     = vec.shape[0]                                                            # The total number of nodes.
+    rows  = np.repeat(np.arange(m), vec.shape[1])                                   # Row index of each entry.
+    cols  = vec.reshape(-1)                                                         # Column index of each entry.
+    valid = cols != -1                                                              # Discard the empty slots.
+    G     = csr_matrix((np.ones(valid.sum()), (rows[valid], cols[valid])), shape = (m, m))
+
+    return G
+
+def grid_coordinates(p, bits = 16):
+    """
+    grid_coordinates
+    Function to map the coordinates of the nodes to a 2^bits x 2^bits integer grid.
+    """
+    xy    = p[:, :2] - p[:, :2].min(axis = 0)                                       # Translate the nodes to the origin.
+    scale = xy.max()                                                                # Size of the bounding box.
+    if scale == 0:
+        scale = 1
+    ij = np.floor(xy/scale*(2**bits - 1)).astype(np.int64)                          # Integer coordinates.
+    return ij[:, 0], ij[:, 1]
+
+def morton_index(ix, iy, bits = 16):
+    """
+    morton_index
+    Function to compute the position of each node along the Morton (Z-order) curve by bit interleaving.
+    """
+    d = np.zeros(len(ix), dtype = np.int64)                                         # Index initialization with zeros.
+    for s in np.arange(bits):                                                       # For each bit.
+        d |= ((ix >> s) & 1) << (2*s)                                               # Bit of x.
+        d |= ((iy >> s) & 1) << (2*s + 1)                                           # Bit of y.
+    return d
+
+def hilbert_index(ix, iy, bits = 16):
+    """
+    hilbert_index
+    Function to compute the position of each node along the Hilbert curve.
+    """
+    x = ix.copy()
+    y = iy.copy()
+    d = np.zeros(len(ix), dtype = np.int64)                                         # Index initialization with zeros.
+    s = 1 << (bits - 1)
+    while s > 0:                                                                    # From the coarsest to the finest level.
+        rx = ((x & s) > 0).astype(np.int64)                                         # Quadrant in x.
+        ry = ((y & s) > 0).astype(np.int64)                                         # Quadrant in y.
+        d += s*s*((3*rx) ^ ry)                                                      # Add the quadrant contribution.
+        flip     = (ry == 0) & (rx == 1)                                            # Quadrants to be reflected.
+        x[flip]  = s - 1 - x[flip]
+        y[flip]  = s - 1 - y[flip]
+        swap     = ry == 0                                                          # Quadrants to be rotated.
+        x[swap], y[swap] = y[swap], x[swap]
+        s >>= 1
+    return d
+
+def Apply(p, tt, vec, perm):
+    """
+    Apply
+    Function to renumber the nodes, the triangles and the neighbors with a given permutation.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt              ndarray         Array with the correspondence of the n triangles (can be empty).
+        vec             ndarray         Array with matching neighbors of each node.
+        perm            ndarray         Array with the new ordering; the new node i is the old node perm[i].
+
+    Output:
+        p               ndarray         Reordered coordinates of the nodes.
+        tt              ndarray         Triangles with the new numbering.
+        vec             ndarray         Reordered neighbors with the new numbering.
+    """
+
+    inv = inverse(perm)                                                             # Position of each old node in the new ordering.
+    p   = p[perm]                                                                   # Reorder the nodes.
+    vec = renumber(vec[perm], inv)                                                  # Reorder and renumber the neighbors.
+    if len(tt) > 0:                                                                 # If there is a triangulation.
+        tt = inv[np.asarray(tt, dtype = int)]                                       # Renumber the triangles.
+
+    return p, tt, vec
+
+def Restore(u, vec, perm, out = None):
+    """
+    Restore
+    Function to take the results computed on a reordered cloud back to the original ordering.
+
+    Input:
+        u               ndarray         Array with values for each node (m x t) in the new ordering.
+        vec             ndarray         Array with matching neighbors of each node in the new ordering.
+        perm            ndarray         Array with the new ordering; the new node i is the old node perm[i].
+        out             ndarray         Array for the values in the original ordering, filled by blocks of columns (Default: None, a new array).
+
+    Output:
+        u               ndarray         Array with the values in the original ordering.
+        vec             ndarray         Array with the neighbors in the original ordering.
+    """
+
+    inv = inverse(perm)                                                             # Position of each old node in the new ordering.
+    if out is None:
+        u = u[inv]                                                                  # Original order of the values.
+    else:
+        for k in range(0, u.shape[1], 256):                                         # For each block of columns.
+            out[:, k:k + 256] = u[inv, k:k + 256]                                   # Original order of the values.
+        u = out
+    vec = renumber(vec[inv], perm)                                                  # Original order and numbering of the neighbors.
+
+    return u, vec
+
+def inverse(perm):
+    """
+    inverse
+    Function to compute the inverse of a permutation.
+    """
+    inv       = np.empty_like(perm)
+    inv[perm] = np.arange(len(perm))
+    return inv
+
+def renumber(vec, new):
+    """
+    renumber
+    Function to replace each neighbor index j in vec by new[j], keeping the empty slots (-1).
+    """
+    vec        = vec.copy()
+    valid      = vec != -1
+    vec[valid] = new[vec[valid]]
+    return vec
@@ -0,0 +1,166 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Stencil as Stencil
+import Scripts.Fields as Fields
+from Scripts.Probes import Probes
+
+def Departure(p, a, b, t, dt):
+    """
+    Departure
+    Function to trace the departure points of the nodes back along the velocity (a, b) from time t + dt to time t.
+    For velocities given as functions the midpoint rule is used; otherwise the velocity of each node is used.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes.
+        a               Function        Transport velocity on the x direction (a Real, an Array or a Function, see Scripts/Fields.py).
+        b               Function        Transport velocity on the y direction.
+        t               Real            Time of the departure points.
+        dt              Real            Time step.
+
+    Output:
+        x               ndarray         Array with the coordinates of the departure points.
+    """
+
+    def velocity(q, s):                                                             # Velocity on the points q at time s.
+        return np.stack([np.broadcast_to(Fields.Evaluate(c, q, s), len(q)) for c in (a, b)], axis = 1)
+
+    x = p[:, :2]
+    if Fields.Varying(a, b):                                                        # Midpoint rule.
+        q        = p.copy()
+        q[:, :2] = x - (dt/2)*velocity(p, t + dt)
+        return x - dt*velocity(q, t + dt/2)
+    return x - dt*velocity(p, t)
+
+def Bounded(advection, u):
+    """
+    Bounded
+    Function to interpolate the solution at the departure points, bounded by the values of the nodes used for each point.
+    The GFD weights are not monotone and, with small time steps, the departure points are close to the nodes; without the bounds the interpolation errors grow over the time steps.
+
+    Input:
+        advection       Probes          Interpolation weights of the departure points (Scripts/Probes.py).
+        u               ndarray         Array with the solution on the nodes.
+
+    Output:
+        u               ndarray         Array with the solution at the departure points.
+    """
+
+    P    = advection.P
+    vals = u[P.indices]                                                             # Values of the nodes used.
+    lo   = np.minimum.reduceat(vals, P.indptr[:-1])
+    hi   = np.maximum.reduceat(vals, P.indptr[:-1])
+    return np.clip(P@u, lo, hi)
+
+def Cloud(p, f, v, a, b, t, triangulation = False, tt = [], implicit = False, lam = 0.5, geometry = None, interpolation = 'gfd'):
+    """
+    2D Advection-Diffusion Equation with operator splitting and semi-Lagrangian advection on Unstructured Clouds of Points.
+
+    Each time step is split (Strang splitting) in half a step of diffusion, a step of advection and half a step of diffusion:
+        Diffusion:  The GFD weights of v*Laplacian, with the explicit or the implicit scheme (Stencil.Sparse).
+        Advection:  The value at each node is the value at its departure point, traced back along (a, b) and interpolated on the cloud (Scripts/Probes.py).
+    The interpolation weights of the departure points are computed once when the velocity does not change in time.
+    The advection step has no CFL restriction and the explicit diffusion only needs dt < h^2/(4v), so large time steps can be used on advection-dominated problems.
+    Each step adds the interpolation error at the departure points, so the error grows when the time step is refined; with many small steps the plain GFD scheme is more accurate.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and the flag for boundary or inner node.
+        f               Function        Function declared with the boundary condition.
+        v               Real            Diffusion coefficient (a Real or an Array, see Scripts/Fields.py).
+        a               Real            Transport velocity on the x direction (a Real, an Array or a Function).
+        b               Real            Transport velocity on the y direction (a Real, an Array or a Function).
+        t               Integer         Number of time steps to be considered.
+        triangulation   Logical         Select whether or not there is a triangulation available for the neighbors.
+        tt              ndarray         Array with the triangulation indexes.
+        implicit        Logical         Implicit scheme for the diffusion (Default: False).
+        lam             Real            Lambda parameter for the implicit scheme (Default: 0.5).
+        geometry        dict            Geometry of the cloud computed beforehand ('vec' and optionally 'D'), as in AdvectionDiffusion.Cloud.
+        interpolation   String          Interpolation at the departure points.
+                                            'gfd':    Second order GFD weights from the nearest nodes (Default).
+                                            'linear': Barycentric weights in the triangles of tt (monotone, more diffusive).
+
+    Output:
+        u_ap        m x t           Array           Array with the approximation computed by the routine.
+        u_ex        m x t           Array           Array with the theoretical solution.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+    """
+
+    # Variable initialization
+    if callable(v):
+        raise ValueError('The splitting scheme needs a diffusion coefficient that does not change in time.')
+    if interpolation not in ('gfd', 'linear'):
+        raise ValueError(f'Unknown interpolation: {interpolation}')
+    m    = len(p[:, 0])                                                             # The total number of nodes is calculated.
+    nvec = 8                                                                        # Maximum number of neighbors for each node.
+    T    = np.linspace(0, 1, t)                                                     # Time discretization.
+    dt   = T[1] - T[0]                                                              # dt computation.
+
+    # Neighbor search for all the nodes.
+    D = None
+    if geometry is not None:                                                        # If the geometry was computed beforehand.
+        vec = geometry['vec']                                                       # Padded array or Neighbors.NeighborGraph.
+        D   = geometry.get('D')
+    elif triangulation == True:                                                     # If there are triangles available.
+        vec = Neighbors.Triangulation(p, tt, nvec)
+    else:                                                                           # If there are no triangles available.
+        vec = Neighbors.Cloud(p, nvec)
+
+    boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
+    u_ap   = np.zeros([m, t])                                                       # u_ap initialization with zeros.
+
+    # Boundary and initial conditions.
+    for k in np.arange(t):                                                          # For each time step.
+        u_ap[boun_n, k] = f(p[boun_n, 0], p[boun_n, 1], T[k], *Fields.Values(p, T[k], v, a, b, boun_n))
+    u_ap[:, 0] = f(p[:, 0], p[:, 1], T[0], *Fields.Values(p, T[0], v, a, b))        # The initial condition is assigned.
+
+    # Diffusion: half a time step.
+    L         = Fields.Operator(p, 0, v, 0, 0)                                      # The values of v*Laplacian.
+    diffusion = Stencil.Sparse((dt/2)*Gammas.Weights(p, vec, L, D = D), Gammas.Index(vec), implicit, lam)
+
+    # Advection: interpolation weights of the departure points.
+    triangles = tt if interpolation == 'linear' else None
+    varying   = Fields.Varying(a, b)                                                # Velocity that changes in time.
+    if not varying:
+        advection = Probes(p, Departure(p, a, b, T[0], dt), triangles, nvec)        # The same weights for all the time steps.
+
+    # Strang splitting.
+    u  = u_ap[:, 0].copy()                                                          # Current time-level.
+    un = np.empty(m)                                                                # Buffer for the half steps.
+    for k in np.arange(1, t):                                                       # For each of the time steps.
+        diffusion.step(u, un)                                                       # Half a step of diffusion.
+        un[boun_n] = u_ap[boun_n, k - 1]
+        if varying:
+            advection = Probes(p, Departure(p, a, b, T[k - 1], dt), triangles, nvec)
+                                                                                    # Departure points of this time step.
+        u = Bounded(advection, un)                                                  # Advection along the characteristics.
+        u[boun_n] = u_ap[boun_n, k]
+        diffusion.step(u, un)                                                       # Half a step of diffusion.
+        un[boun_n] = u_ap[boun_n, k]
+        u_ap[:, k] = un                                                             # Save the computed solution.
+        u, un      = un, u                                                          # Swap the buffers.
+
+    # Theoretical Solution
+    u_ex = np.zeros([m, t])                                                         # u_ex initialization with zeros.
+    for k in np.arange(t):                                                          # For all the time steps.
+        u_ex[:, k] = f(p[:, 0], p[:, 1], T[k], *Fields.Values(p, T[k], v, a, b))    # The theoretical solution is computed.
+
+    return u_ap, u_ex, Neighbors.Padded(vec)
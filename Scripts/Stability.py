@@ -0,0 +1,208 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Fields as Fields
+
+def Operator(p, vec, L, D = None):
+    """
+    Operator
+    Function to assemble the GFD operator restricted to the inner nodes.
+    The values on the boundary are given, so the stability of the time steps only depends on the inner-inner block.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        vec             ndarray         Array with matching neighbors of each node.
+        L               ndarray         Array with the values of the differential operator.
+        D               ndarray         Derivative stencils from Gammas.Derivatives (Default: None, computed here).
+
+    Output:
+        G               csr_matrix      Sparse GFD operator on the inner nodes.
+    """
+
+    from scipy.sparse import csr_matrix                                             # Imported when needed.
+    W    = Gammas.Weights(p, vec, L, D = D)                                         # Gammas in ELLPACK layout.
+    idx  = Gammas.Index(vec)                                                        # Columns of the Gammas.
+    inne = np.where(p[:, 2] == 0)[0]                                                # Inner nodes.
+    new  = np.zeros(p.shape[0], dtype = int) - 1
+    new[inne] = np.arange(len(inne))                                                # Numbering of the inner nodes.
+
+    rows = np.repeat(np.arange(len(inne)), idx.shape[1])
+    cols = new[idx[inne]].reshape(-1)
+    data = W[inne].reshape(-1)
+    keep = cols != -1                                                               # Drop the boundary columns.
+    G    = csr_matrix((data[keep], (rows[keep], cols[keep])), shape = (len(inne), len(inne)))
+
+    return G
+
+def Gershgorin(G):
+    """
+    Gershgorin
+    Function to compute the Gershgorin discs of the operator.
+
+    Input:
+        G               csr_matrix      Sparse GFD operator.
+
+    Output:
+        c               ndarray         Centers of the discs (the diagonal of G).
+        r               ndarray         Radii of the discs.
+    """
+
+    c = G.diagonal()                                                                # Centers.
+    r = np.asarray(abs(G).sum(axis = 1)).reshape(-1) - np.abs(c)                    # Radii.
+    return c, r
+
+def Spectrum(G, k = 12):
+    """
+    Spectrum
+    Function to estimate the extreme eigenvalues of the operator with Arnoldi iterations (ARPACK).
+    The eigenvalues of largest modulus and of largest real part are computed; if the iterations do not converge, the converged ones are kept.
+
+    Input:
+        G               csr_matrix      Sparse GFD operator.
+        k               int             Number of eigenvalues of each kind (Default: 12).
+
+    Output:
+        lam             ndarray         Estimated extreme eigenvalues (can be empty).
+    """
+
+    from scipy.sparse.linalg import eigs, ArpackNoConvergence                       # Imported when needed.
+    n   = G.shape[0]
+    k   = min(k, n - 2)
+    lam = []
+    if k < 1:                                                                       # Too small for ARPACK.
+        return np.linalg.eigvals(G.toarray())
+    for which in ('LM', 'LR'):                                                      # Largest modulus and largest real part.
+        try:
+            lam.append(eigs(G, k = k, which = which, return_eigenvectors = False, maxiter = 50*n, tol = 1e-6))
+        except ArpackNoConvergence as error:
+            lam.append(error.eigenvalues)                                           # Keep the converged eigenvalues.
+    return np.concatenate(lam)
+
+def Time_Step(lam, implicit = False, theta = 0.5):
+    """
+    Time_Step
+    Function to compute the largest stable time step for a set of eigenvalues.
+
+    With the explicit weight theta (forward Euler is theta = 1), a mode is stable if |1 + theta*z| <= |1 - (1 - theta)*z| with z = dt*lambda, that is:
+        dt <= -2*Re(lambda)/((2*theta - 1)*|lambda|^2)
+    The scheme is unconditionally stable for theta <= 1/2.
+
+    Input:
+        lam             ndarray         Eigenvalues of the operator.
+        implicit        Logical         Implicit scheme (True) or forward Euler (False).
+        theta           Real            Explicit weight of the implicit scheme ('lam' in AdvectionDiffusion.Cloud).
+
+    Output:
+        dt              float           Largest stable time step (np.inf if there is no restriction).
+    """
+
+    s   = 2*theta - 1 if implicit else 1                                            # Weight of the |lambda|^2 term.
+    lam = lam[np.abs(lam) > 0]
+    if s <= 0 or len(lam) == 0:                                                     # No restriction.
+        return np.inf
+    dt = -2*lam.real/(s*np.abs(lam)**2)
+    dt = dt[lam.real < 0]                                                           # Only the decaying modes give a bound.
+    return np.min(dt) if len(dt) > 0 else np.inf
+
+def Analyze(p, vec, v, a, b, implicit = False, lam = 0.5, D = None, safety = 0.9, dense = 2000, verbose = True):
+    """
+    Analyze
+    Function to estimate the largest stable time step of the GFD scheme on a cloud of points.
+
+    The Gershgorin discs of the operator on the inner nodes give a first, guaranteed bound: if every disc is in the left half-plane, the scheme is stable for
+        dt <= 2/((2*theta - 1)*max(|c| + r)).
+    The eigenvalues then give the actual limit: all of them for up to 'dense' inner nodes, otherwise the extreme ones estimated with Arnoldi iterations.
+    Arnoldi iterations can miss the eigenvalue that limits the time step, so if some eigenvalue has a non-negative real part only the Gershgorin bound is used;
+    when the discs reach the right half-plane too, no time step is stable and the chosen time step is 0.
+    Coefficients that change in time are taken at t = 0.
+
+    Input:
+        p               ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        vec             ndarray         Array with matching neighbors of each node.
+        v               Real            Diffusion coefficient (a Real, an Array or a Function, see Scripts/Fields.py).
+        a               Real            Transport velocity on the x direction.
+        b               Real            Transport velocity on the y direction.
+        implicit        Logical         Implicit scheme (True) or forward Euler (False).
+        lam             Real            Lambda parameter of the implicit scheme (explicit weight).
+        D               ndarray         Derivative stencils from Gammas.Derivatives (Default: None, computed here).
+        safety          Real            Safety factor applied to the time step (Default: 0.9).
+        dense           int             Largest number of inner nodes for which all the eigenvalues are computed (Default: 2000).
+        verbose         Logical         Print the report (Default: True).
+
+    Output:
+        report          dict            Dictionary with:
+                                            'gershgorin': time step guaranteed by the Gershgorin discs (0 if they give no bound).
+                                            'spectrum':   time step from the eigenvalues (0 if some of them are unstable).
+                                            'unstable':   number of eigenvalues with non-negative real part.
+                                            'dt':         chosen time step (with the safety factor, 0 if no time step is stable).
+                                            't':          number of time steps on [0, 1] (None if there is no restriction or no stable time step).
+    """
+
+    L = Fields.Operator(p, 0, v, a, b)                                              # The values of the differential operator.
+    G = Operator(p, vec, L, D)                                                      # Operator on the inner nodes.
+    s = 2*lam - 1 if implicit else 1
+
+    c, r = Gershgorin(G)                                                            # Gershgorin discs.
+    if s <= 0:                                                                      # Unconditionally stable.
+        dt_g = np.inf
+    elif np.all(c + r <= 0):                                                        # All the discs in the left half-plane.
+        dt_g = 2/(s*np.max(np.abs(c) + r))
+    else:
+        dt_g = 0
+
+    if G.shape[0] <= dense:                                                         # All the eigenvalues.
+        eig = np.linalg.eigvals(G.toarray())
+    else:
+        eig = Spectrum(G)                                                           # Extreme eigenvalues.
+    unstable = int(np.sum(eig.real >= 1e-10*np.max(np.abs(eig), initial = 1)))
+    dt_s     = Time_Step(eig, implicit, lam)
+    if len(eig) == 0:                                                               # No eigenvalue converged.
+        dt_s = dt_g
+    if unstable > 0:                                                                # The eigenvalues give no bound.
+        dt_s = 0
+    dt = safety*max(dt_s, dt_g)                                                     # The Gershgorin bound is always safe.
+    t  = None if np.isinf(dt) or dt == 0 else int(np.ceil(1/dt)) + 1
+
+    if verbose:
+        bound = f'dt <= {dt_g:.4e}' if dt_g > 0 else 'no bound (some discs reach the right half-plane)'
+        print(f'\tGershgorin: Re(lambda) >= {np.min(c - r):.4e}, |lambda| <= {np.max(np.abs(c) + r):.4e}, {bound}')
+        print(f'\tSpectrum:   |lambda| = {np.max(np.abs(eig), initial = 0):.4e}, dt <= {dt_s:.4e}')
+        if unstable > 0:
+            print(f'\tWarning: {unstable} eigenvalues with non-negative real part, only the Gershgorin bound is used.')
+        print(f'\tStable time step: dt = {dt:.4e} ({t} time steps)')
+
+    return {'gershgorin': dt_g, 'spectrum': dt_s, 'unstable': unstable, 'dt': dt, 't': t}
+
+def Steps(p, vec, v, a, b, implicit = False, lam = 0.5, D = None, safety = 0.9, dense = 2000, verbose = True):
+    """
+    Steps
+    Function to choose the number of time steps on [0, 1] with the largest stable time step (see Analyze).
+
+    Output:
+        t               int             Number of time steps.
+    """
+
+    report = Analyze(p, vec, v, a, b, implicit, lam, D, safety, dense, verbose)
+    if report['dt'] == 0:
+        raise ValueError('No time step is stable, some eigenvalues have a non-negative real part; the number of time steps must be given.')
+    if report['t'] is None:
+        raise ValueError('The scheme is unconditionally stable, the number of time steps must be given.')
+    return max(report['t'], 2)
@@ -0,0 +1,450 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+
+numba   = None                                                                      # Numba is optional, imported when a kernel is needed.
+kernels = None                                                                      # Compiled kernels (False if Numba is not available).
+
+def load_kernels():
+    """
+    load_kernels
+    Function to import Numba and define the JIT kernels the first time they are needed.
+    Returns the kernels (ellpack_step, ellpack_step_f64), or None if Numba is not available.
+    """
+    global numba, kernels
+    if kernels is None:
+        try:
+            import numba
+        except ImportError:
+            kernels = False
+            return None
+
+        @numba.njit(parallel = True, cache = True)
+        def ellpack_step(W, idx, u, un):
+            """
+            Fused gather-multiply-sum kernel: un[i] = sum_j W[i, j]*u[idx[i, j]].
+            """
+            m, n = W.shape
+            for i in numba.prange(m):                                               # Rows are distributed among the threads.
+                s = W[i, 0]*u[idx[i, 0]]
+                for j in range(1, n):                                               # For each of the slots of the row.
+                    s += W[i, j]*u[idx[i, j]]
+                un[i] = s
+
+        @numba.njit(parallel = True, cache = True)
+        def ellpack_step_f64(W, idx, u, un):
+            """
+            Same kernel than ellpack_step, with the products and the sum computed in float64.
+            """
+            m, n = W.shape
+            for i in numba.prange(m):                                               # Rows are distributed among the threads.
+                s = np.float64(W[i, 0])*np.float64(u[idx[i, 0]])
+                for j in range(1, n):                                               # For each of the slots of the row.
+                    s += np.float64(W[i, j])*np.float64(u[idx[i, j]])
+                un[i] = s
+
+        kernels = (ellpack_step, ellpack_step_f64)
+    return kernels or None
+
+class Ellpack:
+    """
+    Ellpack
+
+    Time-stepping engine for the explicit GFD scheme with the operator stored in a fixed-width (ELLPACK) layout.
+    The weights and indices are stored as m x (nvec + 1) arrays, as given by Gammas.Weights and Gammas.Index, so one explicit step is a single gather-multiply-sum over the rows.
+    If Numba is available the kernel is JIT-compiled and multithreaded; otherwise a column-by-column NumPy kernel is used.
+    In both cases the new time-level is written in place and no memory is allocated during the time steps.
+    The weights and the state are used with the precision in which they are given; with float32 data the sums can optionally be accumulated in float64.
+
+    Input:
+        W               ndarray         Array with the weights of each node and its neighbors.
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        jit             bool            Use the Numba kernel if available (Default: True).
+        accumulate      dtype           Precision for the products and sums (Default: None, the precision of W).
+                                            np.float64: float64 accumulation of float32 data.
+    """
+
+    def __init__(self, W, idx, jit = True, accumulate = None):
+        self.W   = np.ascontiguousarray(W)                                          # Row-major weights.
+        self.idx = np.ascontiguousarray(idx, dtype = np.intp)                       # Row-major indices.
+        self.jit = jit and load_kernels() is not None                               # Choose the kernel.
+        self.acc = None if accumulate is None or np.dtype(accumulate) == self.W.dtype else np.dtype(accumulate)
+        if self.acc is not None and self.acc != np.float64:
+            raise ValueError('Only float64 accumulation is supported.')
+        if not self.jit:
+            self.WT   = np.ascontiguousarray(self.W.T)                              # Column-major weights for the NumPy kernel.
+            self.idxT = np.ascontiguousarray(self.idx.T)                            # Column-major indices for the NumPy kernel.
+            self.tmp  = np.empty(self.W.shape[0], dtype = self.W.dtype)             # Buffer for the gathered values.
+            if self.acc is not None:
+                self.prod = np.empty(self.W.shape[0], dtype = self.acc)             # Buffer for the products.
+                self.sum  = np.empty(self.W.shape[0], dtype = self.acc)             # Buffer for the sums.
+
+    def step(self, u, un, rows = None):
+        """
+        Compute one explicit step, un = K2@u, writing the result in the preallocated array un.
+        With 'rows' only the first rows are computed.
+        """
+        r = self.W.shape[0] if rows is None else rows                               # Rows to compute.
+        if self.jit and self.acc is None:
+            kernels[0](self.W[:r], self.idx[:r], u, un)                             # Fused kernel.
+        elif self.jit:
+            kernels[1](self.W[:r], self.idx[:r], u, un)                             # Fused kernel with float64 accumulation.
+        elif self.acc is not None:
+            tmp, prod, sum = self.tmp[:r], self.prod[:r], self.sum[:r]
+            np.take(u, self.idxT[0, :r], out = tmp)                                 # Gather the central nodes.
+            np.multiply(tmp, self.WT[0, :r], out = sum, dtype = self.acc)           # Multiply by their weights.
+            for j in np.arange(1, self.WT.shape[0]):                                # For each of the neighbor slots.
+                np.take(u, self.idxT[j, :r], out = tmp)                             # Gather the neighbors.
+                np.multiply(tmp, self.WT[j, :r], out = prod, dtype = self.acc)      # Multiply by their weights.
+                np.add(sum, prod, out = sum)                                        # Accumulate.
+            np.copyto(un[:r], sum, casting = 'same_kind')                           # Round to the precision of the state.
+        else:
+            tmp, out = self.tmp[:r], un[:r]
+            np.take(u, self.idxT[0, :r], out = out)                                 # Gather the central nodes.
+            np.multiply(out, self.WT[0, :r], out = out)                             # Multiply by their weights.
+            for j in np.arange(1, self.WT.shape[0]):                                # For each of the neighbor slots.
+                np.take(u, self.idxT[j, :r], out = tmp)                             # Gather the neighbors.
+                np.multiply(tmp, self.WT[j, :r], out = tmp)                         # Multiply by their weights.
+                np.add(out, tmp, out = out)                                         # Accumulate.
+        return un
+
+    def update(self, W):
+        """
+        Replace the weights (same neighbors), for coefficients that change in time.
+        """
+        np.copyto(self.W, W, casting = 'same_kind')
+        if not self.jit:
+            np.copyto(self.WT, self.W.T)
+
+
+class Blocked:
+    """
+    Blocked
+
+    Time-stepping engine for the explicit GFD scheme with temporal blocking.
+    One step streams all the weights and the state through memory; here the nodes are split in tiles that fit in cache (contiguous pieces of the ordering, so the nodes should be reordered first) and each tile is advanced 'depth' steps before moving to the next one.
+    To advance a tile s steps without the other tiles, the tile takes a halo with the nodes that are up to s neighbors away (from idx): step j computes the tile and the first s - j layers of its halo.
+    The nodes of a tile are stored in layers (the tile first, then each layer of the halo), so the rows of each step are the first rows of its local arrays.
+    Each row is computed with the Ellpack kernel, in the same order, so the results match Ellpack bit-for-bit; the halo rows are computed again by the neighboring tiles.
+
+    Input:
+        W               ndarray         Array with the weights of each node and its neighbors (explicit formulation).
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        boun            ndarray         Array with the flags of the boundary nodes.
+        depth           int             Number of time steps of each block (Default: 4).
+        tile            int             Number of nodes of each tile (Default: 8192).
+        accumulate      dtype           Precision for the products and sums, as in Ellpack (Default: None).
+    """
+
+    def __init__(self, W, idx, boun, depth = 4, tile = 8192, accumulate = None):
+        m          = W.shape[0]
+        self.depth = max(1, int(depth))
+        self.tiles = []
+        pos        = np.zeros(m, dtype = np.intp) - 1                               # Local position of each node.
+        for own in np.array_split(np.arange(m), max(1, int(np.ceil(m/tile)))):      # For each tile.
+            nodes, sizes = own, [len(own)]
+            pos[own]     = np.arange(len(own))
+            start        = 0                                                        # First node of the outer layer.
+            for _ in np.arange(self.depth):                                         # Layers of the halo.
+                new   = np.unique(idx[nodes[start:]].reshape(-1))                   # Neighbors of the outer layer.
+                new   = new[pos[new] == -1]                                         # Nodes that are not in the tile yet.
+                pos[new] = len(nodes) + np.arange(len(new))
+                start = len(nodes)
+                nodes = np.concatenate([nodes, new])
+                sizes.append(len(nodes))
+            rows    = sizes[-2]                                                     # Rows computed in the first step, the last layer is only read.
+            stencil = Ellpack(W[nodes[:rows]], pos[idx[nodes[:rows]]], accumulate = accumulate)
+            bl      = np.where(boun[nodes[:rows]])[0]                               # Local boundary nodes.
+            self.tiles.append((nodes, sizes, stencil, bl, nodes[bl]))
+            pos[nodes] = -1                                                         # Clean the local positions.
+        self.dtype = W.dtype
+
+    def advance(self, U, k, n = None):
+        """
+        Compute the time-levels k + 1, ..., k + n of U (m x t, in RAM or memory-mapped).
+        U[:, k] is the current time-level and the boundary values of the next time-levels must be in U.
+        """
+        n = self.depth if n is None else min(n, self.depth)
+        for nodes, sizes, stencil, bl, bg in self.tiles:                            # For each tile.
+            u  = np.asarray(U[nodes, k], dtype = self.dtype)                        # Tile and halo at the current time-level.
+            un = np.empty_like(u)
+            ub = np.asarray(U[bg, k + 1:k + n + 1])                                 # Boundary values of the block.
+            for j in np.arange(1, n + 1):                                           # For each time step of the block.
+                rows = sizes[n - j]                                                 # The tile and the remaining layers.
+                stencil.step(u, un, rows)
+                inside = bl < rows
+                un[bl[inside]] = ub[inside, j - 1]                                  # The boundary condition is assigned.
+                U[nodes[:sizes[0]], k + j] = un[:sizes[0]]                          # Save the nodes of the tile.
+                u, un = un, u                                                       # Swap the buffers.
+        return U
+
+
+class Dense:
+    """
+    Dense
+
+    Time-stepping engine with the full m x m propagator (explicit or implicit), with the same interface than Ellpack.
+
+    Input:
+        K2              ndarray         Array with the propagator of the GFD scheme.
+    """
+
+    def __init__(self, K2):
+        self.K2 = K2
+
+    def step(self, u, un):
+        """
+        Compute one step, un = K2@u, writing the result in the preallocated array un.
+        """
+        return np.matmul(self.K2, u, out = un)
+
+
+def Pattern(idx, rows, cols):
+    """
+    Pattern
+    Function to get the CSR structure of a block of an operator in ELLPACK layout, with the position in the CSR data of each slot.
+    Repeated columns in a row (the empty slots point to the central node) share their position, so their values are added.
+
+    Input:
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        rows            ndarray         Array with the rows of the block.
+        cols            ndarray         Array with the columns of the block.
+
+    Output:
+        indptr          ndarray         Array with the CSR row pointers of the block.
+        indices         ndarray         Array with the CSR column indices of the block.
+        slots           ndarray         Array with the flat ELLPACK slots of the block.
+        pos             ndarray         Array with the position in the CSR data of each slot.
+    """
+
+    m, n  = idx.shape
+    new   = np.zeros(m, dtype = np.int64) - 1
+    new[cols] = np.arange(len(cols))                                                # Numbering of the columns of the block.
+    c     = new[idx[rows]].reshape(-1)
+    keep  = c != -1                                                                 # Slots inside the block.
+    slots = (rows[:, None]*n + np.arange(n)).reshape(-1)[keep]
+    keys  = np.repeat(np.arange(len(rows)), n)[keep]*len(cols) + c[keep]            # Row-major keys of the entries.
+    keys, pos = np.unique(keys, return_inverse = True)
+    indptr    = np.concatenate([[0], np.cumsum(np.bincount(keys//len(cols), minlength = len(rows)))])
+    return indptr, keys%len(cols), slots, pos
+
+def Diagonal(indptr, indices):
+    """
+    Diagonal
+    Function to find the position in the CSR data of the diagonal entry of each row.
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return np.where(indices == rows)[0]
+
+def Factorize(engine):
+    """
+    Factorize
+    Function to compute the sparse LU factorization of the implicit system of an engine.
+    """
+    from scipy.sparse.linalg import splu                                            # Imported when needed.
+    engine.lu    = splu(engine.A.tocsc())                                           # Sparse LU factorization.
+    engine.stale = False
+
+def Solve(engine, r, x, iterations = 4):
+    """
+    Solve
+    Function to solve the implicit system of an engine, A x = r, writing the solution in the preallocated array x.
+    After an update of A the factorization of the previous A is kept and the solution is improved with iterative refinement, x = x + LU^{-1}(r - A x).
+    The coefficients change little between updates, so a few iterations reach a relative residual of eps^(3/4); otherwise A is factorized again.
+    The residual is computed in the buffer engine.res.
+    """
+    x[:] = engine.lu.solve(r)
+    if engine.stale:                                                                # The factorization belongs to an older A.
+        tol = np.finfo(engine.A.dtype).eps**0.75*np.linalg.norm(r)
+        res = engine.res
+        for k in np.arange(iterations + 1):
+            Matvec(engine.A, x, res)
+            np.subtract(r, res, out = res)                                          # Residual.
+            if np.linalg.norm(res) <= tol:                                          # Converged.
+                return x
+            if k < iterations:
+                x += engine.lu.solve(res)
+        Factorize(engine)                                                           # Too slow, the factorization is updated.
+        x[:] = engine.lu.solve(r)
+    return x
+
+def Matvec(A, x, out, accumulate = False):
+    """
+    Matvec
+    Function to compute the product of a CSR matrix (or a dense block) and a vector in a preallocated array, out = A x (out += A x with accumulate),
+    without the temporary array of A@x. Operands of different precision use A@x.
+    """
+    if isinstance(A, np.ndarray) or not A.dtype == x.dtype == out.dtype:
+        if accumulate:
+            out += A@x
+        else:
+            out[:] = A@x
+        return out
+    from scipy.sparse._sparsetools import csr_matvec                                # Imported when needed.
+    if not accumulate:
+        out.fill(0)
+    csr_matvec(A.shape[0], A.shape[1], A.indptr, A.indices, A.data, x, out)         # out += A x.
+    return out
+
+
+class Sparse:
+    """
+    Sparse
+
+    Time-stepping engine with the operator stored as a sparse matrix, with the same interface than Ellpack.
+    For the explicit scheme each step is a sparse product with I + K; for the implicit scheme (I - (1 - lam)K) is factorized with a sparse LU and each step is a product and two triangular solves.
+    The CSR structure is built once and new Gammas (update) overwrite the data arrays in place; for the implicit scheme the factorization is reused with iterative refinement (see Solve).
+
+    Input:
+        K               ndarray         Array with the dt*Gammas of each node and its neighbors (Gammas.Weights layout).
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        implicit        Logical         Implicit scheme (Default: False).
+        lam             Real            Lambda parameter of the implicit scheme (Default: 0.5).
+    """
+
+    def __init__(self, K, idx, implicit = False, lam = 0.5):
+        from scipy.sparse import csr_matrix                                         # Imported when needed.
+        m = K.shape[0]
+        self.implicit, self.lam = implicit, lam
+        indptr, indices, self.slots, self.pos = Pattern(idx, np.arange(m), np.arange(m))
+        self.diag = Diagonal(indptr, indices)                                       # Central node of each row.
+        self.B    = csr_matrix((np.zeros(len(indices), dtype = K.dtype), indices, indptr), shape = (m, m))
+        self.A    = self.B.copy() if implicit == True else None                     # Implicit system, with the same structure.
+        self.lu   = None
+        self.r    = np.empty(m, dtype = K.dtype)                                    # Buffers of the implicit steps.
+        self.res  = np.empty(m, dtype = K.dtype)
+        self.update(K)
+
+    def step(self, u, un):
+        """
+        Compute one step, writing the result in the preallocated array un.
+        """
+        if self.implicit == False:
+            Matvec(self.B, u, un)
+        else:
+            Solve(self, Matvec(self.B, u, self.r), un)
+        return un
+
+    def update(self, K):
+        """
+        Write new Gammas (same neighbors) in the operator, for coefficients that change in time.
+        """
+        data = np.bincount(self.pos, weights = K.reshape(-1)[self.slots], minlength = len(self.B.data))
+        if self.implicit == False:                                                  # For the explicit scheme.
+            self.B.data[:] = data
+            self.B.data[self.diag] += 1                                             # Explicit formulation of K.
+        else:                                                                       # For the implicit scheme.
+            self.B.data[:] = self.lam*data
+            self.B.data[self.diag] += 1
+            self.A.data[:] = -(1 - self.lam)*data
+            self.A.data[self.diag] += 1
+            if self.lu is None:
+                Factorize(self)                                                     # Sparse LU factorization.
+            else:
+                self.stale = True                                                   # Refined with the previous factorization.
+
+
+class Interior:
+    """
+    Interior
+
+    Time-stepping engine that only advances the inner nodes.
+    The operator is split in the inner-inner block K_II and the inner-boundary block K_IB; the boundary values are given data, so they enter each step as a source term (boundary lifting):
+        Explicit:   u_I^{n+1} = (I + K_II)u_I^n + K_IB u_B^n
+        Implicit:   (I - (1 - lam)K_II)u_I^{n+1} = (I + lam K_II)u_I^n + lam K_IB u_B^n + (1 - lam)K_IB u_B^{n+1}
+    For the implicit scheme only the inner-inner block is factorized.
+    The boundary values of the new time-level must be in un before calling step; only the inner values of un are written.
+    The CSR structure of the blocks is built once and new Gammas (update) overwrite the data arrays in place; for the implicit scheme the factorization is reused with iterative refinement (see Solve).
+
+    Input:
+        K               ndarray         Array with the dt*Gammas of each node and its neighbors (Gammas.Weights layout).
+        idx             ndarray         Array with the indices of each node and its neighbors.
+        boun            ndarray         Array with the flags of the boundary nodes.
+        implicit        Logical         Implicit scheme (Default: False).
+        lam             Real            Lambda parameter of the implicit scheme (Default: 0.5).
+        dense           Logical         Use dense blocks, with the inverse of the implicit system computed once (Default: False, sparse blocks and LU).
+    """
+
+    def __init__(self, K, idx, boun, implicit = False, lam = 0.5, dense = False):
+        from scipy.sparse import csr_matrix                                         # Imported when needed.
+        self.implicit, self.lam, self.dense = implicit, lam, dense
+        self.I = np.where(~boun)[0]                                                 # Inner nodes.
+        self.B = np.where(boun)[0]                                                  # Boundary nodes.
+        nI, nB = len(self.I), len(self.B)
+
+        indptr, indices, self.slots_II, self.pos_II = Pattern(idx, self.I, self.I)  # Inner-inner block.
+        self.diag = Diagonal(indptr, indices)
+        K_II = csr_matrix((np.zeros(len(indices), dtype = K.dtype), indices, indptr), shape = (nI, nI))
+        indptr, indices, self.slots_IB, self.pos_IB = Pattern(idx, self.I, self.B)  # Inner-boundary block.
+        K_IB = csr_matrix((np.zeros(len(indices), dtype = K.dtype), indices, indptr), shape = (nI, nB))
+        self.blocks = [K_II, K_IB, K_IB.copy(), K_II.copy()]                        # I + lam K_II, lam K_IB, (1 - lam)K_IB and the implicit system.
+        self.A  = self.blocks[3]
+        self.lu = None
+        self.uI, self.uB = np.empty(nI, dtype = K.dtype), np.empty(nB, dtype = K.dtype)
+        self.r, self.x, self.res = np.empty(nI, dtype = K.dtype), np.empty(nI, dtype = K.dtype), np.empty(nI, dtype = K.dtype)
+                                                                                    # Buffers of the steps.
+        self.update(K)
+
+    def step(self, u, un):
+        """
+        Compute one step of the inner nodes, writing them in the preallocated array un.
+        """
+        np.take(u, self.I, out = self.uI)
+        np.take(u, self.B, out = self.uB)
+        Matvec(self.M, self.uI, self.r)                                             # Inner values at the old time-level.
+        Matvec(self.C0, self.uB, self.r, accumulate = True)                         # Boundary source at the old time-level.
+        if self.C1 is not None:
+            np.take(un, self.B, out = self.uB)
+            Matvec(self.C1, self.uB, self.r, accumulate = True)                     # Boundary source at the new time-level.
+        if self.lu is not None:
+            un[self.I] = Solve(self, self.r, self.x)
+        else:
+            un[self.I] = self.r
+        return un
+
+    def update(self, K):
+        """
+        Write new Gammas (same neighbors) in the blocks, for coefficients that change in time.
+        """
+        K    = K.reshape(-1)
+        M, C0, C1, A = self.blocks
+        K_II = np.bincount(self.pos_II, weights = K[self.slots_II], minlength = len(M.data))
+        K_IB = np.bincount(self.pos_IB, weights = K[self.slots_IB], minlength = len(C0.data))
+        lam  = self.lam if self.implicit == True else 1
+        M.data[:]  = lam*K_II
+        M.data[self.diag] += 1                                                      # I + lam K_II.
+        C0.data[:] = lam*K_IB
+        C1.data[:] = (1 - lam)*K_IB
+        A.data[:]  = -(1 - lam)*K_II
+        A.data[self.diag] += 1                                                      # I - (1 - lam)K_II.
+        if self.implicit == False:                                                  # For the explicit scheme.
+            C1 = None
+
+        if self.dense:                                                              # Dense blocks.
+            M, C0 = M.toarray(), C0.toarray()
+            C1    = None if C1 is None else C1.toarray()
+            if self.implicit == True:
+                Ainv      = np.linalg.pinv(A.toarray())                             # Inverse of the (smaller) implicit system.
+                M, C0, C1 = Ainv@M, Ainv@C0, Ainv@C1
+        elif self.implicit == True and self.lu is None:
+            Factorize(self)                                                         # Sparse LU factorization.
+        elif self.implicit == True:
+            self.stale = True                                                       # Refined with the previous factorization.
+        self.M, self.C0, self.C1 = M, C0, C1
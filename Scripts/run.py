@@ -13,15 +13,17 @@ Date:
     July, 2023.
 
 Last Modification:
-    October, 2023.
+    October, 2026.
 """
 
 # Library importation
 import os
 import re
 import numpy as np
-import Scripts.Graph as Graph
 import Scripts.Errors as Errors
+import Scripts.Checkpoint as Checkpoint
+import Scripts.Output as Output
+import Scripts.Mesh as Mesh
 import AdvectionDiffusion
 
 ## Create a dictionary to get all the regions in da Data folder.
@@ -37,47 +39,55 @@ def group_files_by_region(files):
             regions[region][suffix] = file                                                  # Add the file to the regions.
     return regions                                                                          # Return the regions dictionary.
 
+## Save the solutions, the graphs, the video and the error of a region.
+##  Error.txt is written last, it marks the region as finished.
+def save_region(p, tt, u_ap, u_ex, er, results_path, region):
+    folder = os.path.join(results_path, region)                                             # Folder for the results of the region.
+    Output.Solutions(u_ap, u_ex, folder)                                                    # Save the computed and theoretical solutions.
+    Output.Render(p, tt, u_ap, folder)                                                      # Save the resulting graphs and video.
+    Output.Error(er, folder)                                                                # Save the error.
+
 ## Process the regions and compute the solutions.
-def process_region(f, v, a, b, t, region, files, data_path, results_path, save):
+##  show: show the video when the results are not saved (the distributed workers have no display and only report the error).
+def process_region(f, v, a, b, t, region, files, data_path, results_path, save, reorder = None, engine = 'dense', checkpoint = None, resume = False, output = None, show = True):
     print(f'Working on region: {region}')
-    if '_p.csv' in files and '_tt.csv' in files:                                            # Check the existence of points and triangles.
-        p_file_path  = os.path.join(data_path, files['_p.csv'])                             # Get the file path for the points.
-        tt_file_path = os.path.join(data_path, files['_tt.csv'])                            # Get the file path fot the triangles.
-
-        p  = np.genfromtxt(p_file_path,  delimiter = ',', skip_header = 0)                  # Load the coordinates of the points.
-        tt = np.genfromtxt(tt_file_path, delimiter = ',', skip_header = 0)                  # Load the triangles correspondence.
-
-        u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, f, v, a, b, t, triangulation = triangulation, tt = tt, implicit = Implicit, lam = 0.1)
+    if resume and os.path.exists(os.path.join(results_path, region, 'Error.txt')):         # Check if the region is already finished.
+        print('\tAlready finished.')
+        return
+    if '_p.csv' in files:                                                                   # Check the existence of the points.
+        p, tt = Mesh.Load(data_path, files)                                                 # Load the points and the triangles (built if there is no '_tt.csv').
+
+        checkpoint_path = None                                                              # No checkpoints.
+        if checkpoint is not None:                                                          # If checkpoints are requested.
+            checkpoint_path = os.path.join(results_path, region, 'Checkpoint')              # Folder for the checkpoints.
+
+        u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, f, v, a, b, t, triangulation = triangulation, tt = tt, implicit = Implicit, lam = 0.1, reorder = reorder, engine = engine,
+                                                   checkpoint = checkpoint_path, interval = checkpoint or 100, restart = resume)
                                                                                             # Compute the numerical solution.
 
         er = Errors.Cloud(p, vec, u_ap, u_ex)                                               # Compute the error.
         print(f'\tError: {np.mean(er)}')                                                    # Print the mean of the error.
 
+        if save and output is not None:                                                     # If the results are saved in the background.
+            output.put(p, tt, u_ap, u_ex, er, os.path.join(results_path, region), checkpoint_path)
+                                                                                            # Hand the results to the output pipeline.
+            return np.mean(er)
         if save:                                                                            # If we are going to save.
-            os.makedirs(os.path.join(results_path, region), exist_ok = True)
-                                                                                            # Ensure the directory exists.
-            error_path = os.path.join(results_path, region, 'Error.txt')
-                                                                                            # Set the name of the file for the error.
-            with open(error_path, 'w') as file:                                             # Create the file.
-                file.write(str(np.mean(er)))                                                # Save the error.
-
-            computed_solution_path = os.path.join(results_path, region, 'Computed Solution.csv')
-                                                                                            # Set the name of the file for the computed solution.
-            np.savetxt(computed_solution_path, u_ap, delimiter = ',', fmt = '%.8f')         # Save the computed solution.
-
-            theoretical_solution_path = os.path.join(results_path, region, 'Theoretical Solution.csv')
-                                                                                            # Set the name of the file for the theoretical solution.
-            np.savetxt(theoretical_solution_path, u_ex, delimiter = ',', fmt = '%.8f')      # Save the theoretical solution.
-
-            plot_path = os.path.join(results_path, region, 'Solution')
-                                                                                            # Set the name for the resulting graphs.
-            Graph.Cloud_Transient_Steps_1(p, tt, u_ap, nom = plot_path)                     # Save the resulting graphs.
-
-        plot_path = os.path.join(results_path, region, 'Solution.mp4')
-                                                                                            # Set the name for the resulting video.
-        Graph.Cloud_Transient_1(p, tt, u_ap, save = Save, nom = plot_path)                  # Save the resulting video.
-
-def run_simulation(f, v, a, b, t, implicit, data, exam = 'test', holes = False, save = True):
+            save_region(p, tt, u_ap, u_ex, er, results_path, region)                        # Save the results.
+        elif show:
+            import Scripts.Graph as Graph                                                   # Graphs are only needed to show the results.
+            Graph.Cloud_Transient_1(p, tt, u_ap, save = False)                              # Show the resulting video.
+
+        if checkpoint_path is not None:                                                     # If there are checkpoints.
+            Checkpoint.Clear(checkpoint_path)                                               # The results are complete, remove the checkpoints.
+        return np.mean(er)                                                                  # The mean of the error.
+
+## Run the simulations on all the regions in the data folder.
+##  checkpoint:   number of time steps between checkpoints (None: no checkpoints).
+##  resume:       skip the regions with finished results and resume the others from their latest checkpoint.
+##  asynchronous: save the results in the background (Scripts/Output.py) while the next region is computed.
+##  distributed:  'host:port' to serve the regions to workers on other processes or hosts (Scripts/Distributed.py) and wait for their results.
+def run_simulation(f, v, a, b, t, implicit, data, exam = 'test', holes = False, save = True, reorder = None, engine = 'dense', checkpoint = None, resume = False, asynchronous = False, distributed = None):
     global Implicit, triangulation, Save
     Implicit      = implicit
     Save          = save                                                                    # Choose wether the results must be saved.
@@ -92,5 +102,17 @@ def run_simulation(f, v, a, b, t, implicit, data, exam = 'test', holes = False,
 
     regions_c = group_files_by_region(clouds)                                               # Create a dictionary for all the regions in Clouds.
 
-    for region, files in regions_c.items():                                                 # For each of the regions.
-        process_region(f, v, a, b, t, region, files, data, results_clouds, Save)            # Process the region.
\ No newline at end of file
+    if distributed is not None:                                                             # If the regions are computed by workers.
+        import Scripts.Distributed as Distributed
+        host, _, port = distributed.rpartition(':')                                         # Address of the coordinator.
+        tasks = Distributed.Tasks(f, v, a, b, t, implicit, data, results_clouds, Save, reorder, engine, checkpoint, resume, exam)
+        return Distributed.Serve(tasks, host or '127.0.0.1', int(port))                     # Wait for the results of the workers.
+
+    output = Output.Pipeline() if asynchronous and Save else None                           # Background output stage.
+    try:
+        for region, files in regions_c.items():                                             # For each of the regions.
+            process_region(f, v, a, b, t, region, files, data, results_clouds, Save, reorder, engine, checkpoint, resume, output)
+                                                                                            # Process the region.
+    finally:
+        if output is not None:
+            output.close()                                                                  # Wait for the results to be saved.
\ No newline at end of file
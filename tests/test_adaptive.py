@@ -0,0 +1,76 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import Scripts.Adaptive as Adaptive
+import Scripts.Fields as Fields
+import Scripts.Stability as Stability
+from Scripts.Operator import Operator
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Example 7 (a front that moves across the region) on the adaptive cloud.
+## The 'relative' error is compared: the 'mean' error weights each node with its area and divides by the number of nodes, so it also goes down with the number of nodes.
+
+@pytest.fixture(scope = 'module')
+def problem():
+    p = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')             # Cloud of 776 nodes.
+    e = Examples['Example 7']
+    return p, e['f'], e['v'], e['a'], e['b']
+
+def test_adaptive_matches_uniform_refinement(problem):
+    uniform  = Adaptive.Cloud(*problem, 100, levels = 1, refine = -1, coarsen = -1) # All the inner nodes refined once.
+    adaptive = Adaptive.Cloud(*problem, 100, levels = 1)
+    coarse   = Adaptive.Cloud(*problem, 100, levels = 0)                            # The initial cloud.
+
+    for p, u, _, _, errors in (uniform, adaptive, coarse):
+        assert np.all(np.isfinite(u))
+        assert np.all(np.isfinite(errors.steps()['l2']))
+    assert len(adaptive[0]) < len(uniform[0])/2
+    assert adaptive[4].summary()['relative'] <= uniform[4].summary()['relative']
+    assert uniform[4].summary()['relative'] < coarse[4].summary()['relative']
+
+@pytest.mark.parametrize('implicit', [False, True])
+def test_adaptive_operator_is_stable(problem, implicit):
+    p, u, _, vec, errors = Adaptive.Cloud(*problem, 60, implicit = implicit)        # Two levels of refinement (Default).
+    assert np.all(np.isfinite(u))
+    assert np.max(errors.steps()['linf']) <= 1 + 1e-12                              # The front is a step from 0 to 1.
+    G   = Stability.Operator(p, vec, Fields.Operator(p, 0, problem[2], 0, 0))       # Diffusion on the final cloud.
+    eig = Stability.Spectrum(G)
+    assert np.max(eig.real) < 0
+
+def test_restore_undoes_the_edits(problem):
+    p     = problem[0]
+    op    = Operator(p, Fields.Operator(p, 0, 0.1, 0, 0), derivatives = True, balanced = True)
+    state = {name: getattr(op, name).copy() for name in ('p', 'vec', 'W', 'D')}
+    K     = op.K.toarray()
+    inne  = np.where(p[:, 2] == 0)[0]
+    saved = op.snapshot()
+    op.Insert(p[inne[:20], :2] + 0.002)
+    op.Move(inne[20:40], p[inne[20:40], :2] - 0.002)
+    op.Remove(inne[40:60])
+    op.restore(saved)
+    for name, array in state.items():
+        assert np.array_equal(getattr(op, name), array)
+    assert np.array_equal(op.K.toarray(), K)
+    op.Remove(inne[40:60])                                                          # The restored operator can be edited again.
+    assert np.array_equal(op.vec, Operator(op.p, op.L, dist = op.dist, balanced = True).vec)
@@ -0,0 +1,64 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Stencil as Stencil
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Blocks of time steps (Stencil.Blocked) against one step at a time with Stencil.Ellpack, bit-for-bit.
+
+@pytest.fixture(scope = 'module')
+def problem():
+    p    = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')          # Cloud of 776 nodes.
+    vec  = Neighbors.Cloud(p, 8)
+    e    = Examples['Example 1']
+    t    = 60
+    T    = np.linspace(0, 1, t)
+    L    = np.vstack([[-e['a']], [-e['b']], [2*e['v']], [0], [2*e['v']]])
+    W    = (T[1] - T[0])*Gammas.Weights(p, vec, L)
+    W[:, 0] += 1                                                                    # Explicit formulation of K.
+    boun = p[:, 2] != 0
+    U    = np.zeros([len(p), t])
+    for k in np.arange(t):                                                          # Boundary conditions.
+        U[boun, k] = e['f'](p[boun, 0], p[boun, 1], T[k], e['v'], e['a'], e['b'])
+    U[:, 0] = e['f'](p[:, 0], p[:, 1], T[0], e['v'], e['a'], e['b'])                # Initial condition.
+    return W, Gammas.Index(vec), boun, U
+
+@pytest.mark.parametrize('depth', [2, 4, 7])
+@pytest.mark.parametrize('tile', [64, 500])
+def test_blocked_matches_ellpack(problem, depth, tile):
+    W, idx, boun, U = problem
+    ref     = U.copy()
+    stencil = Stencil.Ellpack(W, idx)
+    for k in np.arange(1, U.shape[1]):                                              # One time step at a time.
+        stencil.step(ref[:, k - 1], ref[:, k])
+        ref[boun, k] = U[boun, k]
+    blocked = Stencil.Blocked(W, idx, boun, depth = depth, tile = tile)
+    V, k    = U.copy(), 0
+    while k < U.shape[1] - 1:                                                       # For each block of time steps.
+        n = min(depth, U.shape[1] - 1 - k)
+        blocked.advance(V, k, n)
+        k = k + n
+    assert np.array_equal(V, ref)
@@ -0,0 +1,52 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Checkpoint as Checkpoint
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## A run stopped after a checkpoint and restarted against the same run without interruptions.
+
+def test_checkpoint_restart_matches_uninterrupted(tmp_path, monkeypatch):
+    p      = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')        # Cloud of 776 nodes.
+    e      = Examples['Example 1']
+    args   = (p, e['f'], e['v'], e['a'], e['b'], 120)
+    kw     = dict(engine = 'ellpack', interval = 25)
+    ref    = AdvectionDiffusion.Cloud(*args, **kw)[0]
+
+    save  = Checkpoint.Save_State
+    calls = []
+    def interrupted(*args):                                                         # Stop after the second checkpoint.
+        save(*args)
+        calls.append(args[4])
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+    monkeypatch.setattr(Checkpoint, 'Save_State', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        AdvectionDiffusion.Cloud(*args, checkpoint = str(tmp_path), **kw)
+    monkeypatch.setattr(Checkpoint, 'Save_State', save)
+
+    u_ap = AdvectionDiffusion.Cloud(*args, checkpoint = str(tmp_path), restart = True, **kw)[0]
+    assert calls == [25, 50]
+    assert np.array_equal(u_ap, ref)
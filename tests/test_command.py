@@ -0,0 +1,50 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import sys
+import subprocess
+import Scripts.Command as Command
+
+Root = os.path.join(os.path.dirname(__file__), '..')
+
+## Command line options of Run_Experiments.py (Scripts/Command.py).
+
+def test_heavy_backends_are_not_imported():
+    heavy = ['scipy.sparse.linalg', 'scipy.spatial', 'joblib', 'numba', 'matplotlib']
+    code  = f'import sys, AdvectionDiffusion, Scripts.Command, Scripts.Experiments; print([m for m in {heavy} if m in sys.modules])'
+    out   = subprocess.run([sys.executable, '-c', code], cwd = Root, capture_output = True, text = True, check = True)
+    assert out.stdout.strip() == '[]'
+
+def test_options_override_the_configuration():
+    args   = Command.Parser().parse_args(['-s', 'Example 1', '-s', 'Example 2', '--a', '0.1', '-r', 'BAN', '-d', 'Holes', '-d', 'Mine=my/folder',
+                                          '--scheme', 'implicit', '--lam', '0.5', '-t', '200', '--no-save', '-j', '2'])
+    config = Command.Config(args)
+    assert config['scenarios'] == [{'name': 'Example 1', 'example': 'Example 1', 'a': 0.1}, {'name': 'Example 2', 'example': 'Example 2', 'a': 0.1}]
+    assert config['data'] == {'Holes': os.path.join('Data', 'Holes', ''), 'Mine': 'my/folder'}
+    assert config['schemes'] == {'implicit': {'implicit': True, 'lam': 0.5}}
+    assert config['regions'] == ['BAN'] and config['t'] == 200 and config['save'] == False and config['n_jobs'] == 2
+    assert config['triangulation'] == False                                         # Not given, the default is kept.
+
+def test_run_from_the_command_line(monkeypatch, capsys):
+    monkeypatch.chdir(Root)
+    Command.main(['--list'])
+    assert capsys.readouterr().out.count('Example') == 7
+    summary = Command.main(['-s', 'Example 1', '-r', 'VAL', '-d', 'Clouds', '-t', '400', '--no-save', '-j', '1'])
+    assert [row[:4] for row in summary] == [['Example 1', 'Clouds', 'VAL', 'explicit']] and summary[0][4] < 1e-2
@@ -0,0 +1,39 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import AdvectionDiffusion
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+def f(x, y, t, v, a, b):                                                            # Theoretical solution of Example 1.
+    return (1/(4*t + 1))*np.exp(-(x - a*t - 0.5)**2/(v*(4*t + 1)) - (y - b*t - 0.5)**2/(v*(4*t + 1)))
+
+Example = {'f': f, 'v': 0.1, 'a': 0.3, 'b': 0.2}
+
+## The explicit steps split among several processes (Scripts/Decomposition.py) against the serial 'ellpack' engine.
+
+def test_shared_matches_ellpack():
+    p      = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')        # Cloud of 776 nodes.
+    e      = Example
+    args   = (p, e['f'], e['v'], e['a'], e['b'], 60)
+    ref    = AdvectionDiffusion.Cloud(*args, engine = 'ellpack')[0]
+    shared = AdvectionDiffusion.Cloud(*args, engine = 'shared', n_jobs = 2)[0]
+    assert np.array_equal(shared, ref)
@@ -0,0 +1,84 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import time
+import shutil
+import socket
+import threading
+import pytest
+import Scripts.Distributed as Distributed
+from Scripts.Examples import Examples
+
+pytestmark = pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+                                                                                    # The manager ends its thread with SystemExit.
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## A coordinator and its workers on the loopback interface, with the problems of two small regions.
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def tasks(folder):
+    for region in ('VAL', 'MIC'):
+        for suffix in ('_p.csv', '_tt.csv'):
+            shutil.copy(os.path.join(Data, region + suffix), folder)
+    e = Examples['Example 1']
+    return Distributed.Tasks(e['f'], e['v'], e['a'], e['b'], 20, False, str(folder) + os.sep, str(folder) + os.sep, save = False, engine = 'ellpack', exam = 'Example 1')
+
+def test_board_gives_expired_leases_again():
+    board = Distributed.Board(['task'], lease = 0.1, retries = 1)
+    i, _, _ = board.take('dead')
+    assert board.take('alive') is None                                              # Still leased.
+    time.sleep(0.2)
+    assert board.take('alive')[0] == i                                              # The lease expired.
+    assert not board.report('dead', i, {'status': 'done'})
+    assert board.report('alive', i, {'status': 'done'})
+    assert board.finished() and board.summary()[0][1]['attempts'] == 2
+
+def test_workers_run_the_tasks(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GFD_AUTHKEY', 'test')
+    work = tasks(tmp_path)
+    ref  = [Distributed.run_task(task)['error'] for task in work]                   # The same tasks on this process.
+
+    port    = free_port()
+    results = []
+    server  = threading.Thread(target = lambda: results.extend(Distributed.Serve(work, port = port, lease = 1, poll = 0.1, verbose = False)))
+    server.start()
+    time.sleep(0.5)
+
+    manager = Distributed.manager_class()(address = ('127.0.0.1', port), authkey = b'test')
+    manager.connect()
+    lost, _, _ = manager.board().take('dead')                                       # A worker that dies with its task.
+
+    workers = [threading.Thread(target = Distributed.Work, kwargs = {'port': port, 'name': f'worker {n}', 'wait': 0.2, 'verbose': False}) for n in range(2)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(120)
+    server.join(120)
+
+    assert len(results) == len(work)
+    for i, (task, result) in enumerate(results):
+        assert result['status'] == 'done' and result['worker'].startswith('worker')
+        assert result['error'] == ref[i]
+        assert result['attempts'] == (2 if i == lost else 1)
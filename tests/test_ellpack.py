@@ -0,0 +1,78 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Stencil as Stencil
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+def f(x, y, t, v, a, b):                                                            # Theoretical solution of Example 1.
+    return (1/(4*t + 1))*np.exp(-(x - a*t - 0.5)**2/(v*(4*t + 1)) - (y - b*t - 0.5)**2/(v*(4*t + 1)))
+
+Example = {'f': f, 'v': 0.1, 'a': 0.3, 'b': 0.2}
+
+## The fixed-width stencil kernel (Stencil.Ellpack) against the dense propagator.
+
+@pytest.fixture(scope = 'module')
+def problem():
+    p    = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')          # Cloud of 776 nodes.
+    vec  = Neighbors.Cloud(p, 8)
+    e    = Example
+    t    = 400
+    T    = np.linspace(0, 1, t)
+    L    = np.vstack([[-e['a']], [-e['b']], [2*e['v']], [0], [2*e['v']]])
+    W    = (T[1] - T[0])*Gammas.Weights(p, vec, L)
+    W[:, 0] += 1                                                                    # Explicit formulation of K.
+    boun = p[:, 2] != 0
+    U    = np.zeros([len(p), t])
+    for k in np.arange(t):                                                          # Boundary conditions.
+        U[boun, k] = e['f'](p[boun, 0], p[boun, 1], T[k], e['v'], e['a'], e['b'])
+    U[:, 0] = e['f'](p[:, 0], p[:, 1], T[0], e['v'], e['a'], e['b'])                # Initial condition.
+    return p, W, Gammas.Index(vec), boun, U
+
+def steps(stencil, boun, U):
+    """
+    Time steps with Stencil.Ellpack, one at a time.
+    """
+    U  = U.copy()
+    u  = U[:, 0].copy()
+    un = np.empty_like(u)
+    for k in np.arange(1, U.shape[1]):
+        stencil.step(u, un)
+        un[boun]  = U[boun, k]
+        U[:, k]   = un
+        u, un     = un, u
+    return U
+
+def test_numpy_kernel_matches_numba(problem):
+    _, W, idx, boun, U = problem
+    if Stencil.load_kernels() is None:
+        pytest.skip('Numba is not available.')
+    assert np.array_equal(steps(Stencil.Ellpack(W, idx, jit = True), boun, U), steps(Stencil.Ellpack(W, idx, jit = False), boun, U))
+
+def test_ellpack_matches_dense(problem):
+    p, W, idx, boun, U = problem
+    e     = Example
+    dense = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], U.shape[1])[0]
+    assert np.allclose(steps(Stencil.Ellpack(W, idx), boun, U), dense, rtol = 0, atol = 1e-12)
@@ -0,0 +1,65 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Errors as Errors
+import Scripts.Neighbors as Neighbors
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Errors computed by blocks of time steps (Errors.Accumulator) against the errors computed one node and one time step at a time.
+
+@pytest.fixture(scope = 'module')
+def run():
+    p = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')             # Cloud of 776 nodes.
+    e = Examples['Example 1']
+    u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 60, implicit = True)
+    return p, vec, u_ap, u_ex
+
+def test_areas_match_polygons(run):
+    p, vec, _, _ = run
+    n    = np.sum(vec != -1, axis = 1)
+    area = [Errors.PolyArea(p[vec[i, :n[i]], 0], p[vec[i, :n[i]], 1]) for i in np.arange(len(p))]
+    assert np.allclose(Errors.Areas(p, vec), area, rtol = 1e-9, atol = 0)
+
+@pytest.mark.parametrize('block', [1, 7, 256])
+def test_accumulator_matches_time_steps(run, block):
+    p, vec, u_ap, u_ex = run
+    area = Errors.Areas(p, vec)
+    er   = np.array([np.sqrt(np.mean(np.square(u_ap[:, k] - u_ex[:, k])*area)) for k in np.arange(u_ap.shape[1])])
+    acc  = Errors.Accumulator(p, vec).extend(u_ap, u_ex, block)
+    assert np.allclose(acc.steps()['l2'], er, rtol = 1e-12, atol = 0)
+    assert np.allclose(Errors.Cloud(p, vec, u_ap, u_ex), er, rtol = 1e-12, atol = 0)
+    summary = acc.summary()
+    assert summary['steps'] == u_ap.shape[1]
+    assert np.isclose(summary['mean'], np.mean(er))
+    assert np.isclose(summary['l2'], np.sqrt(np.mean(er**2)))
+    assert summary['linf'] == np.max(np.abs(u_ap - u_ex))
+    assert np.isclose(summary['relative'], np.sqrt(np.sum(er**2)/np.sum(np.square(u_ex)*area[:, None])*len(p)))
+
+def test_stored_errors(run, tmp_path):
+    p, vec, u_ap, u_ex = run
+    np.save(os.path.join(tmp_path, 'u_ap.npy'), u_ap)
+    np.save(os.path.join(tmp_path, 'u_ex.npy'), u_ex)
+    stored = Errors.Stored(p, vec, str(tmp_path), block = 16).summary()
+    assert stored == pytest.approx(Errors.Accumulator(p, vec).extend(u_ap, u_ex).summary(), rel = 1e-12)
@@ -0,0 +1,70 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import json
+import shutil
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Errors as Errors
+import Scripts.Experiments as Experiments
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## The experiment matrix of Scripts/Experiments.py, in this process and with a pool of workers.
+
+@pytest.fixture
+def config(tmp_path):
+    folder = tmp_path/'Clouds'
+    folder.mkdir()
+    for region in ['BAN', 'VAL']:
+        for name in ['_p.csv', '_tt.csv']:
+            shutil.copy(os.path.join(Data, region + name), folder)
+    return {'scenarios': ['Example 1', {'name': 'Slow', 'example': 'Example 1', 'a': 0.1}], 'data': {'Clouds': str(folder)},
+            'schemes': {'explicit': {'implicit': False}, 'implicit': {'implicit': True, 'lam': 0.5}},
+            't': 400, 'save': False, 'summary': str(tmp_path/'Experiments.csv')}
+
+def test_tasks(config, tmp_path):
+    regions, tasks = Experiments.Tasks({**Experiments.Defaults, **config})
+    assert sorted(regions) == [('Clouds', 'BAN'), ('Clouds', 'VAL')]
+    assert all(len(tasks[key]) == 4 for key in regions)                             # 2 scenarios and 2 schemes.
+    slow = [task for task in tasks[('Clouds', 'BAN')] if task['scenario'] == 'Slow']
+    assert all(task['a'] == 0.1 and task['b'] == Examples['Example 1']['b'] and task['t'] == 400 for task in slow)
+    assert {task['engine'] for task in tasks[('Clouds', 'BAN')]} == {'ellpack', 'dense'}
+
+    with open(tmp_path/'config.json', 'w') as file:
+        json.dump({**config, 'engines': 'dense'}, file)
+    with pytest.raises(ValueError):                                                 # Unknown key.
+        Experiments.Load(str(tmp_path/'config.json'))
+    with pytest.raises(ValueError):                                                 # Unknown example.
+        Experiments.Tasks({**Experiments.Defaults, **config, 'scenarios': ['Example 0']})
+    with pytest.raises(ValueError):                                                 # Two tasks in the same folder.
+        Experiments.Tasks({**Experiments.Defaults, **config, 'results': 'Results/{region}'})
+
+def test_pool_matches_serial(config):
+    serial = Experiments.Run(config, n_jobs = 1)
+    pool   = Experiments.Run(config, n_jobs = 2)
+    assert len(serial) == 8 and serial == pool
+
+    p    = np.genfromtxt(os.path.join(config['data']['Clouds'], 'VAL_p.csv'), delimiter = ',')
+    e    = Examples['Example 1']
+    u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400, engine = 'ellpack')
+    assert ['Example 1', 'Clouds', 'VAL', 'explicit', np.mean(Errors.Cloud(p, vec, u_ap, u_ex))] in serial
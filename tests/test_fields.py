@@ -0,0 +1,66 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Fields as Fields
+import Scripts.Stencil as Stencil
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Coefficients given on the nodes or as functions, and the in-place updates of the sparse engines.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p   = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')           # Cloud of 776 nodes.
+    vec = Neighbors.Cloud(p, 8)
+    return p, vec
+
+@pytest.mark.parametrize('implicit', [False, True])
+def test_functions_match_constant_coefficients(cloud, implicit):
+    p, vec = cloud
+    e      = Examples['Example 1']
+    t      = 100 if implicit else 400
+    const  = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], t, implicit = implicit, engine = 'sparse', geometry = {'vec': vec})[0]
+    field  = lambda c: (lambda x, y, t: c + 0*x)                                    # The same value as a function c(x, y, t).
+    nodes  = AdvectionDiffusion.Cloud(p, e['f'], np.full(len(p), e['v']), e['a'], e['b'], t, implicit = implicit, engine = 'sparse', geometry = {'vec': vec})[0]
+    funcs  = AdvectionDiffusion.Cloud(p, e['f'], field(e['v']), field(e['a']), field(e['b']), t, implicit = implicit, engine = 'sparse', geometry = {'vec': vec})[0]
+    assert np.allclose(nodes, const, rtol = 0, atol = 1e-10)
+    assert np.allclose(funcs, const, rtol = 0, atol = 1e-10)
+
+@pytest.mark.parametrize('engine', ['Sparse', 'Interior'])
+@pytest.mark.parametrize('implicit', [False, True])
+def test_update_matches_new_engine(cloud, engine, implicit):
+    p, vec  = cloud
+    idx     = Gammas.Index(vec)
+    boun    = p[:, 2] != 0
+    K       = [1e-3*Gammas.Weights(p, vec, Fields.Operator(p, 0, v, a, b)) for v, a, b in ((0.1, 0.3, 0.2), (0.12, 0.25, 0.22))]
+    make    = (lambda k: Stencil.Sparse(k, idx, implicit)) if engine == 'Sparse' else (lambda k: Stencil.Interior(k, idx, boun, implicit))
+    stencil = make(K[0])
+    stencil.update(K[1])                                                            # The same neighbors, new Gammas.
+    u       = np.sin(p[:, 0]) + np.cos(p[:, 1])
+    un, ref = u.copy(), u.copy()
+    stencil.step(u, un)
+    make(K[1]).step(u, ref)
+    assert np.allclose(un, ref, rtol = 1e-12, atol = 1e-12)
@@ -0,0 +1,75 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## The CSR neighbor graph (Neighbors.NeighborGraph) against the padded array of Neighbors.Cloud.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p   = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')           # Cloud of 776 nodes.
+    tt  = np.genfromtxt(os.path.join(Data, 'BAN_tt.csv'), delimiter = ',').astype(int)
+    vec = Neighbors.Cloud(p, 8)
+    return p, tt, vec
+
+def test_graph_matches_cloud(cloud):
+    p, _, vec = cloud
+    graph = Neighbors.Graph(p, 8)
+    assert graph.indptr.dtype == np.int32 and graph.indices.dtype == np.int32
+    assert np.array_equal(graph.padded(8), vec)
+    assert Neighbors.Graph(p, 8, distances = False).nbytes < vec.nbytes
+    i = np.argmax(graph.counts)
+    assert np.allclose(graph.distances[graph.indptr[i]:graph.indptr[i + 1]], np.hypot(*(p[graph.neighbors(i), :2] - p[i, :2]).T))
+
+def test_from_padded_round_trip(cloud):
+    p, _, vec = cloud
+    graph = Neighbors.NeighborGraph.from_padded(vec, p)
+    assert np.array_equal(graph.padded(vec.shape[1]), vec)
+    assert np.array_equal(graph.counts, np.sum(vec != -1, axis = 1))
+    assert np.allclose(graph.distances, Neighbors.Graph(p, 8).distances)
+
+def test_nodes_with_their_own_number_of_neighbors(cloud):
+    p, _, _ = cloud
+    nvec  = np.where(p[:, 2] == 0, 6, 10)                                           # More neighbors on the boundary.
+    graph = Neighbors.Graph(p, nvec)
+    assert np.all(graph.counts <= nvec)
+    assert np.array_equal(graph.padded(6)[p[:, 2] == 0], Neighbors.Graph(p, 6).padded(6)[p[:, 2] == 0])
+
+def test_from_triangles(cloud):
+    p, tt, _ = cloud
+    graph = Neighbors.NeighborGraph.from_triangles(p, tt)
+    edges = {(i, j) for i in np.arange(graph.m) for j in graph.neighbors(i)}
+    assert all((j, i) in edges for i, j in edges)                                   # Symmetric.
+    assert all((t[0], t[1]) in edges and (t[1], t[2]) in edges and (t[2], t[0]) in edges for t in tt)
+    assert all(np.all(np.diff(graph.distances[graph.indptr[i]:graph.indptr[i + 1]]) >= 0) for i in np.arange(graph.m))
+
+def test_gammas_from_the_graph(cloud):
+    p, _, vec = cloud
+    L     = np.vstack([[-0.3], [-0.2], [0.2], [0], [0.2]])
+    graph = Neighbors.NeighborGraph.from_padded(vec)
+    W     = Gammas.Weights(p, vec, L)
+    assert np.allclose(Gammas.Weights(p, graph, L), W, rtol = 0, atol = 1e-12)
+    assert np.allclose(Gammas.Matrix(W, graph), Gammas.Matrix(W, vec))
+    assert np.allclose(Gammas.Cloud(p, graph, L, n_jobs = 1), Gammas.Matrix(W, vec), rtol = 0, atol = 1e-10)
@@ -0,0 +1,66 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Errors as Errors
+import Scripts.Gammas as Gammas
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Time steps of the inner nodes only (Stencil.Interior) against the full operators.
+
+@pytest.fixture(scope = 'module')
+def problem():
+    p = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')             # Cloud of 776 nodes.
+    e = Examples['Example 1']
+    return p, (p, e['f'], e['v'], e['a'], e['b'], 60)
+
+@pytest.mark.parametrize('engine', ['dense', 'sparse'])
+def test_explicit_interior_matches_full_operator(problem, engine):
+    _, args  = problem
+    args     = args[:5] + (400,)                                                    # Stable explicit time steps.
+    full     = AdvectionDiffusion.Cloud(*args, engine = engine)[0]
+    interior = AdvectionDiffusion.Cloud(*args, engine = engine, interior = True)[0]
+    assert np.allclose(interior, full, rtol = 0, atol = 1e-12)
+
+def test_implicit_interior_uses_both_boundary_levels(problem):
+    p, args = problem
+    f, v, a, b, t = args[1:]
+    lam  = 0.1
+    u_ap, u_ex, vec = AdvectionDiffusion.Cloud(*args, implicit = True, lam = lam, engine = 'sparse', interior = True)
+
+    dt   = 1/(t - 1)
+    L    = np.vstack([[-a], [-b], [2*v], [0], [2*v]])
+    K    = dt*Gammas.Matrix(Gammas.Weights(p, vec, L), vec)
+    I, B = np.where(p[:, 2] == 0)[0], np.where(p[:, 2] != 0)[0]
+    A    = np.identity(len(I)) - (1 - lam)*K[np.ix_(I, I)]
+    u    = u_ex[:, 0].copy()
+    for k in np.arange(1, t):                                                       # Theta-scheme with the boundary values of both time-levels.
+        r    = u[I] + lam*K[I]@u + (1 - lam)*K[np.ix_(I, B)]@u_ex[B, k]
+        u[I] = np.linalg.solve(A, r)
+        u[B] = u_ex[B, k]
+    assert np.allclose(u_ap[:, -1], u, rtol = 0, atol = 1e-10)
+
+    full = AdvectionDiffusion.Cloud(*args, implicit = True, lam = lam, engine = 'sparse')
+    assert not np.allclose(full[0], u_ap, rtol = 0, atol = 1e-6)                    # The full operator lags the boundary values.
+    assert np.mean(Errors.Cloud(p, vec, u_ap, u_ex)) < np.mean(Errors.Cloud(p, vec, *full[:2]))
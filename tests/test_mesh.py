@@ -0,0 +1,51 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import glob
+import shutil
+import numpy as np
+import pytest
+import Scripts.Mesh as Mesh
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data')
+
+## Triangles built by Mesh.Triangulate against the triangles of the data files.
+
+def Area(p, tt):
+    u = p[tt[:, 1], :2] - p[tt[:, 0], :2]
+    v = p[tt[:, 2], :2] - p[tt[:, 0], :2]
+    return np.sum(np.abs(u[:, 0]*v[:, 1] - u[:, 1]*v[:, 0]))/2
+
+@pytest.mark.parametrize('cloud', sorted(glob.glob(os.path.join(Data, '*', '*_p.csv'))), ids = lambda f: os.path.relpath(f, Data))
+def test_triangulation_covers_the_region(cloud):
+    p  = np.genfromtxt(cloud, delimiter = ',')
+    tt = np.genfromtxt(cloud[:-len('_p.csv')] + '_tt.csv', delimiter = ',').astype(int)
+    new = Mesh.Triangulate(p)
+    assert abs(len(new) - len(tt)) <= 1
+    assert np.isclose(Area(p, new), Area(p, tt), rtol = 2e-3)
+
+def test_triangles_are_cached_outside_the_data(tmp_path):
+    data = tmp_path/'Data'
+    data.mkdir()
+    shutil.copy(os.path.join(Data, 'Clouds', 'VAL_p.csv'), data)
+    cache = tmp_path/'Cache'
+    p, tt = Mesh.Load(str(data), {'_p.csv': 'VAL_p.csv'}, cache = str(cache))
+    assert os.listdir(data) == ['VAL_p.csv'] and len(os.listdir(cache)) == 1
+    assert np.array_equal(Mesh.Load(str(data), {'_p.csv': 'VAL_p.csv'}, cache = str(cache))[1], tt)
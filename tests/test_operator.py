@@ -0,0 +1,48 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+from Scripts.Operator import Operator
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Incremental updates of Operator against an operator built from scratch on the same nodes.
+
+@pytest.mark.parametrize('assembled', [False, True])
+def test_operator_edits_match_rebuild(assembled):
+    p    = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')          # Cloud of 776 nodes.
+    L    = np.vstack([[-0.3], [-0.2], [0.2], [0], [0.2]])
+    op   = Operator(p, L, derivatives = True)
+    if assembled:
+        op.K                                                                        # The sparse operator is patched by the edits.
+    inne = np.where(p[:, 2] == 0)[0]
+    rng  = np.random.default_rng(0)
+
+    q    = p[inne[:40], :2] + 0.004*rng.standard_normal([40, 2])                    # New nodes close to the inner ones.
+    op.Insert(q)
+    move = inne[40:80]
+    op.Move(move, op.p[move, :2] + 0.003*rng.standard_normal([40, 2]))
+    op.Remove(inne[80:120])
+
+    new = Operator(op.p, L, dist = op.dist, derivatives = True)
+    assert np.array_equal(op.vec, new.vec)
+    assert np.allclose(op.W, new.W, rtol = 1e-12, atol = 1e-9)
+    assert np.allclose(op.K.toarray(), new.K.toarray(), rtol = 1e-12, atol = 1e-9)
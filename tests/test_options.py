@@ -0,0 +1,76 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Options as Options
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Options of AdvectionDiffusion.Cloud collected in Scripts/Options.py.
+
+def test_build():
+    options = Options.Options(engine = 'ellpack', precision = 'mixed')
+    assert Options.Build(options) == options
+    assert Options.Build(options, precision = 'single').precision == 'single' and options.precision == 'mixed'
+    assert Options.Build(engine = 'ellpack') == Options.Options(engine = 'ellpack')
+    assert options.changed() == ['engine', 'precision'] and Options.Options().changed() == []
+    assert options.dtype == np.float32 and options.accumulate == np.float64
+    for kwargs in [{'engine': 'gpu'}, {'precision': 'half'}, {'reorder': 'metis'}, {'splitting': 'spectral'}, {'interval': 0}, {'blocking': 0}]:
+        with pytest.raises(ValueError):
+            Options.Options(**kwargs)
+
+def test_due():
+    assert not any(Options.Options().due(k, 10) for k in range(10))
+    options = Options.Options(checkpoint = 'state', interval = 4)
+    assert [k for k in range(10) if options.due(k, 10)] == [0, 4, 8, 9]
+
+@pytest.mark.parametrize('kwargs, implicit, varying', [
+    ({'engine': 'ellpack'}, True, False),
+    ({'engine': 'sparse', 'precision': 'mixed'}, False, False),
+    ({'engine': 'shared', 'interior': True}, False, False),
+    ({'engine': 'shared', 'stream': True}, False, False),
+    ({'engine': 'shared', 'checkpoint': 'state'}, False, False),
+    ({'engine': 'dense'}, False, True),
+    ({'probes': object(), 'checkpoint': 'state'}, False, False),
+    ({'engine': 'ellpack', 'blocking': 4, 'interior': True}, False, False),
+])
+def test_check(kwargs, implicit, varying):
+    with pytest.raises(ValueError):
+        Options.Options(**kwargs).check(implicit, varying)
+
+def test_check_supported():
+    Options.Options(engine = 'ellpack', interior = True).check(implicit = True)
+    Options.Options(engine = 'sparse', stream = True, checkpoint = 'state').check(implicit = True, varying = True)
+    Options.Options(engine = 'ellpack', blocking = 4, precision = 'mixed').check()
+
+def test_cloud():
+    p       = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')       # Cloud of 776 nodes.
+    e       = Examples['Example 1']
+    options = Options.Options(engine = 'ellpack', precision = 'mixed')
+    u_ap    = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400, options = options)[0]
+    ref     = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400, engine = 'ellpack', precision = 'mixed')[0]
+    assert np.array_equal(u_ap, ref)
+    single  = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400, options = options, precision = 'single')[0]
+    assert single.dtype == np.float32 and not np.array_equal(single, ref)
+    with pytest.raises(ValueError):
+        AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 100, implicit = True, options = options)
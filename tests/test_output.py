@@ -0,0 +1,72 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import shutil
+import numpy as np
+import pytest
+import Scripts.Output as Output
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Results saved by the asynchronous output stage (Output.Pipeline).
+
+@pytest.fixture(scope = 'module')
+def region():
+    p    = np.genfromtxt(os.path.join(Data, 'VAL_p.csv'), delimiter = ',')
+    tt   = np.genfromtxt(os.path.join(Data, 'VAL_tt.csv'), delimiter = ',').astype(int)
+    u_ex = np.random.default_rng(0).random([len(p), 6])
+    u_ap = u_ex + 1e-3
+    er   = np.full(6, 1e-3)
+    return p, tt, u_ap, u_ex, er
+
+def test_solutions_and_error(region, tmp_path):
+    _, _, u_ap, u_ex, er = region
+    Output.Solutions(u_ap, u_ex, str(tmp_path))
+    Output.Error(er, str(tmp_path))
+    assert np.allclose(np.genfromtxt(tmp_path/'Computed Solution.csv', delimiter = ','), u_ap, rtol = 0, atol = 1e-8)
+    assert np.allclose(np.genfromtxt(tmp_path/'Theoretical Solution.csv', delimiter = ','), u_ex, rtol = 0, atol = 1e-8)
+    assert float((tmp_path/'Error.txt').read_text()) == np.mean(er)
+
+def test_pipeline_saves_the_regions(region, tmp_path):
+    pytest.importorskip('matplotlib')
+    if shutil.which('ffmpeg') is None:
+        pytest.skip('The videos need ffmpeg.')
+    p, tt, u_ap, u_ex, er = region
+    (tmp_path/'checkpoint').mkdir()
+    (tmp_path/'checkpoint'/'state.npz').write_bytes(b'')
+    with Output.Pipeline(maxsize = 1) as output:
+        for region in ['A', 'B', 'C']:                                              # More regions than the queue.
+            output.put(p, tt, u_ap, u_ex, er, str(tmp_path/region), str(tmp_path/'checkpoint'))
+    for region in ['A', 'B', 'C']:
+        files = os.listdir(tmp_path/region)
+        assert {'Computed Solution.csv', 'Theoretical Solution.csv', 'Error.txt', 'Solution.mp4'} <= set(files)
+    assert not (tmp_path/'checkpoint'/'state.npz').exists()
+
+def test_failed_region_is_not_finished(region, tmp_path):
+    p, tt, u_ap, u_ex, er = region
+    (tmp_path/'checkpoint').mkdir()
+    (tmp_path/'checkpoint'/'state.npz').write_bytes(b'')
+    with pytest.raises(Exception):
+        with Output.Pipeline() as output:
+            output.put(p, tt + len(p), u_ap, u_ex, er, str(tmp_path/'A'), str(tmp_path/'checkpoint'))
+                                                                                    # Triangles out of range, the graphs fail.
+    assert (tmp_path/'A'/'Computed Solution.csv').exists()
+    assert not (tmp_path/'A'/'Error.txt').exists()                                  # Without the error the region is computed again.
+    assert (tmp_path/'checkpoint'/'state.npz').exists()                             # The checkpoints are kept.
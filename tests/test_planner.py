@@ -0,0 +1,74 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Planner as Planner
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Execution strategies chosen by Scripts/Planner.py.
+
+def test_estimates():
+    explicit = Planner.Estimate(10**4, 1000)
+    implicit = Planner.Estimate(10**4, 1000, implicit = True)
+    assert sorted(explicit) == sorted((e, s) for e in ['dense', 'ellpack', 'sparse'] for s in [False, True])
+    assert sorted(implicit) == sorted((e, s) for e in ['dense', 'sparse'] for s in [False, True])
+    longer = Planner.Estimate(10**4, 2000)
+    for key in explicit:
+        if key[1]:                                                                  # Streaming: the memory does not depend on t.
+            assert longer[key][0] == explicit[key][0] and longer[key][1] > explicit[key][1]
+        else:
+            assert longer[key][0] > explicit[key][0]
+    assert Planner.Estimate(10**4, 1000, itemsize = 4)[('ellpack', False)][0] < explicit[('ellpack', False)][0]
+
+def test_plan_fits_in_memory():
+    m, t = 10**5, 1000
+    plan = Planner.Plan(m, t, memory = 16*2**30, verbose = False)
+    assert plan['engine'] != 'dense' and plan['stream'] == False and plan['memory'] <= 0.8*16*2**30
+    plan = Planner.Plan(m, 10**5, memory = 16*2**30, verbose = False)               # The solutions do not fit in RAM.
+    assert plan['stream'] == True and plan['memory'] <= 0.8*16*2**30
+    tiny = Planner.Plan(m, t, memory = 1, verbose = False)                          # Nothing fits: the smallest one.
+    assert tiny['memory'] == min(e[0] for e in Planner.Estimate(m, t).values())
+    assert Planner.Plan(m, t, implicit = True, memory = 16*2**30, verbose = False)['engine'] == 'sparse'
+    with pytest.raises(ValueError):
+        Planner.Plan(m, t, implicit = True, precision = 'mixed', verbose = False)
+
+def test_history(tmp_path):
+    u = Planner.History(5, 3, np.float32)
+    assert isinstance(u, np.ndarray) and u.dtype == np.float32 and not np.any(u)
+    u = Planner.History(5, 3, np.float64, stream = True, folder = str(tmp_path), name = 'u_ap')
+    u[:, 1] = 1
+    u.flush()
+    stored = np.load(tmp_path/'u_ap.npy', mmap_mode = 'r')
+    assert stored.flags.f_contiguous and np.array_equal(stored, u)
+
+@pytest.mark.parametrize('memory', [2**40, 1])
+def test_auto_engine(monkeypatch, memory):
+    p    = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')          # Cloud of 776 nodes.
+    e    = Examples['Example 1']
+    monkeypatch.setattr(Planner, 'Available', lambda: memory)
+    plan = Planner.Plan(len(p), 100, implicit = True, verbose = False)
+    u_ap = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 100, implicit = True, engine = 'auto')[0]
+    ref  = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 100, implicit = True, engine = plan['engine'])[0]
+    assert isinstance(u_ap, np.memmap) == plan['stream']
+    assert np.allclose(u_ap, ref, rtol = 0, atol = 1e-12)
@@ -0,0 +1,63 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import shutil
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Precision as Precision
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Single and mixed precision against the float64 results.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    return np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')          # Cloud of 776 nodes.
+
+@pytest.mark.parametrize('engine, implicit, t', [('ellpack', False, 400), ('dense', True, 100)])
+def test_single_and_mixed_match_double(cloud, engine, implicit, t):
+    e    = Examples['Example 1']
+    args = (cloud, e['f'], e['v'], e['a'], e['b'], t)
+    ref  = AdvectionDiffusion.Cloud(*args, implicit = implicit, engine = engine)[0]
+    diff = {}
+    for precision in (['single', 'mixed'] if engine == 'ellpack' else ['single']):
+        u_ap, u_ex, _ = AdvectionDiffusion.Cloud(*args, implicit = implicit, engine = engine, precision = precision)
+        assert u_ap.dtype == np.float32 and u_ex.dtype == np.float64
+        diff[precision] = np.max(np.abs(u_ap - ref))
+        assert diff[precision] < 1e-5
+    if engine == 'ellpack':                                                         # The float64 accumulation is closer.
+        assert diff['mixed'] <= diff['single']
+
+def test_precision_options(cloud):
+    e = Examples['Example 1']
+    with pytest.raises(ValueError):
+        AdvectionDiffusion.Cloud(cloud, e['f'], e['v'], e['a'], e['b'], 20, precision = 'half')
+    with pytest.raises(ValueError):
+        AdvectionDiffusion.Cloud(cloud, e['f'], e['v'], e['a'], e['b'], 20, implicit = True, precision = 'mixed')
+
+def test_report(tmp_path):
+    for name in ['BAN_p.csv', 'BAN_tt.csv']:
+        shutil.copy(os.path.join(Data, name), tmp_path)
+    e      = Examples['Example 1']
+    report = Precision.Report(e['f'], e['v'], e['a'], e['b'], 400, str(tmp_path), save = False)
+    assert [row[:2] for row in report] == [['BAN', 'double'], ['BAN', 'single'], ['BAN', 'mixed']]
+    assert report[0][3] == 0 and all(row[4] < 1e-3 for row in report)
@@ -0,0 +1,70 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Probes as Probes
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Values at the probes of Scripts/Probes.py against the values on the nodes.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p      = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')        # Cloud of 776 nodes.
+    tt     = np.genfromtxt(os.path.join(Data, 'BAN_tt.csv'), delimiter = ',').astype(int)
+    nodes  = np.where(p[:, 2] == 0)[0][::40]                                        # Some inner nodes.
+    cent   = p[tt[::30], :2].mean(axis = 1)                                         # Some points inside the triangles.
+    points = np.vstack([p[nodes, :2], cent])
+    return p, tt, nodes, points
+
+@pytest.mark.parametrize('triangles', [True, False])
+def test_weights_interpolate(cloud, triangles):
+    p, tt, nodes, points = cloud
+    probes = Probes.Probes(p, points, tt if triangles else None)
+    assert np.allclose(probes.P.sum(axis = 1), 1)
+    assert np.allclose(probes(p[:, 0]), points[:, 0]) and np.allclose(probes(p[:, 1]), points[:, 1])
+    assert np.allclose(probes(p[:, 0]**2)[:len(nodes)], points[:len(nodes), 0]**2)  # At the nodes, the nodal values.
+    if not triangles:                                                               # GFD weights are exact for quadratics.
+        assert np.allclose(probes(p[:, 0]*p[:, 1]), points[:, 0]*points[:, 1])
+
+def test_probes_match_full_solution(cloud):
+    p, tt, _, points = cloud
+    e      = Examples['Example 1']
+    probes = Probes.Probes(p, points, tt)
+    full   = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 60, implicit = True)
+    some   = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 60, implicit = True, probes = probes)
+    assert some[0].shape == (len(points), 60)
+    assert np.allclose(some[0], probes(full[0]), rtol = 0, atol = 1e-12)
+    assert np.allclose(some[1], e['f'](points[:, [0]], points[:, [1]], np.linspace(0, 1, 60), e['v'], e['a'], e['b']))
+
+def test_query_reads_the_stored_solution(cloud, tmp_path):
+    p, tt, nodes, points = cloud
+    e      = Examples['Example 1']
+    u_ap   = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 60, implicit = True, stream = True, history = str(tmp_path))[0]
+    u      = Probes.Load(str(tmp_path))
+    assert isinstance(u, np.memmap) and np.array_equal(u, u_ap)
+    probes = Probes.Probes(p, points, tt)
+    T      = np.linspace(0, 1, 60)
+    assert np.allclose(probes.query(u, T), probes(u_ap), rtol = 0, atol = 1e-12)
+    half   = probes.query(u, (T[10] + T[11])/2)                                     # Halfway between two time steps.
+    assert np.allclose(half, probes(u_ap[:, 10] + u_ap[:, 11])/2, rtol = 0, atol = 1e-12)
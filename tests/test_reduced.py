@@ -0,0 +1,64 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Reduced as Reduced
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Reduced-order model (Scripts/Reduced.py) against the full solver.
+
+@pytest.fixture(scope = 'module')
+def run():
+    p = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')             # Cloud of 776 nodes.
+    e = Examples['Example 1']
+    u_ap, u_ex, vec = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 100, implicit = True, interior = True)
+    return p, e, vec, u_ap
+
+def test_incremental_svd(run):
+    p, _, _, u_ap = run
+    X    = u_ap[p[:, 2] == 0]
+    svd  = Reduced.SVD(tol = 1e-8).extend(u_ap, rows = p[:, 2] == 0, block = 7)
+    s    = np.linalg.svd(X, compute_uv = False)
+    r    = len(svd.s)
+    assert np.allclose(svd.s, s[:r], rtol = 0, atol = 1e-8*s[0])
+    assert np.allclose(svd.U.T@svd.U, np.identity(r), rtol = 0, atol = 1e-10)
+    assert np.linalg.norm(X - svd.U@(svd.U.T@X), 2) <= 2e-8*s[0]                    # The snapshots are kept up to the tolerance.
+    assert len(Reduced.SVD(rank = 5).extend(u_ap, rows = p[:, 2] == 0, block = 7).s) == 5
+
+@pytest.mark.parametrize('implicit', [False, True])
+def test_full_basis_matches_interior_steps(run, implicit):
+    p, e, vec, _ = run
+    t     = 400 if implicit == False else 100
+    model = Reduced.Model(p, vec, np.identity(np.sum(p[:, 2] == 0)))                # All the inner nodes.
+    c, uB = model.Run(e['f'], e['v'], e['a'], e['b'], t, implicit)
+    u_ap  = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], t, implicit = implicit, interior = True)[0]
+    assert np.allclose(model.reconstruct(c, uB), u_ap, rtol = 0, atol = 1e-10)
+
+def test_reduced_model_error(run):
+    p, e, vec, u_ap = run
+    svd    = Reduced.SVD(rank = 20).extend(u_ap, rows = p[:, 2] == 0)
+    model  = Reduced.Model(p, vec, svd.U)
+    c, uB  = model.Run(e['f'], e['v'], e['a'], e['b'], 100, implicit = True)
+    errors = model.Errors(c, uB, u_ap)
+    assert errors['projection']['relative'] <= errors['reduced']['relative'] < 1e-3
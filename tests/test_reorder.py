@@ -0,0 +1,62 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Neighbors as Neighbors
+import Scripts.Reorder as Reorder
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+def f(x, y, t, v, a, b):                                                            # Theoretical solution of Example 1.
+    return (1/(4*t + 1))*np.exp(-(x - a*t - 0.5)**2/(v*(4*t + 1)) - (y - b*t - 0.5)**2/(v*(4*t + 1)))
+
+Example = {'f': f, 'v': 0.1, 'a': 0.3, 'b': 0.2}
+
+## Node orderings of Scripts/Reorder.py: they only renumber the nodes, so the results must not change.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p   = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')           # Cloud of 776 nodes.
+    tt  = np.genfromtxt(os.path.join(Data, 'BAN_tt.csv'), delimiter = ',').astype(int)
+    vec = Neighbors.Cloud(p, 8)
+    return p, tt, vec
+
+@pytest.mark.parametrize('mode', ['rcm', 'hilbert', 'morton'])
+def test_permutation_round_trip(cloud, mode):
+    p, tt, vec = cloud
+    perm = Reorder.Permutation(p, vec, mode)
+    assert np.array_equal(np.sort(perm), np.arange(len(p)))
+    q, qt, qvec = Reorder.Apply(p, tt, vec, perm)
+    assert np.array_equal(q[qt], p[tt])                                             # The same triangles.
+    valid = vec != -1
+    assert np.array_equal(perm[qvec[Reorder.inverse(perm)]][valid], vec[valid])     # The same neighbors.
+    u = np.random.default_rng(0).standard_normal([len(p), 3])
+    back, bvec = Reorder.Restore(u[perm], qvec, perm)
+    assert np.array_equal(back, u) and np.array_equal(bvec, vec)
+
+def test_reordered_solution_matches(cloud):
+    p, _, _ = cloud
+    e   = Example
+    ref = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400)
+    new = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 400, reorder = 'rcm')
+    assert np.allclose(new[0], ref[0], rtol = 0, atol = 1e-12)
+    assert np.array_equal(new[2], ref[2])                                           # Neighbors in the original ordering.
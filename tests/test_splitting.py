@@ -0,0 +1,79 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import AdvectionDiffusion
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Splitting as Splitting
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Operator splitting with semi-Lagrangian advection (Scripts/Splitting.py).
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p  = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')            # Cloud of 776 nodes.
+    tt = np.genfromtxt(os.path.join(Data, 'BAN_tt.csv'), delimiter = ',').astype(int)
+    return p, tt
+
+@pytest.mark.parametrize('implicit, t', [(False, 400), (True, 60)])
+def test_zero_velocity_is_diffusion(cloud, implicit, t):
+    p, tt = cloud
+    e     = Examples['Example 1']
+    u_ap  = AdvectionDiffusion.Cloud(p, e['f'], e['v'], 0, 0, t, tt = tt, implicit = implicit, splitting = 'linear')[0]
+
+    # Two half steps of diffusion for each time step; the barycentric weights at the nodes give the same values.
+    vec  = Neighbors.Cloud(p, 8)
+    K    = Gammas.Matrix(Gammas.Weights(p, vec, np.vstack([[0], [0], [2*e['v']], [0], [2*e['v']]])), vec)
+    boun = p[:, 2] != 0
+    dt   = 1/(t - 1)
+    S    = np.eye(len(p)) + (dt/2)*K                                                # Half a step.
+    if implicit:
+        S = np.linalg.solve(np.eye(len(p)) - 0.5*(dt/2)*K, np.eye(len(p)) + 0.5*(dt/2)*K)
+    u    = u_ap[:, 0].copy()
+    for k in np.arange(1, t):
+        u = S@u
+        u[boun] = u_ap[boun, k]
+        u = S@u
+        u[boun] = u_ap[boun, k]
+        assert np.allclose(u_ap[:, k], u, rtol = 0, atol = 1e-12)
+
+def test_large_time_steps(cloud):
+    p, tt = cloud
+    e     = Examples['Example 1']
+    plain = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 20, implicit = True)
+    for interpolation in ['gfd', 'linear']:
+        split = AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 20, tt = tt, implicit = True, splitting = interpolation)
+        assert np.max(np.abs(split[0] - split[1])) < np.max(np.abs(plain[0] - plain[1]))/2
+
+def test_splitting_options(cloud):
+    p, _ = cloud
+    e    = Examples['Example 1']
+    with pytest.raises(ValueError):
+        AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 20, engine = 'ellpack', splitting = 'gfd')
+    with pytest.raises(ValueError):
+        AdvectionDiffusion.Cloud(p, e['f'], e['v'], e['a'], e['b'], 'auto', splitting = 'gfd')
+    with pytest.raises(ValueError):
+        Splitting.Cloud(p, e['f'], e['v'], e['a'], e['b'], 20, interpolation = 'cubic')
+    with pytest.raises(ValueError):
+        Splitting.Cloud(p, e['f'], lambda x, y, t: 0.1 + t, e['a'], e['b'], 20)
@@ -0,0 +1,59 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import numpy as np
+import pytest
+import Scripts.Neighbors as Neighbors
+import Scripts.Stability as Stability
+from Scripts.Examples import Examples
+
+Data = os.path.join(os.path.dirname(__file__), '..', 'Data', 'Clouds')
+
+## Time steps chosen by Stability.Analyze against all the eigenvalues of the operator.
+
+@pytest.fixture(scope = 'module')
+def cloud():
+    p   = np.genfromtxt(os.path.join(Data, 'BAN_p.csv'), delimiter = ',')           # Cloud of 776 nodes.
+    vec = Neighbors.Cloud(p, 8)
+    return p, vec
+
+@pytest.mark.parametrize('dense', [2000, 0])
+def test_time_step_is_stable(cloud, dense):
+    p, vec = cloud
+    e      = Examples['Example 1']
+    G      = Stability.Operator(p, vec, np.vstack([[-e['a']], [-e['b']], [2*e['v']], [0], [2*e['v']]]))
+    eig    = np.linalg.eigvals(G.toarray())
+    report = Stability.Analyze(p, vec, e['v'], e['a'], e['b'], dense = dense, verbose = False)
+    assert report['unstable'] == 0
+    assert 0 < report['dt'] <= 0.9*Stability.Time_Step(eig)*(1 + 1e-8)
+    if dense > 0:                                                                   # All the eigenvalues.
+        assert np.isclose(report['dt'], 0.9*Stability.Time_Step(eig), rtol = 1e-10)
+
+@pytest.mark.parametrize('dense', [2000, 0])
+def test_unstable_operator_gives_no_time_step(cloud, dense):
+    p, vec = cloud
+    e      = Examples['Example 7']
+    G      = Stability.Operator(p, vec, np.vstack([[-e['a']], [-e['b']], [2*e['v']], [0], [2*e['v']]]))
+    assert np.max(np.linalg.eigvals(G.toarray()).real) > 0
+    report = Stability.Analyze(p, vec, e['v'], e['a'], e['b'], dense = dense, verbose = False)
+    assert report['unstable'] > 0
+    assert report['dt'] == 0 and report['t'] is None
+    with pytest.raises(ValueError):
+        Stability.Steps(p, vec, e['v'], e['a'], e['b'], dense = dense, verbose = False)